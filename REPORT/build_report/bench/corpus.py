@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Synthetic result-summary.txt corpus for benchmarks.
+
+Writes a tree of GROUP<g>/<PROTO>/run-<n>/result-summary.txt files in the
+uperf, iperf and trafficgen formats the extractors handle (tags, common and
+unique params, samples with period ranges, one or more result lines per
+iteration). Everything is drawn from a seeded generator, so the same
+arguments produce byte-identical trees on every machine and every commit.
+
+ Usage:
+    $ python3 -m build_report.bench.corpus /tmp/corpus --runs 500
+    $ python3 -m build_report.bench.corpus /tmp/corpus --runs 100 --iterations 20 --samples 5 --results 3
+"""
+import argparse
+import os
+import random
+import uuid
+from typing import Dict, Sequence, Tuple
+
+PATTERN = "result-summary.txt"
+
+BENCHMARKS = ('uperf', 'iperf', 'trafficgen')
+
+# Result types per benchmark, in the order they are emitted (--results picks the first N)
+RESULT_TYPES = {
+    'uperf': ('Gbps', 'transactions-sec', 'round-trip-usec'),
+    'iperf': ('rx-Gbps', 'tx-Gbps', 'rx-lost-pct'),
+    'trafficgen': ('rx-mpps', 'tx-mpps', 'rx-lost-pct'),
+}
+
+_TAG_VALUES = {
+    'cpu': ('26', '58(Gu)', '64'),
+    'kernel': ('5.14.0-570.49.1.el9_6.x86_64', '5.14.0-427.13.1.el9_4.x86_64'),
+    'model': ('OVNK', 'DPU', 'SRIOV'),
+    'nic': ('E810', 'BF-3', 'CX7'),
+    'arch': ('INTEL(R)-XEON(R)-GOLD-6548Y+', 'AMD-EPYC-9654'),
+    'perf': ('baseline', 'tuned'),
+    'offload': ('on', 'off'),
+    'rcos': ('9.6.20250925-0', '9.4.20240510-0'),
+    'topo': ('internode', 'intranode'),
+    'pods-per-worker': ('1', '4', '16'),
+    'scale_out_factor': ('1', '2'),
+}
+
+
+def render_run(rng: random.Random, benchmark: str, iterations: int, samples: int, results: int) -> str:
+    """One result-summary.txt for benchmark."""
+    def new_id():
+        return str(uuid.UUID(int=rng.getrandbits(128))).upper()
+
+    tags = ' '.join(f"{key}={rng.choice(values)}" for key, values in _TAG_VALUES.items())
+    if benchmark == 'iperf':
+        common = "ifname=eth0 ipv=4 protocol=tcp time=120"
+    elif benchmark == 'trafficgen':
+        common = "frame-size=64 rate=100 traffic-direction=bidirectional"
+    else:
+        common = "duration=120 ifname=eth0 protocol=tcp"
+
+    lines = [
+        f"run-id: {str(uuid.UUID(int=rng.getrandbits(128)))}",
+        f"  tags: {tags}",
+        "  metrics:",
+        f"    source: {benchmark}",
+        f"    type: {RESULT_TYPES[benchmark][0]}",
+        f"  benchmark: {benchmark}",
+        "  iterations:",
+        f"    common params: {common}",
+    ]
+    begin = 1760769408346 + rng.randrange(10 ** 9)
+    for n in range(iterations):
+        lines.append(f"    iteration-id: {new_id()}")
+        lines.append(f"      unique params: {_unique_params(benchmark, n)}")
+        lines.append("      primary-period name: measurement")
+        lines.append("      samples:")
+        for _ in range(samples):
+            length = 120 + rng.random()
+            lines.append(f"        sample-id: {new_id()}")
+            lines.append(f"          primary period-id: {new_id()}")
+            lines.append(f"          period range: begin: {begin} end: {begin + int(length * 1000)}")
+            lines.append(f"          period length: {length:.3f} seconds")
+            begin += int(length * 1000) + 5000
+        for result_type in RESULT_TYPES[benchmark][:results]:
+            lines.append(_result_line(rng, benchmark, result_type, samples))
+    return '\n'.join(lines) + '\n'
+
+
+def _unique_params(benchmark: str, n: int) -> str:
+    if benchmark == 'iperf':
+        return f"length={64 << (n % 8)} bitrate-range={n % 4}"
+    if benchmark == 'trafficgen':
+        return f"frame-size={64 << (n % 6)} max-loss-pct={n % 3}"
+    return f"nthreads={1 << (n % 6)} test-type={('stream', 'rr', 'crr')[n % 3]} wsize={64 << (n % 8)}"
+
+
+def _result_line(rng: random.Random, benchmark: str, result_type: str, samples: int) -> str:
+    values = [rng.uniform(1, 100) for _ in range(samples)]
+    mean = sum(values) / len(values)
+    stats = f"mean: {mean:.6f} min: {min(values):.6f} max: {max(values):.6f}"
+    if benchmark == 'trafficgen':
+        return f"      result: ({benchmark}::{result_type}) samples: {samples} {stats}"
+
+    if len(values) > 1:
+        stddev = (sum((v - mean) ** 2 for v in values) / (len(values) - 1)) ** 0.5
+        spread = f"stddev: {stddev:.6f} stddevpct: {stddev / mean * 100:.6f}"
+    else:
+        spread = "stddev: NaN stddevpct: NaN"
+    sample_values = ' '.join(f"{v:.6f}" for v in values)
+    return (f"      result: ({benchmark}::{result_type}) samples: {sample_values} {stats} {spread} "
+            f"CPU: {rng.uniform(1, 40):.4f}")
+
+
+def build_corpus(root: str, runs: int, iterations: int = 4, samples: int = 3, results: int = 1,
+                 benchmarks: Sequence[str] = BENCHMARKS, groups: int = 10, seed: int = 0) -> Dict[str, int]:
+    """Write `runs` result files under root; returns {'files': n, 'bytes': total size}."""
+    rng = random.Random(seed)
+    total_bytes = 0
+    for n in range(runs):
+        benchmark = benchmarks[n % len(benchmarks)]
+        run_dir = os.path.join(root, f"GROUP{n % groups}", "TCP" if n % 2 else "UDP", f"run-{n}")
+        os.makedirs(run_dir, exist_ok=True)
+        content = render_run(rng, benchmark, iterations, samples, results).encode('utf-8')
+        with open(os.path.join(run_dir, PATTERN), 'wb') as f:
+            f.write(content)
+        total_bytes += len(content)
+    return {'files': runs, 'bytes': total_bytes}
+
+
+def corpus_size(root: str) -> Tuple[int, int]:
+    """(files, bytes) of the result files under root."""
+    files = 0
+    total_bytes = 0
+    for dirpath, _, filenames in os.walk(root):
+        if PATTERN in filenames:
+            files += 1
+            total_bytes += os.path.getsize(os.path.join(dirpath, PATTERN))
+    return files, total_bytes
+
+
+def add_corpus_arguments(parser: argparse.ArgumentParser) -> None:
+    """Corpus shape options, shared with the benchmark harness."""
+    parser.add_argument('--runs', type=int, default=300, help='Result files to generate')
+    parser.add_argument('--iterations', type=int, default=4, help='Iterations per run')
+    parser.add_argument('--samples', type=int, default=3, help='Samples per iteration')
+    parser.add_argument('--results', type=int, default=1, choices=(1, 2, 3),
+                        help='Result lines per iteration')
+    parser.add_argument('--benchmarks', nargs='+', default=list(BENCHMARKS), choices=BENCHMARKS,
+                        help='Benchmarks to cycle through')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (same seed, same corpus)')
+
+
+def corpus_options(args) -> Dict[str, object]:
+    return {'runs': args.runs, 'iterations': args.iterations, 'samples': args.samples,
+            'results': args.results, 'benchmarks': list(args.benchmarks), 'seed': args.seed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic result-summary.txt tree")
+    parser.add_argument('root', help='Directory to create the tree in')
+    add_corpus_arguments(parser)
+    args = parser.parse_args()
+
+    size = build_corpus(args.root, **corpus_options(args))
+    print(f"Wrote {size['files']} files ({size['bytes'] / (1024 * 1024):.1f} MB) to {args.root}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for file discovery.
+
+Builds a synthetic result tree (GROUP/PROTO/run-N/result-summary.txt, each run
+with a few nested directories below the match that discovery must not enter,
+plus sibling directories without results) and times the previous os.walk
+based discovery against StandardFileDiscovery with 1 and N workers and,
+optionally, with a discovery manifest.
+
+ Usage:
+    $ python3 -m build_report.bench.discovery_bench --runs 2000
+    $ python3 -m build_report.bench.discovery_bench --runs 50000 --skip-legacy
+    $ python3 -m build_report.bench.discovery_bench --root /nfs/results --skip-legacy --manifest
+    $ python3 -m build_report.bench.discovery_bench --root /path/to/existing/tree
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from ..discovery.file_discovery import StandardFileDiscovery
+from ..discovery.manifest import RACY_WINDOW_NS
+from ..models.data_models import FileInfo
+
+PATTERN = "result-summary.txt"
+
+
+def build_tree(root: str, runs: int, groups: int = 20) -> None:
+    """Create a synthetic result tree with `runs` matching files."""
+    for n in range(runs):
+        run_dir = os.path.join(root, f"GROUP{n % groups}", "TCP" if n % 2 else "UDP", f"run-{n}")
+        os.makedirs(os.path.join(run_dir, "run", "iterations", "iteration-1"), exist_ok=True)
+        os.makedirs(os.path.join(root, f"GROUP{n % groups}", "logs", f"log-{n}"), exist_ok=True)
+        with open(os.path.join(run_dir, PATTERN), "w") as f:
+            f.write("benchmark: uperf\n")
+        with open(os.path.join(run_dir, "run", "iterations", "iteration-1", PATTERN), "w") as f:
+            f.write("benchmark: nested\n")
+
+
+def legacy_discover(root_path: str, pattern: str, max_depth: int = 8):
+    """The os.walk implementation StandardFileDiscovery used before, for comparison."""
+    files = []
+    root = Path(root_path)
+    visited_dirs = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        current_dir = Path(dirpath)
+        if len(current_dir.relative_to(root).parts) > max_depth:
+            dirnames[:] = []
+            continue
+        if any(current_dir == visited or visited in current_dir.parents for visited in visited_dirs):
+            dirnames[:] = []
+            continue
+        for filename in filenames:
+            if Path(filename).match(pattern):
+                file_path = current_dir / filename
+                if file_path.is_file():
+                    files.append(FileInfo(path=file_path, size=file_path.stat().st_size,
+                                          modified_time=file_path.stat().st_mtime))
+                    visited_dirs.add(current_dir)
+                    dirnames[:] = []
+                    break
+    return files
+
+
+def time_it(label: str, func, repeat: int):
+    best = None
+    found = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<32} {best * 1000:10.1f} ms  ({len(found)} files)")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark result-summary.txt discovery")
+    parser.add_argument('--root', type=str, default=None, help='Existing tree to scan (default: build a synthetic one)')
+    parser.add_argument('--runs', type=int, default=2000,
+                        help='Run directories in the synthetic tree (the legacy walk is quadratic; keep small)')
+    parser.add_argument('--workers', type=int, default=8, help='Threads for parallel discovery')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed repetitions (best is reported)')
+    parser.add_argument('--skip-legacy', action='store_true', help='Do not time the old os.walk implementation')
+    parser.add_argument('--manifest', action='store_true',
+                        help='Also time a cold and a warm scan with a discovery manifest')
+    args = parser.parse_args()
+
+    temp_root = None
+    root = args.root
+    if root is None:
+        temp_root = tempfile.mkdtemp(prefix="discovery-bench-")
+        root = temp_root
+        print(f"Building synthetic tree with {args.runs} runs in {root}...")
+        build_tree(root, args.runs)
+
+    try:
+        reference = None
+        if not args.skip_legacy:
+            reference = time_it("legacy os.walk", lambda: legacy_discover(root, PATTERN), args.repeat)
+        sequential = time_it("scandir (1 worker)",
+                             lambda: StandardFileDiscovery().discover_files(root, PATTERN), args.repeat)
+        parallel = time_it(f"scandir ({args.workers} workers)",
+                           lambda: StandardFileDiscovery(workers=args.workers).discover_files(root, PATTERN),
+                           args.repeat)
+
+        if args.manifest:
+            manifest_dir = tempfile.mkdtemp(prefix="discovery-manifest-")
+            manifest_path = os.path.join(manifest_dir, "manifest.json")
+            try:
+                # Let the tree age past the manifest's racy window first
+                time.sleep(RACY_WINDOW_NS / 1e9)
+                time_it("scandir + manifest (cold)",
+                        lambda: StandardFileDiscovery(manifest_path=manifest_path).discover_files(root, PATTERN), 1)
+                time.sleep(RACY_WINDOW_NS / 1e9)
+                warm = time_it("scandir + manifest (warm)",
+                               lambda: StandardFileDiscovery(manifest_path=manifest_path).discover_files(root, PATTERN),
+                               args.repeat)
+                if warm != sequential:
+                    print("WARNING: manifest discovery differs from sequential discovery")
+            finally:
+                shutil.rmtree(manifest_dir, ignore_errors=True)
+
+        if reference is not None and reference != sequential:
+            print("WARNING: scandir discovery differs from the legacy implementation")
+        if sequential != parallel:
+            print("WARNING: parallel discovery differs from sequential discovery")
+    finally:
+        if temp_root:
+            shutil.rmtree(temp_root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Parity check of StreamingDataExtractor against RegexDataExtractor.
+
+Renders every result of the dashboard test_data reports back into
+result-summary.txt form (as memory_bench does), adds seeded synthetic runs
+of the benchmark corpus, and extracts and transforms each text with both
+extractors. The extracted data and the transformed results must be
+identical; the first difference is printed and the exit status is 1.
+Also reports how many files the streaming extractor handled itself and how
+many it passed to the regex extractor.
+
+ Usage:
+    $ python3 -m build_report.bench.extractor_parity
+    $ python3 -m build_report.bench.extractor_parity --runs 500 --reports-dir /tmp/regulus-data
+"""
+import argparse
+import dataclasses
+import json
+import math
+import random
+import sys
+from pathlib import Path
+
+from ..extraction.data_extractor import RegexDataExtractor, StreamingDataExtractor
+from ..models.data_models import FileInfo
+from ..rules.rule_engine import ConfigurableRuleEngine
+from ..transformation.data_transformer import BenchmarkSpecificTransformer
+from .corpus import BENCHMARKS, render_run
+from .memory_bench import render_result_summary
+
+TEST_DATA = Path(__file__).resolve().parents[2] / 'dashboard' / 'test_data'
+
+
+def fixture_contents(reports_dir: str):
+    """(label, benchmark, text) for every result of the JSON reports in reports_dir."""
+    for path in sorted(Path(reports_dir).glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        for n, result in enumerate(report.get('results', [])):
+            yield f"{path.name}#{n}", result['benchmark'], render_result_summary(result)
+
+
+def corpus_contents(runs: int, seed: int):
+    """(label, benchmark, text) for runs synthetic result files of varying shape."""
+    rng = random.Random(seed)
+    for n in range(runs):
+        benchmark = BENCHMARKS[n % len(BENCHMARKS)]
+        text = render_run(rng, benchmark, iterations=rng.randint(1, 6), samples=rng.randint(1, 4),
+                          results=rng.randint(1, 3))
+        yield f"corpus#{n}", benchmark, text
+
+
+def compare(label: str, benchmark: str, text: str, rule_engine, regex, streaming, transformer) -> bool:
+    """Extract and transform text with both extractors; print the first difference."""
+    file_info = FileInfo(path=Path(f"/parity/{label}/result-summary.txt"), size=len(text), modified_time=0.0)
+    rules = rule_engine.get_rules_for_benchmark(benchmark)
+    expected = regex.extract_data(text, rules, file_info)
+    actual = streaming.extract_data(text, rules, file_info)
+
+    expected_data, actual_data = dataclasses.asdict(expected), dataclasses.asdict(actual)
+    if not _equal(expected_data, actual_data):
+        for key in expected_data:
+            if not _equal(expected_data[key], actual_data.get(key)):
+                print(f"{label}: extracted '{key}' differs")
+                print(f"  regex:     {expected_data[key]!r:.300}")
+                print(f"  streaming: {actual_data.get(key)!r:.300}")
+                break
+        return False
+
+    if not _equal(_transformed(transformer, expected), _transformed(transformer, actual)):
+        print(f"{label}: transformed results differ")
+        return False
+    return True
+
+
+def _transformed(transformer, extracted) -> dict:
+    """Transformed result as a dict, without the wall-clock transformation time."""
+    result = dataclasses.asdict(transformer.transform_data(extracted))
+    result['processing_metadata'].pop('transformation_time', None)
+    return result
+
+
+def _equal(a, b) -> bool:
+    """a == b, except that NaN equals NaN (single-sample results have a NaN stddev)."""
+    if isinstance(a, float) and isinstance(b, float):
+        return a == b or (math.isnan(a) and math.isnan(b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[key], b[key]) for key in a)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return type(a) is type(b) and len(a) == len(b) and all(map(_equal, a, b))
+    return type(a) is type(b) and a == b
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check StreamingDataExtractor against RegexDataExtractor")
+    parser.add_argument('--reports-dir', default=str(TEST_DATA), help='Directory of JSON reports to render')
+    parser.add_argument('--runs', type=int, default=300, help='Synthetic corpus runs to add')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic runs')
+    args = parser.parse_args()
+
+    rule_engine = ConfigurableRuleEngine()
+    regex = RegexDataExtractor()
+    streaming = StreamingDataExtractor()
+    transformer = BenchmarkSpecificTransformer()
+
+    checked = failed = 0
+    for contents in (fixture_contents(args.reports_dir), corpus_contents(args.runs, args.seed)):
+        for label, benchmark, text in contents:
+            checked += 1
+            if not compare(label, benchmark, text, rule_engine, regex, streaming, transformer):
+                failed += 1
+
+    if not checked:
+        sys.exit(f"No results found in {args.reports_dir}")
+    print(f"Checked {checked} files: {streaming.stats['streamed']} streamed, "
+          f"{streaming.stats['fallbacks']} through the regex extractor, {failed} differing")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
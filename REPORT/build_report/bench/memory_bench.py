@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the in-memory result set.
+
+Renders every result of an existing JSON report back into result-summary.txt
+form, replays the files N times through extraction and transformation and
+keeps the ProcessedResults alive the way ReportOrchestrator does until output
+generation. Reports the memory they hold, counting every object reachable from
+them once (shared strings and dicts are not double counted), and optionally
+the top allocation sites (tracemalloc; makes the replay much slower).
+
+ Usage:
+    $ python3 -m build_report.bench.memory_bench
+    $ python3 -m build_report.bench.memory_bench --report ../dashboard/test_data/report.json --scale 100 --top 10
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from ..extraction.data_extractor import StreamingDataExtractor
+from ..models.data_models import FileInfo
+from ..rules.rule_engine import ConfigurableRuleEngine
+from ..transformation.data_transformer import BenchmarkSpecificTransformer
+
+DEFAULT_REPORT = Path(__file__).resolve().parents[2] / 'dashboard' / 'test_data' / 'report.json'
+
+
+def render_result_summary(result: dict) -> str:
+    """result-summary.txt text that extracts back into the given report result."""
+    def params(mapping):
+        return ' '.join(f"{key}={value}" for key, value in mapping.items())
+
+    lines = [
+        f"run-id: {result.get('run_id', '')}",
+        f"  tags: {params(result.get('key_tags', {}))}",
+        f"  benchmark: {result['benchmark']}",
+        "  iterations:",
+        f"    common params: {params(result.get('common_params', {}))}",
+    ]
+    for iteration in result.get('iterations', []):
+        lines.append(f"    iteration-id: {iteration['iteration_id']}")
+        lines.append(f"      unique params: {params(iteration.get('unique_params', {}))}")
+        lines.append("      samples:")
+        for sample in iteration.get('samples', []):
+            lines.append(f"        sample-id: {sample['sample_id']}")
+            lines.append(f"          period range: begin: {sample['begin']} end: {sample['end']}")
+            lines.append(f"          period length: {sample['duration']} seconds")
+        for res in iteration.get('results', []):
+            if 'sample_values' not in res:
+                continue
+            values = ' '.join(f"{value:f}" for value in res['sample_values'])
+            line = (f"      result: ({result['benchmark']}::{res['type']}) samples: {values} "
+                    f"mean: {res['mean']} min: {res['min']} max: {res['max']} "
+                    f"stddev: {res['stddev']} stddevpct: {res['stddevpct']}")
+            if 'busyCPU' in res:
+                line += f" CPU: {res['busyCPU']}"
+            lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+def replay(contents, scale):
+    """Extract and transform every content `scale` times, keeping all results."""
+    rule_engine = ConfigurableRuleEngine()
+    extractor = StreamingDataExtractor()
+    transformer = BenchmarkSpecificTransformer()
+
+    results = []
+    for copy in range(scale):
+        for n, (benchmark, content) in enumerate(contents):
+            file_info = FileInfo(path=Path(f"/replay/{copy}/{n}/result-summary.txt"),
+                                 size=len(content), modified_time=0.0)
+            rules = rule_engine.get_rules_for_benchmark(benchmark)
+            extracted = extractor.extract_data(content, rules, file_info)
+            results.append(transformer.transform_data(extracted))
+    return results
+
+
+def deep_sizeof(root) -> int:
+    """Bytes of all objects reachable from root, each counted once."""
+    seen = set()
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif not isinstance(obj, type):
+            if hasattr(obj, '__dict__'):
+                stack.append(vars(obj))
+            for cls in type(obj).__mro__:
+                for name in getattr(cls, '__slots__', ()):
+                    if hasattr(obj, name):
+                        stack.append(getattr(obj, name))
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory held by processed results")
+    parser.add_argument('--report', type=str, default=str(DEFAULT_REPORT), help='JSON report to replay')
+    parser.add_argument('--scale', type=int, default=100, help='How many times every result is replayed')
+    parser.add_argument('--top', type=int, default=0, help='Show the N largest allocation sites')
+    args = parser.parse_args()
+
+    with open(args.report, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    contents = [(result['benchmark'], render_result_summary(result)) for result in report['results']]
+    iterations = sum(len(result.get('iterations', [])) for result in report['results'])
+    print(f"Replaying {len(contents)} results ({iterations} iterations) x {args.scale}")
+
+    if args.top:
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+
+    results = replay(contents, args.scale)
+
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    held = deep_sizeof(results)
+    print(f"Results held: {len(results)}")
+    print(f"Memory held:  {held / (1024 * 1024):8.1f} MB ({held / len(results) / 1024:.1f} KB/result)")
+    print(f"Time:         {elapsed:8.2f} s")
+
+    if args.top:
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        for stat in snapshot.compare_to(baseline, 'lineno')[:args.top]:
+            print(f"  {stat}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for report generation.
+
+Generates a synthetic corpus (bench/corpus.py; same options, same bytes) or
+uses an existing tree, then times every orchestrator variant (sequential,
+parallel process/thread pools, pipelined, result cache cold and warm, all
+writing the JSON report) and every output generator on the processed
+results. Each variant runs in a fresh child process, so its peak RSS (the
+child and its worker processes) is not inflated by the variants before it.
+Reports the best of --repeat runs as seconds, files/s, MB/s of result files
+and peak RSS.
+
+--save writes the numbers with the commit and corpus shape to JSON; --compare
+prints the change against such a file, so a pipeline change can be checked
+against the previous commit on the same machine.
+
+ Usage:
+    $ python3 -m build_report.bench.report_bench
+    $ python3 -m build_report.bench.report_bench --runs 2000 --iterations 8 --workers 8 --save before.json
+    $ python3 -m build_report.bench.report_bench --runs 2000 --iterations 8 --workers 8 --compare before.json
+    $ python3 -m build_report.bench.report_bench --root /path/to/results --variants sequential pipeline
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .corpus import add_corpus_arguments, build_corpus, corpus_options, corpus_size
+
+PACKAGE_PARENT = Path(__file__).resolve().parents[2]
+
+ORCHESTRATOR_VARIANTS = ('sequential', 'parallel-process', 'parallel-thread', 'pipeline',
+                         'cached-cold', 'cached-warm')
+OUTPUT_VARIANTS = ('output-json', 'output-html', 'output-html-paged', 'output-csv', 'output-xml',
+                   'output-parquet')
+
+
+class _CollectingOutput:
+    """Output generator that only keeps the results, for timing the generators on their own."""
+
+    def __init__(self):
+        self.results = []
+
+    def generate_output(self, results, output_path, **kwargs):
+        self.results = results
+
+
+def run_variant(variant: str, root: str, workers: int, repeat: int) -> dict:
+    """Child process: run one variant `repeat` times, return the best time and peak RSS."""
+    from ..factories import create_multi_format_orchestrator
+
+    work_dir = tempfile.mkdtemp(prefix="report-bench-")
+    try:
+        output_path = os.path.join(work_dir, 'report')
+        if variant in ORCHESTRATOR_VARIANTS:
+            options = {
+                'sequential': {},
+                'parallel-process': {'workers': workers, 'executor': 'process'},
+                'parallel-thread': {'workers': workers, 'executor': 'thread'},
+                'pipeline': {'workers': workers, 'executor': 'process', 'pipeline': True},
+                'cached-cold': {},
+                'cached-warm': {},
+            }[variant]
+
+            def make_orchestrator(cache_dir=None):
+                orchestrator = create_multi_format_orchestrator(['json'], cache_dir=cache_dir, **options)
+                orchestrator.configure(enable_progress=False)
+                return orchestrator
+
+            cache_dir = os.path.join(work_dir, 'cache')
+            if variant == 'cached-warm':
+                with _quiet():
+                    make_orchestrator(cache_dir).generate_report(root, output_path=output_path)
+
+            def run():
+                if variant == 'cached-cold':
+                    shutil.rmtree(cache_dir, ignore_errors=True)
+                orchestrator = make_orchestrator(cache_dir if variant.startswith('cached') else None)
+                orchestrator.generate_report(root, output_path=output_path)
+        else:
+            generator = _output_generator(variant)
+            if generator is None:
+                return {'skipped': 'not available'}
+            collector = _CollectingOutput()
+            orchestrator = create_multi_format_orchestrator(['json'])
+            orchestrator.output_generator = collector
+            orchestrator.configure(enable_progress=False)
+            with _quiet():
+                orchestrator.generate_report(root, output_path=output_path)
+            extension = variant.split('-')[1]
+
+            def run():
+                generator.generate_output(collector.results, f"{output_path}.{extension}")
+
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            with _quiet():
+                run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return {'seconds': best, 'peak_rss_mb': _peak_rss_mb()}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _output_generator(variant: str):
+    from ..models.data_models import SchemaVersion
+    from ..output.generators import EnhancedMultiFormatOutputGenerator
+    from ..output.parquet import PYARROW_AVAILABLE
+    from ..schema.schema_manager import SchemaManager
+
+    if variant == 'output-parquet' and not PYARROW_AVAILABLE:
+        return None
+    html_mode = 'paged' if variant == 'output-html-paged' else 'inline'
+    multi = EnhancedMultiFormatOutputGenerator(SchemaManager(SchemaVersion.V2_0), html_mode=html_mode)
+    format_name = variant.split('-')[1]
+    multi.enable_format(format_name)
+    return multi.generators[format_name]
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Swallow the progress output of the code being timed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _peak_rss_mb() -> float:
+    """Peak RSS of this process or any of its (worker) children, in MB."""
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024  # ru_maxrss is bytes on macOS, KB elsewhere
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return peak * scale / (1024 * 1024)
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PACKAGE_PARENT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark report generation end to end")
+    parser.add_argument('--root', type=str, default=None, help='Existing tree to use (default: synthetic corpus)')
+    add_corpus_arguments(parser)
+    parser.add_argument('--variants', nargs='+', default=list(ORCHESTRATOR_VARIANTS + OUTPUT_VARIANTS),
+                        choices=ORCHESTRATOR_VARIANTS + OUTPUT_VARIANTS, help='Variants to run')
+    parser.add_argument('--workers', type=int, default=4, help='Workers for the parallel and pipelined variants')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed repetitions per variant (best is reported)')
+    parser.add_argument('--save', type=str, default=None, help='Write the results to this JSON file')
+    parser.add_argument('--compare', type=str, default=None, help='Compare against results saved with --save')
+    parser.add_argument('--child', type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_variant(args.child, args.root, args.workers, args.repeat)))
+        return
+
+    temp_root = None
+    root = args.root
+    if root is None:
+        temp_root = tempfile.mkdtemp(prefix="report-bench-corpus-")
+        root = temp_root
+        build_corpus(root, **corpus_options(args))
+    files, total_bytes = corpus_size(root)
+    megabytes = total_bytes / (1024 * 1024)
+    print(f"Corpus: {files} files, {megabytes:.1f} MB in {root}")
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        baseline = saved.get('variants', {})
+        print(f"Comparing against {args.compare} (commit {saved.get('commit')})")
+        if (saved.get('files'), saved.get('bytes'), saved.get('workers')) != (files, total_bytes, args.workers):
+            print("WARNING: corpus or worker count differs from the saved run; numbers are not comparable")
+
+    results = {}
+    try:
+        print(f"{'variant':<20} {'seconds':>9} {'files/s':>9} {'MB/s':>8} {'peak RSS':>10}")
+        for variant in args.variants:
+            command = [sys.executable, '-m', 'build_report.bench.report_bench', '--child', variant,
+                       '--root', root, '--workers', str(args.workers), '--repeat', str(args.repeat)]
+            child = subprocess.run(command, cwd=PACKAGE_PARENT, capture_output=True, text=True)
+            if child.returncode != 0:
+                print(f"{variant:<20} failed: {child.stderr.strip().splitlines()[-1:]}")
+                continue
+            result = json.loads(child.stdout.strip().splitlines()[-1])
+            if 'skipped' in result:
+                print(f"{variant:<20} skipped ({result['skipped']})")
+                continue
+
+            seconds = result['seconds']
+            result['files_per_second'] = files / seconds if seconds else None
+            result['mb_per_second'] = megabytes / seconds if seconds else None
+            results[variant] = result
+
+            line = (f"{variant:<20} {seconds:9.3f} {result['files_per_second']:9.1f} "
+                    f"{result['mb_per_second']:8.2f} {result['peak_rss_mb']:8.1f} MB")
+            previous = baseline.get(variant)
+            if previous and previous.get('seconds'):
+                line += (f"   {(seconds / previous['seconds'] - 1) * 100:+6.1f}% time, "
+                         f"{result['peak_rss_mb'] - previous['peak_rss_mb']:+.1f} MB RSS")
+            print(line)
+    finally:
+        if temp_root:
+            shutil.rmtree(temp_root, ignore_errors=True)
+
+    if args.save:
+        report = {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'corpus': corpus_options(args) if args.root is None else {'root': args.root},
+            'files': files,
+            'bytes': total_bytes,
+            'workers': args.workers,
+            'repeat': args.repeat,
+            'variants': results
+        }
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved to {args.save}")
+
+
+if __name__ == '__main__':
+    main()
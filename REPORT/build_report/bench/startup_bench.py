@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for reg-report.
+
+Imports the reg-report CLI and creates the orchestrator for the given
+formats in a fresh interpreter under `python -X importtime`, the way every
+per-run-directory invocation starts. Reports the best wall-clock time of
+--repeat runs and the import time, lists the slowest imports, and checks
+that no generator module or heavy dependency was imported for a format
+that was not requested (e.g. the HTML generator or pyarrow for
+--formats csv). It exits with status 1 when an unexpected module was
+loaded or, with --budget-ms, when the import time is over budget, so it
+can run as a CI check.
+
+ Usage:
+    $ python3 -m build_report.bench.startup_bench
+    $ python3 -m build_report.bench.startup_bench --formats csv --budget-ms 150
+    $ python3 -m build_report.bench.startup_bench --formats json html csv --top 20
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PACKAGE_PARENT = Path(__file__).resolve().parents[2]
+
+# What a report run does before it touches any file; prints the loaded modules last
+CHILD = (
+    "import importlib, sys\n"
+    "importlib.import_module('build_report.reg-report')\n"
+    "from build_report.factories import create_multi_format_orchestrator\n"
+    "create_multi_format_orchestrator(sys.argv[1:])\n"
+    "print(' '.join(sorted(sys.modules)))\n"
+)
+
+# Modules that may only be loaded at startup when one of these formats is requested
+FORMAT_MODULES = {
+    'build_report.output.csv_report': ('csv',),
+    'build_report.output.xml_report': ('xml',),
+    'build_report.output.html_report': ('html',),
+    'build_report.output.html_paged': (),
+    'build_report.output.parquet': ('parquet',),
+    'pyarrow': ('parquet',),
+    'numpy': ('parquet',),
+    'jsonschema': (),
+    'cProfile': (),
+}
+
+
+def measure(formats: List[str]) -> Tuple[float, Dict[str, Tuple[int, int]], List[str]]:
+    """One cold start: (wall seconds, {module: (self us, cumulative us)} of top-level imports, loaded modules)."""
+    started = time.perf_counter()
+    child = subprocess.run([sys.executable, '-X', 'importtime', '-c', CHILD] + formats,
+                           cwd=PACKAGE_PARENT, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - started
+
+    imports = {}
+    for line in child.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports[name[1:].rstrip()] = (int(self_us), int(cumulative_us))  # indented by nesting depth
+    modules = child.stdout.strip().splitlines()[-1].split()
+    return wall, imports, modules
+
+
+def unexpected_modules(formats: List[str], modules: List[str]) -> List[str]:
+    """Loaded modules that the requested formats do not need."""
+    loaded = set(modules)
+    return [module for module, allowed in FORMAT_MODULES.items()
+            if module in loaded and not set(allowed) & set(formats)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure reg-report startup (imports and orchestrator creation)")
+    parser.add_argument('--formats', nargs='+', default=['json', 'csv'], help='Formats to create the orchestrator for')
+    parser.add_argument('--repeat', type=int, default=5, help='Cold starts to run (best is reported)')
+    parser.add_argument('--top', type=int, default=10, help='Slowest imports to list')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='Fail when the import time exceeds this many milliseconds')
+    args = parser.parse_args()
+
+    best = None
+    for _ in range(args.repeat):
+        wall, imports, modules = measure(args.formats)
+        # Top-level imports (no indentation) add up to the total import time
+        import_us = sum(cumulative for name, (_, cumulative) in imports.items() if not name.startswith(' '))
+        if best is None or import_us < best[1]:
+            best = (wall, import_us, imports, modules)
+    wall, import_us, imports, modules = best
+
+    print(f"Formats: {' '.join(args.formats)}")
+    print(f"Startup: {wall * 1000:.1f} ms wall, {import_us / 1000:.1f} ms importing {len(modules)} modules")
+    print("Slowest imports (cumulative):")
+    for name, (self_us, cumulative_us) in sorted(imports.items(), key=lambda item: item[1][1], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:6.1f} ms self  {name.strip()}")
+
+    failed = False
+    unexpected = unexpected_modules(args.formats, modules)
+    if unexpected:
+        print(f"Unexpected imports: {', '.join(unexpected)}")
+        failed = True
+    if args.budget_ms is not None and import_us / 1000 > args.budget_ms:
+        print(f"Over budget: {import_us / 1000:.1f} ms > {args.budget_ms:.1f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""
+Persistent per-file result cache.
+
+Stores the ProcessedResult of every result-summary.txt in a SQLite database so
+that repeated report builds only parse, extract and transform new or changed
+files. Entries are keyed by path and validated against the file's size and
+mtime plus a fingerprint of the extraction pipeline (extractor/transformer code
+and the rule sets), so editing either invalidates the cache automatically.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from ..models.data_models import FileInfo, ProcessedResult
+
+try:
+    import sqlite3
+    SQLITE_AVAILABLE = True
+except ImportError:
+    SQLITE_AVAILABLE = False
+    print("Warning: sqlite3 not available. Result caching disabled.")
+
+
+# Bump when the cached payload layout changes
+CACHE_FORMAT_VERSION = "1"
+
+
+class ResultCache:
+    """SQLite-backed cache of ProcessedResult objects, one row per file."""
+
+    def __init__(self, cache_dir: str, filename: str = "results.sqlite"):
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / filename
+        self.fingerprint: Optional[str] = None
+        self._conn = None
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'invalidated': 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def open(self, fingerprint: str) -> bool:
+        """Open the database for a given pipeline fingerprint.
+
+        Rows written under any other fingerprint are dropped. Returns False
+        (and leaves the cache disabled) if the database cannot be opened.
+        """
+        if not SQLITE_AVAILABLE:
+            return False
+
+        self.close()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " path TEXT PRIMARY KEY,"
+                " size INTEGER NOT NULL,"
+                " mtime REAL NOT NULL,"
+                " fingerprint TEXT NOT NULL,"
+                " payload BLOB NOT NULL)"
+            )
+            cursor = conn.execute("DELETE FROM results WHERE fingerprint != ?", (fingerprint,))
+            self.stats['invalidated'] += cursor.rowcount
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open result cache {self.db_path}: {e}")
+            return False
+
+        self._conn = conn
+        self.fingerprint = fingerprint
+        return True
+
+    def get(self, file_info: FileInfo) -> Optional[ProcessedResult]:
+        """Return the cached result for an unchanged file, or None."""
+        if not self.enabled:
+            return None
+
+        row = self._conn.execute(
+            "SELECT size, mtime, payload FROM results WHERE path = ? AND fingerprint = ?",
+            (str(file_info.path), self.fingerprint)
+        ).fetchone()
+
+        if row is None or row[0] != file_info.size or row[1] != file_info.modified_time:
+            self.stats['misses'] += 1
+            return None
+
+        try:
+            result = ProcessedResult(*pickle.loads(row[2]))
+        except Exception as e:
+            print(f"Warning: Discarding unreadable cache entry for {file_info.path}: {e}")
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        return result
+
+    def put(self, file_info: FileInfo, result: ProcessedResult) -> None:
+        """Store (or replace) the result for a file."""
+        if not self.enabled:
+            return
+
+        payload = pickle.dumps(
+            (result.regulus_data, result.benchmark, result.data, result.processing_metadata),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (path, size, mtime, fingerprint, payload) VALUES (?, ?, ?, ?, ?)",
+            (str(file_info.path), file_info.size, file_info.modified_time, self.fingerprint, payload)
+        )
+        self.stats['stores'] += 1
+
+    def iter_results(self) -> Iterator[ProcessedResult]:
+        """Every stored result, in path order.
+
+        Reads the database on its own read-only connection, without opening
+        the cache (which would drop rows of other pipeline fingerprints), so
+        the cache directory of another checkout or machine can be read as is.
+        Entries of files deleted since they were cached are included.
+        """
+        if not SQLITE_AVAILABLE or not self.db_path.exists():
+            return
+
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        try:
+            for path, payload in conn.execute("SELECT path, payload FROM results ORDER BY path"):
+                try:
+                    yield ProcessedResult(*pickle.loads(payload))
+                except Exception as e:
+                    print(f"Warning: Skipping unreadable cache entry for {path}: {e}")
+        finally:
+            conn.close()
+
+    def commit(self) -> None:
+        """Flush pending writes to disk."""
+        if self.enabled:
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        if self.enabled:
+            cursor = self._conn.execute("DELETE FROM results")
+            self.stats['invalidated'] += cursor.rowcount
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        if self._conn is not None:
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get hit/miss counters for the current session."""
+        lookups = self.stats['hits'] + self.stats['misses']
+        stats = self.stats.copy()
+        stats['hit_rate'] = self.stats['hits'] / lookups if lookups else 0.0
+        stats['db_path'] = str(self.db_path)
+        return stats
+
+
+def compute_pipeline_fingerprint(data_extractor, data_transformer, rule_engine) -> str:
+    """Fingerprint the code and rules that determine a file's ProcessedResult.
+
+    Covers the source files of every class in the extractor's and transformer's
+    MRO (following wrapped `base_extractor`s), of the modules a component lists
+    in `source_modules`, and the repr of all rule sets.
+    """
+    digest = hashlib.sha256(f"format:{CACHE_FORMAT_VERSION}\n".encode())
+
+    source_files = set()
+    components = [data_transformer]
+    extractor = data_extractor
+    while extractor is not None:
+        components.append(extractor)
+        extractor = getattr(extractor, 'base_extractor', None)
+
+    for component in components:
+        for cls in type(component).__mro__:
+            module = sys.modules.get(cls.__module__)
+            module_file = getattr(module, '__file__', None)
+            if module_file:
+                source_files.add(os.path.abspath(module_file))
+        for module in getattr(component, 'source_modules', ()):
+            module_file = getattr(module, '__file__', None)
+            if module_file:
+                source_files.add(os.path.abspath(module_file))
+
+    for module_file in sorted(source_files):
+        try:
+            with open(module_file, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(module_file.encode())
+
+    digest.update(_describe_rules(rule_engine).encode())
+    return digest.hexdigest()
+
+
+def _describe_rules(rule_engine) -> str:
+    """Deterministic text form of all rule sets known to a rule engine."""
+    rulesets = getattr(rule_engine, 'rulesets', None)
+    if isinstance(rulesets, dict):
+        return repr(sorted(rulesets.items()))
+
+    benchmarks = []
+    if hasattr(rule_engine, 'list_available_benchmarks'):
+        benchmarks = sorted(rule_engine.list_available_benchmarks())
+    return repr([(name, rule_engine.get_rules_for_benchmark(name)) for name in benchmarks or ['default']])
@@ -4,18 +4,34 @@ File discovery implementations.
 Handles traversing directories and finding target files.
 """
 
+import fnmatch
+import os
+import re
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Iterator, List, Optional, Tuple
 
 from ..interfaces.protocols import FileDiscoveryInterface
 from ..models.data_models import FileInfo
+from .manifest import DiscoveryManifest
 
 
 class StandardFileDiscovery:
-    """Standard file system discovery implementation."""
-
-    def __init__(self, follow_symlinks: bool = False):
+    """Standard file system discovery implementation.
+
+    Walks the tree with os.scandir, using the DirEntry type and stat caches
+    instead of building Path objects for every entry. With workers > 1 the
+    top-level subdirectories of the root are walked in parallel threads, which
+    helps on network filesystems where each directory listing is a round trip.
+    With a manifest_path, directory listings are kept in a DiscoveryManifest
+    and unchanged directories are not read again on the next scan.
+    """
+
+    def __init__(self, follow_symlinks: bool = False, workers: int = 1,
+                 manifest_path: Optional[str] = None):
         self.follow_symlinks = follow_symlinks
+        self.workers = workers
+        self.manifest_path = manifest_path
+        self.manifest_statistics: Optional[dict] = None
 
     def discover_files(self, root_path: str, pattern: str, max_depth: int = 8) -> List[FileInfo]:
         """
@@ -23,60 +39,140 @@ class StandardFileDiscovery:
         Stops descending into subdirectories once a matching file is found.
         """
         files = []
-        root = Path(root_path)
-        visited_dirs = set()  # Track directories we've already processed
-    
         try:
-            # Use os.walk for better control over directory traversal
-            import os
-            for dirpath, dirnames, filenames in os.walk(root, followlinks=self.follow_symlinks):
-                current_dir = Path(dirpath)
-                
-                # Check depth
-                try:
-                    relative_depth = len(current_dir.relative_to(root).parts)
-                except ValueError:
-                    continue
-                
-                if relative_depth > max_depth:
-                    dirnames[:] = []  # Don't descend further
-                    continue
-                
-                # Check if this directory or any parent has already yielded a result
-                skip_this_dir = False
-                for visited in visited_dirs:
-                    if current_dir == visited or visited in current_dir.parents:
-                        skip_this_dir = True
-                        break
-                
-                if skip_this_dir:
-                    dirnames[:] = []  # Don't descend into subdirectories
-                    continue
-                
-                # Look for matching files in this directory
-                for filename in filenames:
-                    if Path(filename).match(pattern):
-                        file_path = current_dir / filename
-                        
-                        if file_path.is_file():
-                            files.append(FileInfo(
-                                path=file_path,
-                                size=file_path.stat().st_size,
-                                modified_time=file_path.stat().st_mtime
-                            ))
-                            
-                            # Mark this directory as visited
-                            visited_dirs.add(current_dir)
-                            
-                            # Don't descend into subdirectories
-                            dirnames[:] = []
-                            break  # Stop looking at files in this directory
-    
+            for file_info in self.iter_files(root_path, pattern, max_depth=max_depth):
+                files.append(file_info)
         except Exception as e:
             print(f"Error discovering files: {e}")
-    
         return files
 
+    def iter_files(self, root_path: str, pattern: str, max_depth: int = 8) -> Iterator[FileInfo]:
+        """
+        Lazily yield the files discover_files() would return, in the same order,
+        as soon as each one is found.
+
+        Directories are visited in os.walk's top-down order. A directory holding
+        a match is not descended into, so nothing below it is ever listed.
+        Errors are raised to the caller (discover_files() prints them and
+        returns the files found so far).
+        """
+        root = str(Path(root_path))
+        matches = _compile_name_pattern(pattern)
+
+        manifest = None
+        if self.manifest_path:
+            manifest = DiscoveryManifest(self.manifest_path)
+            manifest.load(root, pattern, max_depth, self.follow_symlinks)
+
+        if self.workers > 1:
+            yield from self._iter_parallel(root, matches, max_depth, manifest)
+        else:
+            yield from self._walk(root, 0, matches, max_depth, manifest)
+
+        # Only a complete scan replaces the manifest
+        if manifest is not None:
+            manifest.save()
+            self.manifest_statistics = manifest.get_statistics()
+
+    def _walk(self, top: str, depth: int, matches: Callable[[str], bool],
+              max_depth: int, manifest: Optional[DiscoveryManifest] = None) -> Iterator[FileInfo]:
+        """Pre-order walk from top (at the given depth below the root)."""
+        stack = [(top, depth)]
+        while stack:
+            dirpath, depth = stack.pop()
+            found, subdirs = self._scan_directory(dirpath, matches, manifest)
+            if found is not None:
+                yield found
+            elif depth < max_depth:
+                # Reversed so the first subdirectory is popped (visited) first
+                stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+
+    def _iter_parallel(self, root: str, matches: Callable[[str], bool], max_depth: int,
+                       manifest: Optional[DiscoveryManifest] = None) -> Iterator[FileInfo]:
+        """Walk each top-level subtree in its own thread, yielding in walk order."""
+        found, subdirs = self._scan_directory(root, matches, manifest)
+        if found is not None:
+            yield found
+            return
+        if max_depth < 1 or not subdirs:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def walk_subtree(subdir: str) -> List[FileInfo]:
+            return list(self._walk(subdir, 1, matches, max_depth, manifest))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for files in executor.map(walk_subtree, subdirs):
+                yield from files
+
+    def _scan_directory(self, dirpath: str, matches: Callable[[str], bool],
+                        manifest: Optional[DiscoveryManifest] = None) -> Tuple[Optional[FileInfo], List[str]]:
+        """List one directory.
+
+        Returns the first matching file (in listing order) if there is one,
+        otherwise the subdirectories to descend into. Unreadable directories
+        are skipped, as os.walk does.
+        """
+        mtime_ns = None
+        if manifest is not None:
+            # Stat before listing, so a change made meanwhile shows up next time
+            listing, mtime_ns = manifest.lookup(dirpath)
+            if listing is not None:
+                return listing
+
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            return None, []
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                if self.follow_symlinks or not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif matches(entry.name):
+                if _is_file(entry):
+                    stat = entry.stat()
+                    if manifest is not None:
+                        manifest.record(dirpath, mtime_ns, entry.name, [])
+                    return FileInfo(path=Path(entry.path), size=stat.st_size,
+                                    modified_time=stat.st_mtime), []
+                # e.g. a dangling symlink: its target can appear without this
+                # directory changing, so the listing must not be reused
+                mtime_ns = None
+
+        if manifest is not None:
+            manifest.record(dirpath, mtime_ns, None, [os.path.basename(subdir) for subdir in subdirs])
+        return None, subdirs
+
+
+def _is_file(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def _compile_name_pattern(pattern: str) -> Callable[[str], bool]:
+    """Return a predicate equivalent to Path(name).match(pattern) for a file name."""
+    if not pattern or '/' in pattern or os.sep in pattern or (os.altsep and os.altsep in pattern) \
+            or os.path.normcase('A') != 'A':
+        # Multi-component or case-insensitive matching: leave it to pathlib
+        return lambda name: Path(name).match(pattern)
+
+    if not any(char in pattern for char in '*?['):
+        return pattern.__eq__
+
+    regex = re.compile(fnmatch.translate(pattern))
+    return lambda name: regex.match(name) is not None
+
 class FilteredFileDiscovery:
     """File discovery with additional filtering capabilities."""
 
@@ -93,6 +189,30 @@ class FilteredFileDiscovery:
         files = self.base_discovery.discover_files(root_path, pattern, max_depth=max_depth)
         return self._apply_filters(files)
 
+    def iter_files(self, root_path: str, pattern: str, max_depth: int = 8) -> Iterator[FileInfo]:
+        """Lazily discover and filter files."""
+        if hasattr(self.base_discovery, 'iter_files'):
+            files = self.base_discovery.iter_files(root_path, pattern, max_depth=max_depth)
+        else:
+            files = self.base_discovery.discover_files(root_path, pattern, max_depth=max_depth)
+        for file_info in files:
+            if self._matches_filters(file_info):
+                yield file_info
+
+    def _matches_filters(self, file_info: FileInfo) -> bool:
+        """Check a single file against the configured filters."""
+        if self.size_filter:
+            min_size, max_size = self.size_filter
+            if not min_size <= file_info.size <= max_size:
+                return False
+
+        if self.date_filter:
+            min_date, max_date = self.date_filter
+            if not min_date <= file_info.modified_time <= max_date:
+                return False
+
+        return True
+
     def _apply_filters(self, files: List[FileInfo]) -> List[FileInfo]:
         """Apply configured filters."""
         filtered = files
@@ -0,0 +1,149 @@
+"""
+Persistent discovery manifest.
+
+Remembers, for every directory visited by StandardFileDiscovery, its mtime and
+what the listing produced: the matching file's name, or the subdirectories to
+descend into. A directory's mtime changes whenever an entry is added, removed
+or renamed in it, so while it is unchanged the recorded listing can be reused
+and the directory is not read again. Subdirectories are still checked one by
+one (their own mtimes), which keeps new run-* directories visible while
+completed runs cost a single stat.
+"""
+
+import json
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.data_models import FileInfo
+
+
+# Bump when the manifest layout changes
+MANIFEST_FORMAT_VERSION = 1
+
+# Directories modified this close to the previous scan are listed again: a
+# change in the same mtime tick as the scan would otherwise go unnoticed
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class DiscoveryManifest:
+    """JSON manifest of directory listings keyed by directory mtime."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._previous: Dict[str, list] = {}
+        self._previous_scan_ns = 0
+        self._current: Dict[str, list] = {}
+        self._scan_started_ns = 0
+        self._key: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'dirs_reused': 0,
+            'dirs_scanned': 0
+        }
+
+    def load(self, root: str, pattern: str, max_depth: int, follow_symlinks: bool) -> bool:
+        """Start a scan, loading the previous one if it used the same settings.
+
+        Returns False if there is no usable previous manifest (the scan then
+        lists every directory and records the result).
+        """
+        self._key = {
+            'root': root,
+            'pattern': pattern,
+            'max_depth': max_depth,
+            'follow_symlinks': follow_symlinks
+        }
+        self._previous = {}
+        self._previous_scan_ns = 0
+        self._current = {}
+        self._scan_started_ns = time.time_ns()
+        self.stats = {key: 0 for key in self.stats}
+
+        if not self.path.exists():
+            return False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable discovery manifest {self.path}: {e}")
+            return False
+
+        if data.get('version') != MANIFEST_FORMAT_VERSION or data.get('key') != self._key:
+            return False
+
+        self._previous = data.get('dirs', {})
+        self._previous_scan_ns = data.get('scan_started_ns', 0)
+        return True
+
+    def lookup(self, dirpath: str) -> Tuple[Optional[Tuple[Optional[FileInfo], List[str]]], Optional[int]]:
+        """Reuse the recorded listing of an unchanged directory.
+
+        Returns (listing, mtime_ns). listing is (match, subdirectories) as
+        StandardFileDiscovery._scan_directory returns it, or None if the
+        directory has to be listed; mtime_ns is the directory's current mtime
+        (None if it cannot be read), to be passed back to record().
+        """
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return None, None
+
+        entry = self._previous.get(dirpath)
+        if entry is None or entry[0] != mtime_ns or mtime_ns >= self._previous_scan_ns - RACY_WINDOW_NS:
+            return None, mtime_ns
+
+        _, match_name, subdir_names = entry
+        if match_name is not None:
+            # The file itself may have been rewritten in place
+            file_path = os.path.join(dirpath, match_name)
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                return None, mtime_ns
+            if not stat.S_ISREG(file_stat.st_mode):
+                return None, mtime_ns
+            listing = (FileInfo(path=Path(file_path), size=file_stat.st_size,
+                                modified_time=file_stat.st_mtime), [])
+        else:
+            listing = (None, [os.path.join(dirpath, name) for name in subdir_names])
+
+        self._current[dirpath] = entry
+        with self._lock:
+            self.stats['dirs_reused'] += 1
+        return listing, mtime_ns
+
+    def record(self, dirpath: str, mtime_ns: Optional[int], match_name: Optional[str],
+               subdir_names: List[str]) -> None:
+        """Remember the listing of a directory that was just scanned."""
+        with self._lock:
+            self.stats['dirs_scanned'] += 1
+        if mtime_ns is not None:
+            self._current[dirpath] = [mtime_ns, match_name, subdir_names]
+
+    def save(self) -> None:
+        """Write the directories visited by this scan, replacing the old manifest."""
+        data = {
+            'version': MANIFEST_FORMAT_VERSION,
+            'key': self._key,
+            'scan_started_ns': self._scan_started_ns,
+            'dirs': self._current
+        }
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not save discovery manifest {self.path}: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get reuse counters for the last scan."""
+        stats = self.stats.copy()
+        stats['manifest_path'] = str(self.path)
+        return stats
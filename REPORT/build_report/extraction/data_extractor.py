@@ -5,8 +5,13 @@ Handles applying rules to extract data from file content.
 Updated to support multiple iterations per file with multiple results per iteration.
 """
 
+import hashlib
+import pickle
 import re
-from typing import Dict, Any, List
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 import time
 
 from ..interfaces.protocols import DataExtractorInterface
@@ -16,6 +21,46 @@ from ..models.data_models import (
 )
 
 
+# Result line patterns, shared by all extractors
+_UPERF_RESULT_PATTERN = re.compile(
+    r'result:\s*\(uperf::([^)]+)\)\s*samples:\s*([\d.\s]+?)\s*mean:\s*([0-9.]+)\s*min:\s*([0-9.]+)\s*max:\s*([0-9.]+)\s*stddev:\s*([0-9.NaN]+)\s*stddevpct:\s*([0-9.NaN]+)(?:\s*CPU:\s*([0-9.]+))?',
+    re.IGNORECASE)
+_IPERF_RESULT_PATTERN = re.compile(
+    r'result:\s*\(iperf::([^)]+)\)\s*samples:\s*([\d.\s]+?)\s*mean:\s*([0-9.]+)\s*min:\s*([0-9.]+)\s*max:\s*([0-9.]+)\s*stddev:\s*([0-9.NaN]+)\s*stddevpct:\s*([0-9.NaN]+)(?:\s*CPU:\s*([0-9.]+))?',
+    re.IGNORECASE)
+_TRAFFICGEN_RESULT_PATTERN = re.compile(
+    r'result:\s*\(([^)]+)\)\s*samples:\s*([0-9.]+)\s*mean:\s*([0-9.]+)\s*min:\s*([0-9.]+)\s*max:\s*([0-9.]+)',
+    re.IGNORECASE)
+_GENERIC_RESULT_PATTERN = re.compile(r'result:\s*(.+?)$')
+
+# "unique params" keys of the uperf, iperf and trafficgen iterations (other keys are kept as well)
+KNOWN_PARAM_KEYS = (
+    'nthreads', 'test-type', 'wsize', 'rsize', 'protocol', 'duration', 'ifname', 'ipv', 'num_clients',
+    'length', 'bitrate', 'bitrate-range', 'time', 'omit', 'passthru',
+    'frame-size', 'max-loss-pct', 'rate', 'traffic-direction'
+)
+
+# Keys of the result dicts built from "result:" lines
+RESULT_KEYS = ('type', 'sample_values', 'sample_count', 'samples', 'mean', 'min', 'max', 'stddev',
+               'stddevpct', 'range', 'unit', 'busyCPU', 'raw')
+
+
+def _split_params(params_str: Optional[str]) -> Dict[str, str]:
+    """Parse "key=value key=value" into a dict.
+
+    Keys and values are interned: the same few parameter names and values
+    repeat in every iteration of every file, and interning lets all the
+    results kept in memory share one copy of each.
+    """
+    params = {}
+    if params_str:
+        for param in params_str.split():
+            if '=' in param:
+                key, value = param.split('=', 1)
+                params[sys.intern(key)] = sys.intern(value)
+    return params
+
+
 class RegexDataExtractor:
     """Data extractor using regex patterns with iteration support."""
     
@@ -64,14 +109,14 @@ class RegexDataExtractor:
         # Try rules first
         for rule in rules.rules:
             if rule.field_name == "benchmark":
-                match = re.search(rule.pattern, content, re.IGNORECASE | re.MULTILINE)
+                match = rule.compiled_pattern().search(content)
                 if match:
-                    return match.group(1).strip()
+                    return sys.intern(match.group(1).strip())
         
         # Fallback to direct search
         match = re.search(r'benchmark:\s*(\w+)', content, re.IGNORECASE | re.MULTILINE)
         if match:
-            return match.group(1).strip()
+            return sys.intern(match.group(1).strip())
         
         return "unknown"
     
@@ -91,13 +136,7 @@ class RegexDataExtractor:
         if not match:
             return {}
         
-        params_str = match.group(1).strip()
-        params = {}
-        for param in params_str.split():
-            if '=' in param:
-                key, value = param.split('=', 1)
-                params[key] = value
-        return params
+        return _split_params(match.group(1).strip())
     
     def _extract_iterations(self, content: str, benchmark: str) -> List[TestIteration]:
         """Extract all iterations from content."""
@@ -143,12 +182,7 @@ class RegexDataExtractor:
         # Extract unique params
         params_match = re.search(r'unique params:\s*(.*)$', block, re.MULTILINE)
         params_str = params_match.group(1).strip() if params_match else ""
-        unique_params = {}
-        if params_str:
-            for param in params_str.split():
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    unique_params[key] = value
+        unique_params = _split_params(params_str)
         
         # Extract samples
         samples = self._extract_samples(block)
@@ -188,27 +222,9 @@ class RegexDataExtractor:
         # Find all result lines in the block
         for line in block.split('\n'):
             if 'result:' in line:
-                # Determine which extractor to use based on the result line content
-                if '(uperf::' in line:
-                    result = self._extract_uperf_result(line)
-                    if result.get('type') != 'unknown':
-                        results.append(result)
-                elif '(iperf::' in line:
-                    result = self._extract_iperf_result(line)
-                    if result.get('type') != 'unknown':
-                        results.append(result)
-                elif '(trafficgen::' in line:
-                    result = self._extract_trafficgen_result(line)
-                    if result.get('type') != 'unknown':
-                        results.append(result)
-                else:
-                    # Generic result
-                    match = re.search(r'result:\s*(.+?)$', line)
-                    if match:
-                        results.append({
-                            'raw': match.group(1).strip(),
-                            'type': 'generic'
-                        })
+                result = self._parse_result_line(line)
+                if result is not None:
+                    results.append(result)
         
         # If no results found, return a placeholder
         if not results:
@@ -216,14 +232,33 @@ class RegexDataExtractor:
         
         return results
     
+    def _parse_result_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """Parse one 'result:' line; returns None if the line yields no result."""
+        # Determine which extractor to use based on the result line content
+        if '(uperf::' in line:
+            result = self._extract_uperf_result(line)
+        elif '(iperf::' in line:
+            result = self._extract_iperf_result(line)
+        elif '(trafficgen::' in line:
+            result = self._extract_trafficgen_result(line)
+        else:
+            # Generic result
+            match = _GENERIC_RESULT_PATTERN.search(line)
+            if match:
+                return {
+                    'raw': match.group(1).strip(),
+                    'type': 'generic'
+                }
+            return None
+        
+        return result if result.get('type') != 'unknown' else None
+    
     def _extract_uperf_result(self, line: str) -> Dict[str, Any]:
         """Extract uperf result format from a single line."""
         # Pattern: result: (uperf::Gbps) samples: X Y Z mean: M min: N max: O stddev: P stddevpct: Q
-        pattern = r'result:\s*\(uperf::([^)]+)\)\s*samples:\s*([\d.\s]+?)\s*mean:\s*([0-9.]+)\s*min:\s*([0-9.]+)\s*max:\s*([0-9.]+)\s*stddev:\s*([0-9.NaN]+)\s*stddevpct:\s*([0-9.NaN]+)(?:\s*CPU:\s*([0-9.]+))?'
-        
-        match = re.search(pattern, line, re.IGNORECASE)
+        match = _UPERF_RESULT_PATTERN.search(line)
         if match:
-            metric_type = match.group(1).strip()
+            metric_type = sys.intern(match.group(1).strip())
             samples_str = match.group(2).strip()
             
             # Parse sample values
@@ -275,11 +310,9 @@ class RegexDataExtractor:
     def _extract_iperf_result(self, line: str) -> Dict[str, Any]:
         """Extract iperf result format from a single line (same as uperf format)."""
         # Pattern: result: (iperf::rx-Gbps) samples: X mean: M min: N max: O stddev: P stddevpct: Q
-        pattern = r'result:\s*\(iperf::([^)]+)\)\s*samples:\s*([\d.\s]+?)\s*mean:\s*([0-9.]+)\s*min:\s*([0-9.]+)\s*max:\s*([0-9.]+)\s*stddev:\s*([0-9.NaN]+)\s*stddevpct:\s*([0-9.NaN]+)(?:\s*CPU:\s*([0-9.]+))?'
-        
-        match = re.search(pattern, line, re.IGNORECASE)
+        match = _IPERF_RESULT_PATTERN.search(line)
         if match:
-            metric_type = match.group(1).strip()
+            metric_type = sys.intern(match.group(1).strip())
             samples_str = match.group(2).strip()
             
             # Parse sample values
@@ -329,12 +362,10 @@ class RegexDataExtractor:
     
     def _extract_trafficgen_result(self, line: str) -> Dict[str, Any]:
         """Extract trafficgen result format from a single line."""
-        pattern = r'result:\s*\(([^)]+)\)\s*samples:\s*([0-9.]+)\s*mean:\s*([0-9.]+)\s*min:\s*([0-9.]+)\s*max:\s*([0-9.]+)'
-        
-        match = re.search(pattern, line, re.IGNORECASE)
+        match = _TRAFFICGEN_RESULT_PATTERN.search(line)
         if match:
             return {
-                'type': match.group(1),
+                'type': sys.intern(match.group(1)),
                 'samples': float(match.group(2)),
                 'mean': float(match.group(3)),
                 'min': float(match.group(4)),
@@ -396,10 +427,305 @@ class RegexDataExtractor:
                 key, value = tag.split('=', 1)
                 # Update tag value if it's one of our expected tags
                 if key in key_tags:
-                    key_tags[key] = value
+                    key_tags[key] = sys.intern(value)
 
         return key_tags
 
+# Tokens for StreamingDataExtractor: a whole well-formed sample (sample-id,
+# optional primary period-id, period range, period length), or any other line
+# with a colon in it. Lines without a colon carry nothing we extract.
+_TOKEN_PATTERN = re.compile(
+    r'^[ \t]*(?:'
+    r'sample-id:[ \t]*([A-Fa-f0-9-]+)[ \t\r]*\n'
+    r'(?:[ \t]*primary period-id:[^:\n]*\n)?'
+    r'[ \t]*period range:[ \t]*begin:[ \t]*(\d+)[ \t]+end:[ \t]*(\d+)[ \t\r]*\n'
+    r'[ \t]*period length:[ \t]*([0-9.-]+)[ \t]*seconds[ \t\r]*$'
+    r'|[^\n]*:[^\n]*$)',
+    re.MULTILINE)
+_STANDARD_BENCHMARK_PATTERN = r"benchmark:\s*(.+)"
+_HEX_ID_PATTERN = re.compile(r'\s*([A-F0-9-]+)', re.IGNORECASE)
+_BEGIN_END_PATTERN = re.compile(r'begin:\s*(\d+)\s+end:\s*(\d+)', re.IGNORECASE)
+_PERIOD_LENGTH_PATTERN = re.compile(r'\s*([0-9.-]+)\s*seconds', re.IGNORECASE)
+
+# Every keyword the regex extractor reacts to. Seeing one outside its usual
+# "key: value" position means the file needs the full regex treatment.
+_TRIGGERS = ('benchmark:', 'run-id:', 'tags:', 'common params:', 'iteration-id:', 'unique params:',
+             'sample-id:', 'period range:', 'begin:', 'period length:', 'result:')
+_TRIGGERS_BUT_BEGIN = tuple(trigger for trigger in _TRIGGERS if trigger != 'begin:')
+
+# Line kinds, keyed by the text in front of the first colon
+(_KEY_OTHER, _KEY_SAMPLE, _KEY_PERIOD_RANGE, _KEY_PERIOD_LENGTH, _KEY_RESULT, _KEY_ITERATION,
+ _KEY_UNIQUE_PARAMS, _KEY_BENCHMARK, _KEY_RUN_ID, _KEY_TAGS, _KEY_COMMON_PARAMS) = range(11)
+
+# The regex extractor matches these keys case-insensitively ...
+_CASE_INSENSITIVE_KEYS = {
+    'sample-id': _KEY_SAMPLE,
+    'period range': _KEY_PERIOD_RANGE,
+    'period length': _KEY_PERIOD_LENGTH,
+    'benchmark': _KEY_BENCHMARK,
+    'run-id': _KEY_RUN_ID,
+    'tags': _KEY_TAGS,
+    'common params': _KEY_COMMON_PARAMS,
+}
+# ... and these case-sensitively. The remaining keys of the result-summary
+# format carry nothing we extract.
+_LINE_KEYS = dict(_CASE_INSENSITIVE_KEYS, **{
+    'result': _KEY_RESULT,
+    'iteration-id': _KEY_ITERATION,
+    'unique params': _KEY_UNIQUE_PARAMS,
+    'primary period-id': _KEY_OTHER,
+    'primary-period name': _KEY_OTHER,
+    'samples': _KEY_OTHER,
+    'iterations': _KEY_OTHER,
+    'metrics': _KEY_OTHER,
+    'source': _KEY_OTHER,
+    'type': _KEY_OTHER,
+})
+
+# Sample state machine (mirrors the lazy sample regex of RegexDataExtractor)
+_SAMPLE_IDLE, _SAMPLE_NEED_RANGE, _SAMPLE_NEED_BEGIN, _SAMPLE_NEED_LENGTH = range(4)
+
+
+def _contains_trigger(text: str, triggers=_TRIGGERS) -> bool:
+    """Whether any keyword ends at one of the colons in text (case-insensitive)."""
+    pos = text.find(':')
+    if pos == -1:
+        return False
+    lowered = text.lower()
+    while pos != -1:
+        if lowered.endswith(triggers, 0, pos + 1):
+            return True
+        pos = lowered.find(':', pos + 1)
+    return False
+
+
+class _IrregularContent(Exception):
+    """Raised by the tokenizer when a line falls outside the "key: value" layout."""
+
+
+class StreamingDataExtractor(RegexDataExtractor):
+    """Single-pass, line-oriented extractor.
+
+    Walks the file once, dispatching on the key in front of each line's first
+    colon, and builds iterations, samples and results as it goes instead of
+    re-scanning the content per field. The output is identical to
+    RegexDataExtractor; files whose layout the tokenizer cannot decide line by
+    line (values continued on the next line, keywords in unexpected places,
+    custom benchmark rules) are handed to RegexDataExtractor unchanged.
+    """
+
+    def __init__(self, enable_timing: bool = False):
+        super().__init__(enable_timing=enable_timing)
+        self.stats = {'streamed': 0, 'fallbacks': 0}
+
+    def extract_data(self, content: str, rules: BenchmarkRuleSet, file_info: FileInfo) -> MultiResultExtractedData:
+        """Extract data in one pass over the content."""
+        start_time = time.time() if self.enable_timing else None
+
+        try:
+            header, iterations = self._tokenize(content)
+        except _IrregularContent:
+            self.stats['fallbacks'] += 1
+            return super().extract_data(content, rules, file_info)
+        self.stats['streamed'] += 1
+
+        benchmark = self._select_benchmark(content, rules, header['benchmark'])
+        tags = header['tags']
+
+        extraction_metadata = {
+            'rules_applied': [rule.__class__.__name__ for rule in rules.rules] if hasattr(rules, 'rules') else [],
+            'iterations_found': len(iterations),
+            'total_samples': sum(len(it.samples) for it in iterations),
+            'benchmark_detected': benchmark,
+            'tags': tags,
+            'key_tags': self._extract_key_tags(tags)
+        }
+
+        if self.enable_timing:
+            extraction_metadata['extraction_duration_ms'] = (time.time() - start_time) * 1000
+
+        return MultiResultExtractedData(
+            file_info=file_info,
+            benchmark=benchmark,
+            run_id=header['run_id'],
+            common_params=header['common_params'],
+            iterations=iterations,
+            extraction_metadata=extraction_metadata,
+            raw_matches={}  # For backward compatibility
+        )
+
+    def _select_benchmark(self, content: str, rules: BenchmarkRuleSet, streamed: Optional[str]) -> str:
+        """Use the tokenized benchmark unless the rule set brings its own pattern."""
+        benchmark_rules = [rule for rule in rules.rules if rule.field_name == "benchmark"]
+        if benchmark_rules and all(rule.pattern == _STANDARD_BENCHMARK_PATTERN for rule in benchmark_rules):
+            return streamed if streamed is not None else "unknown"
+        return self._extract_benchmark(content, rules)
+
+    def _tokenize(self, content: str):
+        """Walk the token lines of the content once, in file order.
+
+        Returns (header, iterations); raises _IrregularContent when the file
+        must go through the regex extractor to get identical results.
+        """
+        header = {'benchmark': None, 'run_id': None, 'tags': None, 'common_params': None}
+        iterations = []
+        preamble_results = []
+
+        # Current iteration block
+        iteration_id = None
+        unique_params = None
+        samples = []
+        results = preamble_results
+        sample_state = _SAMPLE_IDLE
+        sample = None
+
+        for token in _TOKEN_PATTERN.finditer(content):
+            sample_id, begin, end, duration = token.groups()
+            if sample_id is not None:
+                if sample_state == _SAMPLE_IDLE and iteration_id is not None:
+                    samples.append({
+                        'sample_id': sample_id,
+                        'begin': int(begin),
+                        'end': int(end),
+                        'duration': float(duration)
+                    })
+                    continue
+                # Sample lines while an earlier sample is still incomplete
+                lines = token.group(0).split('\n')
+            else:
+                lines = (token.group(0),)
+
+            for line in lines:
+                key, colon, rest = line.partition(':')
+                if not colon:
+                    continue
+                kind = _LINE_KEYS.get(key.lstrip())
+                if kind is None:
+                    kind = _CASE_INSENSITIVE_KEYS.get(key.lstrip().lower())
+                    if kind is None:
+                        # A keyword inside an unknown key, or a case variant of a case-sensitive key
+                        if _contains_trigger(line):
+                            raise _IrregularContent()
+                        continue
+
+                if kind == _KEY_OTHER:
+                    if ':' in rest and _contains_trigger(rest):
+                        raise _IrregularContent()
+
+                elif kind == _KEY_SAMPLE:
+                    if ':' in rest and _contains_trigger(rest):
+                        raise _IrregularContent()
+                    if sample_state == _SAMPLE_IDLE and iteration_id is not None:
+                        match = _HEX_ID_PATTERN.match(rest)
+                        if match:
+                            sample = {'sample_id': match.group(1)}
+                            sample_state = _SAMPLE_NEED_RANGE
+                        elif not rest.strip():
+                            raise _IrregularContent()
+
+                elif kind == _KEY_PERIOD_RANGE:
+                    # Usually "begin: N end: M"; anything else with a colon gets a closer look
+                    lowered = rest.lower()
+                    begins = lowered.count('begin:')
+                    if rest.count(':') != begins + lowered.count('end:') and _contains_trigger(rest, _TRIGGERS_BUT_BEGIN):
+                        raise _IrregularContent()
+                    if sample_state == _SAMPLE_NEED_RANGE:
+                        sample_state = _SAMPLE_NEED_BEGIN
+                    if sample_state == _SAMPLE_NEED_BEGIN and begins:
+                        match = _BEGIN_END_PATTERN.search(rest)
+                        if not match:
+                            raise _IrregularContent()
+                        sample['begin'] = int(match.group(1))
+                        sample['end'] = int(match.group(2))
+                        sample_state = _SAMPLE_NEED_LENGTH
+
+                elif kind == _KEY_PERIOD_LENGTH:
+                    if ':' in rest and _contains_trigger(rest):
+                        raise _IrregularContent()
+                    if sample_state == _SAMPLE_NEED_LENGTH:
+                        match = _PERIOD_LENGTH_PATTERN.match(rest)
+                        if not match:
+                            raise _IrregularContent()
+                        sample['duration'] = float(match.group(1))
+                        samples.append(sample)
+                        sample_state = _SAMPLE_IDLE
+
+                elif kind == _KEY_RESULT:
+                    if _contains_trigger(rest):
+                        raise _IrregularContent()
+                    result = self._parse_result_line(line)
+                    if result is not None:
+                        results.append(result)
+
+                else:
+                    if ':' in rest and _contains_trigger(rest):
+                        raise _IrregularContent()
+
+                    if kind == _KEY_ITERATION:
+                        match = _HEX_ID_PATTERN.match(rest)
+                        if not match:
+                            raise _IrregularContent()
+                        if iteration_id is not None:
+                            iterations.append(self._finish_iteration(iteration_id, unique_params, samples, results))
+                        iteration_id = match.group(1)
+                        unique_params = None
+                        samples = []
+                        results = []
+                        sample_state = _SAMPLE_IDLE
+                    elif kind == _KEY_UNIQUE_PARAMS:
+                        if unique_params is None and iteration_id is not None:
+                            unique_params = self._header_value(rest)
+                    elif kind == _KEY_RUN_ID:
+                        if header['run_id'] is None:
+                            match = _HEX_ID_PATTERN.match(rest)
+                            if match:
+                                header['run_id'] = match.group(1).strip()
+                            elif not rest.strip():
+                                raise _IrregularContent()
+                    elif kind == _KEY_BENCHMARK:
+                        if header['benchmark'] is None:
+                            header['benchmark'] = sys.intern(self._header_value(rest))
+                    elif kind == _KEY_TAGS:
+                        if header['tags'] is None:
+                            header['tags'] = self._header_value(rest)
+                    elif kind == _KEY_COMMON_PARAMS:
+                        if header['common_params'] is None:
+                            header['common_params'] = self._header_value(rest)
+
+        if iteration_id is not None:
+            iterations.append(self._finish_iteration(iteration_id, unique_params, samples, results))
+        else:
+            # No iteration blocks: every result line in the file forms one legacy iteration
+            iterations = [TestIteration(
+                iteration_id="legacy-format",
+                unique_params={'format': 'legacy'},
+                samples=[],
+                results=preamble_results or [{'raw': 'No result found', 'type': 'unknown'}]
+            )]
+
+        header['run_id'] = header['run_id'] or ""
+        header['tags'] = header['tags'] or ""
+        header['common_params'] = _split_params(header['common_params'])
+        return header, iterations
+
+    @staticmethod
+    def _header_value(rest: str) -> str:
+        """Value of a "key: value" line; an empty value would make the regex read the next line."""
+        value = rest.strip()
+        if not value:
+            raise _IrregularContent()
+        return value
+
+    def _finish_iteration(self, iteration_id: str, unique_params: Optional[str],
+                          samples: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> TestIteration:
+        return TestIteration(
+            iteration_id=iteration_id,
+            unique_params=_split_params(unique_params),
+            samples=samples,
+            results=results or [{'raw': 'No result found', 'type': 'unknown'}]
+        )
+
+
 class MultiPassDataExtractor:
     """Data extractor that performs multiple passes for complex extractions."""
     
@@ -413,21 +739,80 @@ class MultiPassDataExtractor:
 
 
 class CachedDataExtractor:
-    """Data extractor with caching for repeated patterns."""
+    """Data extractor that memoizes results by file content.
+
+    Results of the wrapped extractor are kept in a bounded LRU keyed by a hash
+    of the content and of the rule set's patterns, so identical files (copied
+    run directories, re-processed trees) are only extracted once. Entries are
+    stored pickled and every hit is unpickled into a fresh object, since the
+    transformers modify the extracted data in place.
+    """
     
-    def __init__(self, base_extractor: DataExtractorInterface = None):
+    def __init__(self, base_extractor: DataExtractorInterface = None, max_entries: int = 256):
         self.base_extractor = base_extractor or RegexDataExtractor()
-        self._pattern_cache = {}
-        self._compiled_patterns = {}
+        self.max_entries = max_entries
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def __getstate__(self):
+        # Settings only (the lock cannot be pickled): a process worker starts with an empty cache
+        return {'base_extractor': self.base_extractor, 'max_entries': self.max_entries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
     
     def extract_data(self, content: str, rules: BenchmarkRuleSet, file_info: FileInfo) -> MultiResultExtractedData:
-        """Extract data with pattern caching."""
-        return self.base_extractor.extract_data(content, rules, file_info)
+        """Extract data, reusing the result for content seen before."""
+        key = self._cache_key(content, rules)
+        
+        with self._lock:
+            payload = self._results.get(key)
+            if payload is not None:
+                self._results.move_to_end(key)
+                self.stats['hits'] += 1
+            else:
+                self.stats['misses'] += 1
+        
+        if payload is not None:
+            extracted = pickle.loads(payload)
+            extracted.file_info = file_info
+            return extracted
+        
+        extracted = self.base_extractor.extract_data(content, rules, file_info)
+        payload = pickle.dumps(extracted, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        with self._lock:
+            self._results[key] = payload
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+                self.stats['evictions'] += 1
+        
+        return extracted
+    
+    def _cache_key(self, content: str, rules: BenchmarkRuleSet) -> bytes:
+        """Hash of the content and everything in the rule set that affects extraction."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(content.encode('utf-8', 'surrogatepass'))
+        digest.update(repr((
+            rules.benchmark_name,
+            [(rule.field_name, rule.pattern, rule.processor) for rule in rules.rules],
+            [(rule.field_name, rule.pattern, rule.processor) for rule in rules.metadata_rules or []]
+        )).encode('utf-8', 'surrogatepass'))
+        return digest.digest()
     
     def clear_cache(self):
-        """Clear the pattern cache."""
-        self._pattern_cache.clear()
-        self._compiled_patterns.clear()
+        """Drop all memoized results."""
+        with self._lock:
+            self._results.clear()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get hit/miss counters."""
+        with self._lock:
+            stats = self.stats.copy()
+            stats['entries'] = len(self._results)
+        return stats
 
 
 class ValidatingDataExtractor:
@@ -2,17 +2,22 @@
 Factory functions for creating different orchestrator configurations.
 """
 
+import os
+
 from .models.data_models import SchemaVersion
 from .discovery.file_discovery import StandardFileDiscovery, FilteredFileDiscovery
 from .parsing.content_parser import TextFileParser, CachingParser
 from .rules.rule_engine import ConfigurableRuleEngine
-from .extraction.data_extractor import RegexDataExtractor
+from .extraction.data_extractor import StreamingDataExtractor
 from .transformation.data_transformer import StandardDataTransformer, BenchmarkSpecificTransformer
 from .output.generators import SchemaAwareOutputGenerator
 from .schema.schema_manager import SchemaManager
+from .cache.result_cache import ResultCache
 from .orchestration.orchestrator import (
-    ReportOrchestrator, BatchReportOrchestrator, ParallelReportOrchestrator
+    ReportOrchestrator, BatchReportOrchestrator, ParallelReportOrchestrator,
+    PipelinedReportOrchestrator
 )
+from .orchestration.report_merger import ReportMerger
 
 
 def create_default_orchestrator():
@@ -22,7 +27,7 @@ def create_default_orchestrator():
         file_discovery=StandardFileDiscovery(),
         content_parser=TextFileParser(),
         rule_engine=ConfigurableRuleEngine(),
-        data_extractor=RegexDataExtractor(),
+        data_extractor=StreamingDataExtractor(),
         data_transformer=BenchmarkSpecificTransformer(),
         output_generator=SchemaAwareOutputGenerator(schema_manager)
     )
@@ -32,12 +37,23 @@ def create_enhanced_orchestrator(schema_version=SchemaVersion.V2_0,
                                with_caching=True,
                                with_filtering=False,
                                parallel=False,
-                               max_workers=4):
-    """Create orchestrator with enhanced configuration."""
+                               max_workers=4,
+                               executor='thread',
+                               chunk_size=None,
+                               cache_dir=None,
+                               parser_cache_bytes=256 * 1024 * 1024,
+                               parser_cache_entries=4096,
+                               compress_parser_cache=False):
+    """Create orchestrator with enhanced configuration.
+
+    executor selects the parallel backend ('thread' or 'process') when parallel=True.
+    cache_dir enables the persistent per-file result cache and discovery manifest.
+    parser_cache_* bound the in-memory content cache used when with_caching=True.
+    """
     schema_manager = SchemaManager(schema_version)
     
     # Configure file discovery
-    file_discovery = StandardFileDiscovery()
+    file_discovery = StandardFileDiscovery(manifest_path=_discovery_manifest_path(cache_dir))
     if with_filtering:
         file_discovery = FilteredFileDiscovery(
             file_discovery,
@@ -47,66 +63,136 @@ def create_enhanced_orchestrator(schema_version=SchemaVersion.V2_0,
     # Configure parser
     parser = TextFileParser()
     if with_caching:
-        parser = CachingParser(parser)
+        parser = CachingParser(parser,
+                               max_bytes=parser_cache_bytes,
+                               max_entries=parser_cache_entries,
+                               compress=compress_parser_cache)
     
     # Create orchestrator
     orchestrator_class = ParallelReportOrchestrator if parallel else ReportOrchestrator
-    kwargs = {'max_workers': max_workers} if parallel else {}
+    kwargs = {'max_workers': max_workers, 'executor': executor, 'chunk_size': chunk_size} if parallel else {}
     
     return orchestrator_class(
         file_discovery=file_discovery,
         content_parser=parser,
         rule_engine=ConfigurableRuleEngine(),
-        data_extractor=RegexDataExtractor(enable_timing=True),
+        data_extractor=StreamingDataExtractor(enable_timing=True),
         data_transformer=BenchmarkSpecificTransformer(),
         output_generator=SchemaAwareOutputGenerator(schema_manager),
+        result_cache=ResultCache(cache_dir) if cache_dir else None,
         **kwargs
     )
 
 
-def create_batch_orchestrator():
-    """Create orchestrator for batch processing."""
+def create_batch_orchestrator(parser_cache_bytes=256 * 1024 * 1024,
+                              parser_cache_entries=4096,
+                              compress_parser_cache=False):
+    """Create orchestrator for batch processing.
+
+    The content cache is shared by every directory of the batch, so it is
+    bounded by parser_cache_bytes / parser_cache_entries (LRU eviction).
+    """
     schema_manager = SchemaManager(SchemaVersion.V2_0)
     return BatchReportOrchestrator(
         file_discovery=StandardFileDiscovery(),
-        content_parser=CachingParser(TextFileParser()),
+        content_parser=CachingParser(TextFileParser(),
+                                     max_bytes=parser_cache_bytes,
+                                     max_entries=parser_cache_entries,
+                                     compress=compress_parser_cache),
         rule_engine=ConfigurableRuleEngine(),
-        data_extractor=RegexDataExtractor(enable_timing=True),
+        data_extractor=StreamingDataExtractor(enable_timing=True),
         data_transformer=BenchmarkSpecificTransformer(),
         output_generator=SchemaAwareOutputGenerator(schema_manager)
     )
 
 def create_html_orchestrator(schema_version=SchemaVersion.V2_0):
     """Create orchestrator with HTML output."""
-    from .output.generators import HtmlOutputGenerator
+    from .output.html_report import HtmlOutputGenerator
 
     schema_manager = SchemaManager(schema_version)
     return ReportOrchestrator(
         file_discovery=StandardFileDiscovery(),
         content_parser=TextFileParser(),
         rule_engine=ConfigurableRuleEngine(),
-        data_extractor=RegexDataExtractor(),
+        data_extractor=StreamingDataExtractor(),
         data_transformer=BenchmarkSpecificTransformer(),
         output_generator=HtmlOutputGenerator()  # HTML instead of JSON
     )
 
-def create_multi_format_orchestrator(formats=['json', 'html'], base_url=''):
-    """Create orchestrator with multiple output formats."""
+def create_multi_format_orchestrator(formats=['json', 'html'], base_url='',
+                                     workers=1, executor='process', cache_dir=None,
+                                     compact_json=False, pipeline=False, discovery_workers=1,
+                                     html_mode='inline', compress_csv=False,
+                                     instrumentation=None):
+    """Create orchestrator with multiple output formats.
+
+    With workers > 1 files are processed by a ParallelReportOrchestrator using
+    the given executor ('thread' or 'process'). With cache_dir set, results of
+    unchanged files are reused from the on-disk result cache, and discovery
+    keeps a manifest there so unchanged directories are not listed again. compact_json
+    writes the JSON report without indentation. pipeline=True uses a
+    PipelinedReportOrchestrator, which overlaps discovery, processing and
+    output generation. discovery_workers > 1 walks the top-level
+    subdirectories of the root in parallel threads. html_mode='paged'
+    writes the HTML report with its table rows in a compressed sidecar that
+    the page loads and pages through on demand. compress_csv=True writes
+    the CSV report gzip-compressed (<output>.csv.gz). instrumentation (a
+    PipelineInstrumentation) collects per-stage, per-benchmark and per-file
+    timings.
+    """
+    multi_generator = _multi_format_generator(formats, base_url, compact_json, html_mode, compress_csv)
+
+    if pipeline:
+        orchestrator_class = PipelinedReportOrchestrator
+        kwargs = {'max_workers': workers, 'executor': executor}
+    elif workers > 1:
+        orchestrator_class = ParallelReportOrchestrator
+        kwargs = {'max_workers': workers, 'executor': executor}
+    else:
+        orchestrator_class = ReportOrchestrator
+        kwargs = {}
+
+    return orchestrator_class(
+        file_discovery=StandardFileDiscovery(workers=discovery_workers,
+                                             manifest_path=_discovery_manifest_path(cache_dir)),
+        content_parser=TextFileParser(),
+        rule_engine=ConfigurableRuleEngine(),
+        data_extractor=StreamingDataExtractor(),
+        data_transformer=BenchmarkSpecificTransformer(),
+        output_generator=multi_generator,
+        result_cache=ResultCache(cache_dir) if cache_dir else None,
+        instrumentation=instrumentation,
+        **kwargs
+    )
+
+
+def create_report_merger(formats=['json', 'html'], base_url='', compact_json=False,
+                         html_mode='inline', compress_csv=False):
+    """Create a ReportMerger writing the given formats.
+
+    The merger combines previously generated JSON reports and result cache
+    directories into one report without reprocessing any result file. The
+    output options are the same as for create_multi_format_orchestrator().
+    """
+    return ReportMerger(_multi_format_generator(formats, base_url, compact_json, html_mode, compress_csv))
+
+
+def _multi_format_generator(formats, base_url, compact_json, html_mode, compress_csv):
+    """Multi-format output generator with the given formats enabled."""
     from .output.generators import EnhancedMultiFormatOutputGenerator
 
     schema_manager = SchemaManager(SchemaVersion.V2_0)
-    multi_generator = EnhancedMultiFormatOutputGenerator(schema_manager, base_url=base_url)
+    multi_generator = EnhancedMultiFormatOutputGenerator(schema_manager, base_url=base_url,
+                                                         compact_json=compact_json,
+                                                         html_mode=html_mode,
+                                                         compress_csv=compress_csv)
 
     # Enable specified formats
     for fmt in formats:
         multi_generator.enable_format(fmt)
+    return multi_generator
 
-    return ReportOrchestrator(
-        file_discovery=StandardFileDiscovery(),
-        content_parser=TextFileParser(),
-        rule_engine=ConfigurableRuleEngine(),
-        data_extractor=RegexDataExtractor(),
-        data_transformer=BenchmarkSpecificTransformer(),
-        output_generator=multi_generator
-    )
 
+def _discovery_manifest_path(cache_dir):
+    """Location of the discovery manifest inside the cache directory (None if caching is off)."""
+    return os.path.join(cache_dir, 'discovery-manifest.json') if cache_dir else None
@@ -0,0 +1,184 @@
+"""
+Per-stage timing instrumentation for the report pipeline.
+
+A PipelineInstrumentation is handed to the orchestrator (and by it to the
+output generator). It times discovery and every output format, and gets one
+record per processed file with the bytes read and the seconds spent parsing,
+extracting and transforming it. From those it keeps totals per stage and per
+benchmark, and the slowest files. Worker processes fill their own copy and
+the orchestrator merges the file records back with record_files().
+
+Stage times are summed over all workers, so with --workers N they are busy
+time rather than wall-clock time.
+"""
+
+import heapq
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Per-file stages, in pipeline order
+FILE_STAGES = ('parse', 'extract', 'transform')
+
+# (path, benchmark, bytes read, {stage: seconds})
+FileTiming = Tuple[str, str, int, Dict[str, float]]
+
+
+class PipelineInstrumentation:
+    """Collects stage timers, per-benchmark totals and the slowest files."""
+
+    def __init__(self, slowest: int = 20):
+        self.slowest = slowest
+        self._lock = threading.Lock()
+        # Only copies in worker processes keep file records for drain_files()
+        self._shipping = False
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop everything collected so far."""
+        self._started = time.perf_counter()
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._benchmarks: Dict[str, Dict[str, float]] = {}
+        self._slowest: List[Tuple[float, int, FileTiming]] = []
+        self._pending: List[FileTiming] = []
+        self._files = 0
+        self._bytes_read = 0
+        self._sequence = 0
+
+    def worker_copy(self) -> 'PipelineInstrumentation':
+        """Empty collector with the same settings, keeping its file records for drain_files()."""
+        copy = PipelineInstrumentation(slowest=self.slowest)
+        copy._shipping = True
+        return copy
+
+    def __getstate__(self):
+        # Settings only (the lock cannot be pickled); see worker_copy()
+        return {'slowest': self.slowest}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one run of stage name."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(name, time.perf_counter() - started)
+
+    def add_stage_time(self, name: str, seconds: float, count: int = 1) -> None:
+        with self._lock:
+            self._add_stage_time(name, seconds, count)
+
+    def record_file(self, path: str, benchmark: str, bytes_read: int, stage_times: Dict[str, float]) -> None:
+        """Record the stage times of one processed file."""
+        with self._lock:
+            self._record_file((path, benchmark, bytes_read, stage_times))
+
+    def record_files(self, timings: Iterable[FileTiming]) -> None:
+        """Merge file records collected elsewhere (e.g. by a worker process)."""
+        with self._lock:
+            for timing in timings:
+                self._record_file(timing)
+
+    def drain_files(self) -> List[FileTiming]:
+        """File records added since the last call, for shipping to another process."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def _add_stage_time(self, name: str, seconds: float, count: int) -> None:
+        stage = self._stages.get(name)
+        if stage is None:
+            stage = self._stages[name] = {'seconds': 0.0, 'count': 0}
+        stage['seconds'] += seconds
+        stage['count'] += count
+
+    def _record_file(self, timing: FileTiming) -> None:
+        path, benchmark, bytes_read, stage_times = timing
+        if self._shipping:
+            self._pending.append(timing)
+        self._files += 1
+        self._bytes_read += bytes_read
+
+        per_benchmark = self._benchmarks.get(benchmark)
+        if per_benchmark is None:
+            per_benchmark = self._benchmarks[benchmark] = dict.fromkeys(('files', 'bytes_read') + FILE_STAGES, 0)
+        per_benchmark['files'] += 1
+        per_benchmark['bytes_read'] += bytes_read
+        for name, seconds in stage_times.items():
+            self._add_stage_time(name, seconds, 1)
+            per_benchmark[name] = per_benchmark.get(name, 0) + seconds
+
+        # Keep the N slowest files in a min-heap (sequence breaks ties)
+        total = sum(stage_times.values())
+        self._sequence += 1
+        entry = (total, self._sequence, timing)
+        if len(self._slowest) < self.slowest:
+            heapq.heappush(self._slowest, entry)
+        elif total > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def get_report(self) -> Dict[str, Any]:
+        """Timing report: stages, files, per-benchmark totals and slowest files."""
+        with self._lock:
+            wall_seconds = time.perf_counter() - self._started
+            stages = {name: dict(stage) for name, stage in self._stages.items()}
+            benchmarks = {
+                name: dict(totals, seconds=sum(totals[stage] for stage in FILE_STAGES))
+                for name, totals in self._benchmarks.items()
+            }
+            slowest = [
+                {'path': path, 'benchmark': benchmark, 'bytes_read': bytes_read,
+                 'seconds': total, **stage_times}
+                for total, _, (path, benchmark, bytes_read, stage_times)
+                in sorted(self._slowest, key=lambda entry: entry[0], reverse=True)
+            ]
+            files = self._files
+            bytes_read = self._bytes_read
+
+        read_seconds = stages.get('parse', {}).get('seconds', 0.0)
+        return {
+            'wall_seconds': wall_seconds,
+            'stages': stages,
+            'files': {
+                'processed': files,
+                'bytes_read': bytes_read,
+                'read_mb_per_second': bytes_read / (1024 * 1024) / read_seconds if read_seconds else None
+            },
+            'benchmarks': dict(sorted(benchmarks.items(), key=lambda item: item[1]['seconds'], reverse=True)),
+            'slowest_files': slowest
+        }
+
+    def write_report(self, output_path: str) -> None:
+        """Write get_report() as JSON."""
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.get_report(), f, indent=2)
+
+    def print_summary(self, top: int = 5) -> None:
+        """Print stage totals, the most expensive benchmarks and the slowest files."""
+        report = self.get_report()
+        print("Stage timings:")
+        for name, stage in sorted(report['stages'].items(), key=lambda item: item[1]['seconds'], reverse=True):
+            print(f"  {name:<20} {stage['seconds']:8.3f} s  ({stage['count']} runs)")
+        print(f"  bytes read: {report['files']['bytes_read'] / (1024 * 1024):.1f} MB "
+              f"in {report['files']['processed']} files")
+        for name, totals in list(report['benchmarks'].items())[:top]:
+            print(f"  benchmark {name}: {totals['seconds']:.3f} s over {totals['files']} files "
+                  f"(extract {totals['extract']:.3f} s)")
+        for entry in report['slowest_files'][:top]:
+            print(f"  slow file: {entry['seconds'] * 1000:.1f} ms {entry['path']}")
+
+
+@contextmanager
+def timed(instrumentation: Optional[PipelineInstrumentation], name: str) -> Iterator[None]:
+    """instrumentation.stage(name), or nothing when instrumentation is None."""
+    if instrumentation is None:
+        yield
+    else:
+        with instrumentation.stage(name):
+            yield
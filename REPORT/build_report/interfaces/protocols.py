@@ -4,7 +4,7 @@ Protocol interfaces for the build report generator.
 Defines the contracts that each module must implement.
 """
 
-from typing import Dict, List, Any, Optional, Protocol
+from typing import Dict, Iterator, List, Any, Optional, Protocol
 from ..models.data_models import (
     FileInfo, BenchmarkRuleSet, ExtractedData, ProcessedResult
 )
@@ -18,6 +18,14 @@ class FileDiscoveryInterface(Protocol):
         ...
 
 
+class StreamingFileDiscoveryInterface(FileDiscoveryInterface, Protocol):
+    """Interface for file discovery components that can yield files lazily."""
+    
+    def iter_files(self, root_path: str, pattern: str) -> Iterator[FileInfo]:
+        """Yield files matching the pattern as they are found."""
+        ...
+
+
 class ContentParserInterface(Protocol):
     """Interface for content parsing components."""
     
@@ -62,6 +70,26 @@ class OutputGeneratorInterface(Protocol):
         ...
 
 
+class StreamingOutputGeneratorInterface(OutputGeneratorInterface, Protocol):
+    """Interface for output generators that accept results one at a time."""
+    
+    def begin_output(self, output_path: str, git_branch: str = None, execution_label: str = None) -> None:
+        """Open the output before the first result."""
+        ...
+    
+    def add_result(self, result: ProcessedResult) -> None:
+        """Write or buffer one result."""
+        ...
+    
+    def finish_output(self) -> None:
+        """Complete the output after the last result."""
+        ...
+    
+    def abort_output(self) -> None:
+        """Close a partially written output."""
+        ...
+
+
 class SchemaManagerInterface(Protocol):
     """Interface for schema management components."""
     
@@ -4,11 +4,36 @@ Data models for the build report generator.
 Contains all dataclasses and enums used throughout the system.
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Pattern
 import datetime
+import re
+
+
+# Flags every extraction rule pattern is compiled (and matched) with
+RULE_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+def slotted(cls):
+    """Rebuild a dataclass with __slots__ for its fields.
+
+    Same as @dataclass(slots=True), which needs Python 3.10. Instances have
+    no per-object __dict__, which matters for the models kept alive for every
+    file and iteration of a large campaign.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Class-level defaults would clash with the slot descriptors; __init__ has its own copy
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
 
 
 class SchemaVersion(Enum):
@@ -26,6 +51,7 @@ class ResultStatus(Enum):
     SKIPPED = "skipped"
 
 
+@slotted
 @dataclass
 class FileInfo:
     """Information about a discovered file."""
@@ -34,14 +60,23 @@ class FileInfo:
     modified_time: float
 
 
+@slotted
 @dataclass
 class ExtractionRule:
     """A single extraction rule."""
     field_name: str
     pattern: str
     processor: Optional[str] = None  # Optional post-processing function name
+    compiled: Optional[Pattern] = field(default=None, compare=False, repr=False)
+
+    def compiled_pattern(self) -> Pattern:
+        """The pattern compiled with RULE_PATTERN_FLAGS, recompiled if pattern was changed."""
+        if self.compiled is None or self.compiled.pattern != self.pattern:
+            self.compiled = re.compile(self.pattern, RULE_PATTERN_FLAGS)
+        return self.compiled
 
 
+@slotted
 @dataclass
 class BenchmarkRuleSet:
     """Set of rules for a specific benchmark."""
@@ -50,6 +85,7 @@ class BenchmarkRuleSet:
     metadata_rules: Optional[List[ExtractionRule]] = None
 
 
+@slotted
 @dataclass
 class ExtractedData:
     """Raw extracted data from a file."""
@@ -59,6 +95,7 @@ class ExtractedData:
     extraction_metadata: Dict[str, Any]
 
 
+@slotted
 @dataclass
 class ProcessedResult:
     """Processed and transformed result."""
@@ -68,6 +105,7 @@ class ProcessedResult:
     processing_metadata: Dict[str, Any]
 
 
+@slotted
 @dataclass
 class SchemaInfo:
     """Schema metadata."""
@@ -85,6 +123,7 @@ class SchemaInfo:
 # NEW CLASSES FOR MULTI-ITERATION SUPPORT
 # ============================================================================
 
+@slotted
 @dataclass
 class TestIteration:
     """
@@ -105,6 +144,7 @@ class TestIteration:
         return f"TestIteration(id={self.iteration_id[:8]}..., params={self.unique_params}, samples={len(self.samples)}, results={len(self.results)})"
 
 
+@slotted
 @dataclass
 class MultiResultExtractedData:
     """
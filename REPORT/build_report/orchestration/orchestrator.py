@@ -4,15 +4,25 @@ Report orchestrator - coordinates all components.
 Manages the entire report generation workflow using dependency injection.
 """
 
+import os
+import queue
 import re
+import threading
 import time
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from ..interfaces.protocols import (
     FileDiscoveryInterface, ContentParserInterface, RuleEngineInterface,
     DataExtractorInterface, DataTransformerInterface, OutputGeneratorInterface
 )
-from ..models.data_models import ProcessedResult
+from ..models.data_models import FileInfo, ProcessedResult
+from ..cache.result_cache import ResultCache, compute_pipeline_fingerprint
+from ..instrumentation.timing import PipelineInstrumentation, timed
+from .report_merger import ReportMerger
+
+
+# Benchmark name used to pick the rule set; usually found in the first few lines
+_BENCHMARK_PATTERN = re.compile(r"benchmark:\s*(.+)")
 
 
 class ReportOrchestrator:
@@ -24,13 +34,17 @@ class ReportOrchestrator:
                  rule_engine: RuleEngineInterface,
                  data_extractor: DataExtractorInterface,
                  data_transformer: DataTransformerInterface,
-                 output_generator: OutputGeneratorInterface):
+                 output_generator: OutputGeneratorInterface,
+                 result_cache: Optional[ResultCache] = None,
+                 instrumentation: Optional[PipelineInstrumentation] = None):
         self.file_discovery = file_discovery
         self.content_parser = content_parser
         self.rule_engine = rule_engine
         self.data_extractor = data_extractor
         self.data_transformer = data_transformer
         self.output_generator = output_generator
+        self.result_cache = result_cache
+        self.set_instrumentation(instrumentation)
         
         # Configuration options
         self.enable_progress = True
@@ -58,7 +72,8 @@ class ReportOrchestrator:
             print("Starting modular report generation...")
 
         # Step 1: Discover files
-        files = self.file_discovery.discover_files(root_path, file_pattern)
+        with timed(self.instrumentation, 'discovery'):
+            files = self.file_discovery.discover_files(root_path, file_pattern)
         self.stats['files_discovered'] = len(files)
 
         if self.enable_progress:
@@ -70,6 +85,7 @@ class ReportOrchestrator:
 
         results = []
         file_times = []
+        self._open_result_cache()
 
         # Step 2: Process each file
         for i, file_info in enumerate(files):
@@ -80,25 +96,24 @@ class ReportOrchestrator:
             try:
                 file_start_time = time.time() if self.enable_timing else None
 
-                # Parse content
-                content = self.content_parser.parse_file(file_info)
-                if content is None:
+                # Reuse the cached result of an unchanged file
+                cached_result = self.result_cache.get(file_info) if self.result_cache else None
+                if cached_result is not None:
+                    results.append(cached_result)
+                    self.stats['files_processed'] += 1
+                    continue
+
+                # Parse, extract and transform
+                processed_result = self._process_single_file(file_info)
+                if processed_result is None:
                     self.stats['files_failed'] += 1
                     if not self.continue_on_error:
                         raise Exception(f"Failed to parse {file_info.path}")
                     continue
 
-                # Extract benchmark type to get appropriate rules
-                benchmark_match = re.search(r"benchmark:\s*(.+)", content)
-                benchmark = benchmark_match.group(1).strip() if benchmark_match else "default"
-
-                # Get rules and extract data
-                rules = self.rule_engine.get_rules_for_benchmark(benchmark)
-                extracted_data = self.data_extractor.extract_data(content, rules, file_info)
-
-                # Transform data
-                processed_result = self.data_transformer.transform_data(extracted_data)
                 results.append(processed_result)
+                if self.result_cache:
+                    self.result_cache.put(file_info, processed_result)
 
                 self.stats['files_processed'] += 1
 
@@ -114,6 +129,8 @@ class ReportOrchestrator:
                 if not self.continue_on_error:
                     raise
 
+        self._close_result_cache()
+
         # Update statistics
         if self.enable_timing:
             self.stats['total_duration'] = time.time() - start_time
@@ -121,14 +138,66 @@ class ReportOrchestrator:
                 self.stats['avg_processing_time'] = sum(file_times) / len(file_times)
 
         # Step 3: Generate output with metadata
-        self.output_generator.generate_output(results, output_path,
-                                             git_branch=git_branch,
-                                             execution_label=execution_label)
+        with timed(self.instrumentation, 'output'):
+            self.output_generator.generate_output(results, output_path,
+                                                 git_branch=git_branch,
+                                                 execution_label=execution_label)
 
         # Print summary
         if self.enable_progress:
             self._print_summary()
     
+    def _process_single_file(self, file_info: FileInfo) -> Optional[ProcessedResult]:
+        """Parse, extract and transform a single file. Returns None if parsing fails."""
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            started = time.perf_counter()
+
+        # Parse content
+        content = self.content_parser.parse_file(file_info)
+        if content is None:
+            return None
+        if instrumentation is not None:
+            parsed = time.perf_counter()
+
+        # Extract benchmark type to get appropriate rules
+        benchmark_match = _BENCHMARK_PATTERN.search(content)
+        benchmark = benchmark_match.group(1).strip() if benchmark_match else "default"
+
+        # Get rules and extract data
+        rules = self.rule_engine.get_rules_for_benchmark(benchmark)
+        extracted_data = self.data_extractor.extract_data(content, rules, file_info)
+        if instrumentation is not None:
+            extracted = time.perf_counter()
+
+        # Transform data
+        result = self.data_transformer.transform_data(extracted_data)
+        if instrumentation is not None:
+            instrumentation.record_file(str(file_info.path), benchmark, file_info.size, {
+                'parse': parsed - started,
+                'extract': extracted - parsed,
+                'transform': time.perf_counter() - extracted
+            })
+        return result
+
+    def set_instrumentation(self, instrumentation: Optional[PipelineInstrumentation]) -> None:
+        """Attach (or with None, detach) stage timing, also to the output generator."""
+        self.instrumentation = instrumentation
+        if hasattr(self.output_generator, 'instrumentation'):
+            self.output_generator.instrumentation = instrumentation
+
+    def _open_result_cache(self) -> None:
+        """Bind the result cache to the current extractor, transformer and rules."""
+        if self.result_cache:
+            fingerprint = compute_pipeline_fingerprint(
+                self.data_extractor, self.data_transformer, self.rule_engine
+            )
+            self.result_cache.open(fingerprint)
+
+    def _close_result_cache(self) -> None:
+        if self.result_cache:
+            self.result_cache.close()
+
     def _print_summary(self):
         """Print processing summary."""
         print(f"\n{'='*60}")
@@ -146,11 +215,38 @@ class ReportOrchestrator:
             print(f"Total duration: {self.stats['total_duration']:.2f} seconds")
             print(f"Average processing time: {self.stats['avg_processing_time']*1000:.1f} ms/file")
         
+        if self.result_cache:
+            cache_stats = self.result_cache.get_statistics()
+            print(f"Result cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                  f"{cache_stats['invalidated']} invalidated")
+        
+        if hasattr(self.content_parser, 'get_cache_stats'):
+            parser_stats = self.content_parser.get_cache_stats()
+            if 'hits' in parser_stats:
+                print(f"Parser cache: {parser_stats['hits']} hits, {parser_stats['misses']} misses, "
+                      f"{parser_stats['evictions']} evictions, "
+                      f"{parser_stats['memory_usage_estimate'] / (1024 * 1024):.1f} MB held")
+        
+        manifest_stats = getattr(self.file_discovery, 'manifest_statistics', None)
+        if manifest_stats:
+            print(f"Discovery manifest: {manifest_stats['dirs_reused']} directories reused, "
+                  f"{manifest_stats['dirs_scanned']} listed")
+        
+        if self.instrumentation is not None:
+            self.instrumentation.print_summary()
+        
         print(f"{'='*60}")
     
     def get_statistics(self) -> dict:
         """Get current processing statistics."""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        if self.result_cache:
+            stats['result_cache'] = self.result_cache.get_statistics()
+        if hasattr(self.content_parser, 'get_cache_stats'):
+            stats['parser_cache'] = self.content_parser.get_cache_stats()
+        if self.instrumentation is not None:
+            stats['timings'] = self.instrumentation.get_report()
+        return stats
     
     def reset_statistics(self):
         """Reset processing statistics."""
@@ -161,6 +257,8 @@ class ReportOrchestrator:
             'total_duration': 0.0,
             'avg_processing_time': 0.0
         }
+        if self.instrumentation is not None:
+            self.instrumentation.reset()
     
     def configure(self, **options):
         """Configure orchestrator options."""
@@ -180,8 +278,13 @@ class BatchReportOrchestrator(ReportOrchestrator):
     
     def generate_batch_reports(self, directories: List[str], 
                              file_pattern: str = "result-summary.txt",
-                             output_prefix: str = "batch") -> None:
-        """Generate reports for multiple directories."""
+                             output_prefix: str = "batch",
+                             merged_output: Optional[str] = None) -> None:
+        """Generate reports for multiple directories.
+
+        With merged_output set, the per-directory reports are afterwards
+        merged (see ReportMerger) into one report at that path.
+        """
         print(f"Starting batch processing for {len(directories)} directories...")
         
         for i, directory in enumerate(directories):
@@ -208,6 +311,19 @@ class BatchReportOrchestrator(ReportOrchestrator):
             self.reset_statistics()
         
         self._generate_batch_summary(output_prefix)
+        if merged_output:
+            self._merge_batch_reports(merged_output)
+    
+    def _merge_batch_reports(self, merged_output: str) -> None:
+        """Merge the reports of the successful directories into merged_output."""
+        sources = [r['output_file'] for r in self.batch_results.values()
+                   if r['status'] == 'success' and os.path.exists(r['output_file'])]
+        if not sources:
+            print("No batch reports to merge")
+            return
+        merger = ReportMerger(self.output_generator)
+        merger.enable_progress = self.enable_progress
+        merger.merge(sources, merged_output)
     
     def _generate_batch_summary(self, output_prefix: str):
         """Generate a summary of batch processing results."""
@@ -230,30 +346,48 @@ class BatchReportOrchestrator(ReportOrchestrator):
 
 
 class ParallelReportOrchestrator(ReportOrchestrator):
-    """Orchestrator with parallel processing capabilities."""
-    
-    def __init__(self, *args, max_workers: int = 4, **kwargs):
+    """Orchestrator with parallel processing capabilities.
+
+    Two executors are supported:
+      - 'thread':  ThreadPoolExecutor, one task per file. Cheap to start, but the
+                   regex-heavy extraction is serialized by the GIL.
+      - 'process': ProcessPoolExecutor, files are submitted in chunks and each
+                   worker returns its chunk of results in one pickled payload.
+    """
+
+    EXECUTORS = ('thread', 'process')
+
+    def __init__(self, *args, max_workers: int = 4, executor: str = 'thread',
+                 chunk_size: Optional[int] = None, **kwargs):
         super().__init__(*args, **kwargs)
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {self.EXECUTORS}")
         self.max_workers = max_workers
+        self.executor = executor
+        self.chunk_size = chunk_size
     
     def generate_report(self, root_path: str = ".", 
                        file_pattern: str = "result-summary.txt",
-                       output_path: str = "summary-all.json") -> None:
+                       output_path: str = "summary-all.json",
+                       git_branch: str = None,
+                       execution_label: str = None) -> None:
         """Generate report with parallel file processing."""
         try:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
+            from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
         except ImportError:
             print("Warning: concurrent.futures not available, falling back to sequential processing")
-            super().generate_report(root_path, file_pattern, output_path)
+            super().generate_report(root_path, file_pattern, output_path,
+                                    git_branch=git_branch, execution_label=execution_label)
             return
         
         start_time = time.time() if self.enable_timing else None
         
         if self.enable_progress:
-            print(f"Starting parallel report generation (workers: {self.max_workers})...")
+            print(f"Starting parallel report generation (workers: {self.max_workers}, executor: {self.executor})...")
         
         # Step 1: Discover files
-        files = self.file_discovery.discover_files(root_path, file_pattern)
+        with timed(self.instrumentation, 'discovery'):
+            files = self.file_discovery.discover_files(root_path, file_pattern)
         self.stats['files_discovered'] = len(files)
         
         if self.enable_progress:
@@ -263,10 +397,41 @@ class ParallelReportOrchestrator(ReportOrchestrator):
             print("No files found!")
             return
         
-        results = []
+        # Step 2: Take unchanged files from the cache, process the rest in parallel
+        self._open_result_cache()
+        cached_results, pending_files = self._lookup_cached_results(files)
+
+        if not pending_files:
+            processed = []
+        elif self.executor == 'process':
+            processed = self._process_files_in_processes(pending_files, ProcessPoolExecutor)
+        else:
+            processed = self._process_files_in_threads(pending_files, ThreadPoolExecutor, as_completed)
+
+        results = self._merge_cached_results(files, cached_results, pending_files, processed)
+        self._close_result_cache()
         
-        # Step 2: Process files in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Update timing
+        if self.enable_timing:
+            self.stats['total_duration'] = time.time() - start_time
+            if self.stats['files_processed']:
+                self.stats['avg_processing_time'] = self.stats['total_duration'] / self.stats['files_processed']
+        
+        # Step 3: Generate output
+        with timed(self.instrumentation, 'output'):
+            self.output_generator.generate_output(results, output_path,
+                                                 git_branch=git_branch,
+                                                 execution_label=execution_label)
+        
+        # Print summary
+        if self.enable_progress:
+            self._print_summary()
+
+    def _process_files_in_threads(self, files: List[FileInfo], executor_class, as_completed) -> List[ProcessedResult]:
+        """Process files with one thread-pool task per file."""
+        results = []
+
+        with executor_class(max_workers=self.max_workers) as executor:
             # Submit all file processing tasks
             future_to_file = {
                 executor.submit(self._process_single_file, file_info): file_info 
@@ -291,39 +456,424 @@ class ParallelReportOrchestrator(ReportOrchestrator):
                     if not self.continue_on_error:
                         raise
                 
-                # Progress update
-                if self.enable_progress and len(files) > 10:
-                    completed = self.stats['files_processed'] + self.stats['files_failed']
-                    if completed % max(1, len(files) // 10) == 0:
-                        print(f"Completed {completed}/{len(files)} files...")
-        
+                self._report_progress(len(files))
+
+        return results
+
+    def _process_files_in_processes(self, files: List[FileInfo], executor_class) -> List[ProcessedResult]:
+        """Process files in worker processes, submitting them in chunks.
+
+        The parse/extract/transform components are handed to each worker once,
+        through the pool initializer, instead of being pickled with every task.
+        Results are returned in discovery order.
+        """
+        chunk_size = self.chunk_size or self._default_chunk_size(len(files))
+        indexed_files = list(enumerate(files))
+        chunks = [
+            indexed_files[start:start + chunk_size]
+            for start in range(0, len(indexed_files), chunk_size)
+        ]
+        pipeline = _FilePipeline(self.content_parser, self.rule_engine,
+                                 self.data_extractor, self.data_transformer, self.instrumentation)
+
+        ordered = [None] * len(files)
+        with executor_class(max_workers=self.max_workers,
+                            initializer=_init_process_worker,
+                            initargs=(pipeline,)) as executor:
+            for batch, timings in executor.map(_process_file_batch, chunks):
+                if timings:
+                    self.instrumentation.record_files(timings)
+                for index, packed, error in batch:
+                    if error is not None:
+                        self.stats['files_failed'] += 1
+                        if self.enable_progress:
+                            print(f"Error processing {files[index].path}: {error}")
+                        if not self.continue_on_error:
+                            raise Exception(f"Failed to process {files[index].path}: {error}")
+                    elif packed is None:
+                        self.stats['files_failed'] += 1
+                    else:
+                        ordered[index] = ProcessedResult(*packed)
+                        self.stats['files_processed'] += 1
+
+                    self._report_progress(len(files))
+
+        return [result for result in ordered if result is not None]
+
+    def _lookup_cached_results(self, files: List[FileInfo]) -> Tuple[Dict[int, ProcessedResult], List[FileInfo]]:
+        """Split files into cached results (by discovery index) and files still to process."""
+        if not self.result_cache:
+            return {}, files
+
+        cached_results = {}
+        pending_files = []
+        for index, file_info in enumerate(files):
+            result = self.result_cache.get(file_info)
+            if result is None:
+                pending_files.append(file_info)
+            else:
+                cached_results[index] = result
+                self.stats['files_processed'] += 1
+        return cached_results, pending_files
+
+    def _merge_cached_results(self, files: List[FileInfo], cached_results: Dict[int, ProcessedResult],
+                              pending_files: List[FileInfo],
+                              processed: List[ProcessedResult]) -> List[ProcessedResult]:
+        """Store freshly processed results and merge them with cached ones in discovery order."""
+        if not self.result_cache:
+            return processed
+
+        pending_by_path = {str(file_info.path): file_info for file_info in pending_files}
+        order = {str(file_info.path): index for index, file_info in enumerate(files)}
+        for result in processed:
+            file_info = pending_by_path.get(result.regulus_data)
+            if file_info is not None:
+                self.result_cache.put(file_info, result)
+
+        merged = list(cached_results.items())
+        merged.extend((order.get(result.regulus_data, len(files)), result) for result in processed)
+        merged.sort(key=lambda item: item[0])
+        return [result for _, result in merged]
+
+    def _default_chunk_size(self, total_files: int) -> int:
+        """Aim for ~4 chunks per worker so slow files do not leave workers idle."""
+        return max(1, min(64, total_files // (self.max_workers * 4)))
+
+    def _report_progress(self, total_files: int) -> None:
+        """Print a progress line roughly every 10% of completed files."""
+        if self.enable_progress and total_files > 10:
+            completed = self.stats['files_processed'] + self.stats['files_failed']
+            if completed % max(1, total_files // 10) == 0:
+                print(f"Completed {completed}/{total_files} files...")
+
+
+class PipelinedReportOrchestrator(ReportOrchestrator):
+    """Orchestrator that overlaps discovery, processing and output generation.
+
+    A discovery thread yields FileInfo objects while the tree is still being
+    walked, a thread or process pool processes each file as soon as it is
+    found, and finished results are passed to the output generator in
+    discovery order while later files are still in flight. Output generators
+    with begin_output()/add_result()/finish_output() write results as they
+    arrive; any other generator gets the full list at the end.
+
+    The result cache is only touched from the calling thread.
+    """
+
+    EXECUTORS = ('thread', 'process')
+
+    def __init__(self, *args, max_workers: int = 4, executor: str = 'thread',
+                 chunk_size: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {self.EXECUTORS}")
+        self.max_workers = max_workers
+        self.executor = executor
+        # Upper bound on files per process-pool task; smaller batches are sent
+        # whenever discovery has nothing new queued
+        self.chunk_size = chunk_size or 16
+
+    def generate_report(self, root_path: str = ".",
+                       file_pattern: str = "result-summary.txt",
+                       output_path: str = "summary-all.json",
+                       git_branch: str = None,
+                       execution_label: str = None) -> None:
+        """Generate report with discovery, processing and output overlapped."""
+        start_time = time.time() if self.enable_timing else None
+
+        if self.enable_progress:
+            print(f"Starting pipelined report generation (workers: {self.max_workers}, executor: {self.executor})...")
+
+        self._streaming_output = hasattr(self.output_generator, 'begin_output')
+        self._output_started = False
+        self._output_failed = False
+        self._collected_results = []
+
+        self._open_result_cache()
+        try:
+            self._run_pipeline(root_path, file_pattern, output_path, git_branch, execution_label)
+        except BaseException:
+            if self._output_started and self._streaming_output:
+                self.output_generator.abort_output()
+            raise
+        finally:
+            self._close_result_cache()
+
+        if not self.stats['files_discovered']:
+            print("No files found!")
+            return
+
         # Update timing
         if self.enable_timing:
             self.stats['total_duration'] = time.time() - start_time
-        
-        # Step 3: Generate output
-        self.output_generator.generate_output(results, output_path)
-        
+            if self.stats['files_processed']:
+                self.stats['avg_processing_time'] = self.stats['total_duration'] / self.stats['files_processed']
+
+        # Complete the output
+        with timed(self.instrumentation, 'output'):
+            if self._streaming_output:
+                if not self._output_failed:
+                    self.output_generator.finish_output()
+            else:
+                self.output_generator.generate_output(self._collected_results, output_path,
+                                                     git_branch=git_branch,
+                                                     execution_label=execution_label)
+        self._collected_results = []
+
         # Print summary
         if self.enable_progress:
             self._print_summary()
-    
-    def _process_single_file(self, file_info) -> ProcessedResult:
-        """Process a single file (for parallel execution)."""
-        # Parse content
-        content = self.content_parser.parse_file(file_info)
-        if content is None:
-            return None
-        
-        # Extract benchmark type to get appropriate rules
-        benchmark_match = re.search(r"benchmark:\s*(.+)", content)
-        benchmark = benchmark_match.group(1).strip() if benchmark_match else "default"
-        
-        # Get rules and extract data
-        rules = self.rule_engine.get_rules_for_benchmark(benchmark)
-        extracted_data = self.data_extractor.extract_data(content, rules, file_info)
-        
-        # Transform data
-        processed_result = self.data_transformer.transform_data(extracted_data)
-        return processed_result
 
+    def _run_pipeline(self, root_path: str, file_pattern: str, output_path: str,
+                      git_branch: str, execution_label: str) -> None:
+        """Drive the pipeline until every discovered file has been emitted."""
+        events = queue.Queue()
+        stop_discovery = threading.Event()
+        discovery_thread = threading.Thread(
+            target=self._discover_into_queue,
+            args=(root_path, file_pattern, events, stop_discovery),
+            name="report-discovery",
+            daemon=True
+        )
+
+        executor = self._create_executor()
+        batch_size = 1 if self.executor == 'thread' else self.chunk_size
+        batch = []
+        batches_in_flight = {}
+        completed = {}  # discovery index -> result (None if failed), until emitted
+        next_index = 0
+        discovery_done = False
+        discovery_error = None
+
+        discovery_thread.start()
+        try:
+            while True:
+                # Submit queued files once the batch is full or nothing else is waiting
+                if batch and (discovery_done or len(batch) >= batch_size or events.empty()):
+                    self._submit_batch(executor, batch, batches_in_flight, events)
+                    batch = []
+
+                if discovery_done and not batches_in_flight:
+                    break
+
+                kind, payload = events.get()
+                if kind == 'file':
+                    index, file_info = payload
+                    self.stats['files_discovered'] += 1
+                    if not self._output_started:
+                        self._begin_output(output_path, git_branch, execution_label)
+
+                    # Reuse the cached result of an unchanged file
+                    cached_result = self.result_cache.get(file_info) if self.result_cache else None
+                    if cached_result is not None:
+                        completed[index] = cached_result
+                        self.stats['files_processed'] += 1
+                    else:
+                        batch.append((index, file_info))
+
+                elif kind == 'done':
+                    discovery_done = True
+                    if self.enable_progress:
+                        print(f"Discovered {self.stats['files_discovered']} files")
+
+                elif kind == 'error':
+                    discovery_error = payload
+                    break
+
+                else:
+                    files = batches_in_flight.pop(payload)
+                    for index, result in self._collect_batch(payload, files, discovery_done):
+                        completed[index] = result
+
+                next_index = self._emit_in_order(completed, next_index)
+        finally:
+            stop_discovery.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            discovery_thread.join()
+
+        # A failed discovery must not end in a report of the files found before the failure
+        if discovery_error is not None:
+            raise discovery_error
+
+    def _discover_into_queue(self, root_path: str, file_pattern: str,
+                             events: "queue.Queue", stop_discovery: threading.Event) -> None:
+        """Discovery thread: queue each file as it is found, then a 'done' marker (or the error)."""
+        try:
+            with timed(self.instrumentation, 'discovery'):
+                if hasattr(self.file_discovery, 'iter_files'):
+                    files = self.file_discovery.iter_files(root_path, file_pattern)
+                else:
+                    files = self.file_discovery.discover_files(root_path, file_pattern)
+                for index, file_info in enumerate(files):
+                    if stop_discovery.is_set():
+                        break
+                    events.put(('file', (index, file_info)))
+        except Exception as e:
+            events.put(('error', e))
+        else:
+            events.put(('done', None))
+
+    def _create_executor(self):
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+        if self.executor == 'process':
+            pipeline = _FilePipeline(self.content_parser, self.rule_engine,
+                                     self.data_extractor, self.data_transformer, self.instrumentation)
+            executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                           initializer=_init_process_worker,
+                                           initargs=(pipeline,))
+            # Workers start on the first submit. Under fork they must be forked
+            # now, while this is the only thread, not once discovery is running.
+            executor.submit(_start_process_worker)
+            return executor
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _submit_batch(self, executor, batch: List[Tuple[int, FileInfo]],
+                      batches_in_flight: dict, events: "queue.Queue") -> None:
+        """Submit a batch and have its completion queued as an event."""
+        if self.executor == 'process':
+            future = executor.submit(_process_file_batch, batch)
+        else:
+            future = executor.submit(self._process_file_batch_in_thread, batch)
+        batches_in_flight[future] = batch
+        future.add_done_callback(lambda done: events.put(('batch', done)))
+
+    def _process_file_batch_in_thread(self, batch: List[Tuple[int, FileInfo]]) -> tuple:
+        """Thread-pool counterpart of _process_file_batch, without packing.
+
+        File timings go straight to the shared instrumentation.
+        """
+        processed = []
+        for index, file_info in batch:
+            try:
+                processed.append((index, self._process_single_file(file_info), None))
+            except Exception as e:
+                processed.append((index, None, str(e)))
+        return processed, None
+
+    def _collect_batch(self, future, files: List[Tuple[int, FileInfo]],
+                       discovery_done: bool) -> List[Tuple[int, Optional[ProcessedResult]]]:
+        """Turn a finished batch into (index, result) pairs, updating stats and the cache."""
+        try:
+            processed, timings = future.result()
+            if timings:
+                self.instrumentation.record_files(timings)
+        except Exception as e:
+            processed = [(index, None, str(e)) for index, _ in files]
+
+        file_infos = dict(files)
+        collected = []
+        for index, result, error in processed:
+            file_info = file_infos[index]
+            if error is not None:
+                self.stats['files_failed'] += 1
+                if self.enable_progress:
+                    print(f"Error processing {file_info.path}: {error}")
+                if not self.continue_on_error:
+                    raise Exception(f"Failed to process {file_info.path}: {error}")
+                result = None
+            elif result is None:
+                self.stats['files_failed'] += 1
+                if not self.continue_on_error:
+                    raise Exception(f"Failed to parse {file_info.path}")
+            else:
+                if self.executor == 'process':
+                    result = ProcessedResult(*result)
+                if self.result_cache:
+                    self.result_cache.put(file_info, result)
+                self.stats['files_processed'] += 1
+            collected.append((index, result))
+            self._report_pipeline_progress(discovery_done)
+        return collected
+
+    def _begin_output(self, output_path: str, git_branch: str, execution_label: str) -> None:
+        self._output_started = True
+        if self._streaming_output:
+            with timed(self.instrumentation, 'output'):
+                self.output_generator.begin_output(output_path, git_branch=git_branch,
+                                                   execution_label=execution_label)
+
+    def _emit_in_order(self, completed: Dict[int, Optional[ProcessedResult]], next_index: int) -> int:
+        """Pass every result that is next in discovery order to the output."""
+        while next_index in completed:
+            result = completed.pop(next_index)
+            next_index += 1
+            if result is None:
+                continue
+            if not self._streaming_output:
+                self._collected_results.append(result)
+            elif not self._output_failed:
+                try:
+                    with timed(self.instrumentation, 'output'):
+                        self.output_generator.add_result(result)
+                except Exception as e:
+                    print(f"Error generating output: {e}")
+                    self.output_generator.abort_output()
+                    self._output_failed = True
+        return next_index
+
+    def _report_pipeline_progress(self, discovery_done: bool) -> None:
+        """Print a progress line every 10% once the total is known, every 100 files before."""
+        if not self.enable_progress:
+            return
+        completed = self.stats['files_processed'] + self.stats['files_failed']
+        total = self.stats['files_discovered']
+        if discovery_done:
+            if total > 10 and completed % max(1, total // 10) == 0:
+                print(f"Completed {completed}/{total} files...")
+        elif completed % 100 == 0:
+            print(f"Completed {completed} files ({total} discovered so far)...")
+
+
+class _FilePipeline:
+    """The per-file stages of the orchestrator, shipped once to each worker process."""
+
+    def __init__(self, content_parser, rule_engine, data_extractor, data_transformer, instrumentation=None):
+        self.content_parser = content_parser
+        self.rule_engine = rule_engine
+        self.data_extractor = data_extractor
+        self.data_transformer = data_transformer
+        # Replaced by an empty copy in each worker, whose file timings are
+        # returned with every batch
+        self.instrumentation = instrumentation
+
+    _process_single_file = ReportOrchestrator._process_single_file
+
+
+_worker_pipeline: Optional[_FilePipeline] = None
+
+
+def _init_process_worker(pipeline: _FilePipeline) -> None:
+    """Process pool initializer: keep the pipeline for every batch this worker runs."""
+    global _worker_pipeline
+    if pipeline.instrumentation is not None:
+        pipeline.instrumentation = pipeline.instrumentation.worker_copy()
+    _worker_pipeline = pipeline
+
+
+def _start_process_worker() -> None:
+    """No-op task submitted to start a process pool's workers."""
+
+
+def _process_file_batch(batch: List[Tuple[int, FileInfo]]) -> tuple:
+    """Process a chunk of (index, FileInfo) pairs inside a worker process.
+
+    Returns ([(index, packed result, error), ...], file timings or None).
+    Each ProcessedResult is packed as a plain tuple of its fields; the whole
+    batch is pickled in one go so objects shared between results (e.g. key_tags)
+    are only serialized once.
+    """
+    packed = []
+    for index, file_info in batch:
+        try:
+            result = _worker_pipeline._process_single_file(file_info)
+            packed.append((index, _pack_result(result) if result is not None else None, None))
+        except Exception as e:
+            packed.append((index, None, str(e)))
+    instrumentation = _worker_pipeline.instrumentation
+    return packed, instrumentation.drain_files() if instrumentation is not None else None
+
+
+def _pack_result(result: ProcessedResult) -> tuple:
+    """Return the dataclass fields of a ProcessedResult as a tuple, without deep-copying."""
+    return (result.regulus_data, result.benchmark, result.data, result.processing_metadata)
@@ -0,0 +1,197 @@
+"""
+Merging of previously generated reports.
+
+Combines JSON reports (report.json, batch_N_summary.json, reports copied
+from other lab controllers) and result cache directories into one report,
+without reading any result-summary.txt again. Each report entry is turned
+back into the ProcessedResult it was written from and streamed to the
+output generator, which recomputes generation_info, the benchmark
+definitions and summaries, and the validation report as the results pass.
+The cost is proportional to the size of the merged output, not to the raw
+text behind it.
+
+A result is dropped as a duplicate when its run_id was already merged, or,
+for results without a run_id, when all its iteration_ids were (or, with no
+iterations either, its benchmark and file path). Sources are read in the
+order given, so the first copy of a run wins.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..interfaces.protocols import OutputGeneratorInterface
+from ..models.data_models import ProcessedResult
+from ..cache.result_cache import ResultCache
+
+
+# Keys SchemaAwareOutputGenerator._enhance_result_data() adds to every result
+_ENHANCED_KEYS = ('processing_status', 'file_metadata', 'extraction_metadata')
+
+
+class ReportMerger:
+    """Merges JSON reports and result caches into one report."""
+
+    def __init__(self, output_generator: OutputGeneratorInterface):
+        self.output_generator = output_generator
+        self.enable_progress = True
+        self.reset_statistics()
+
+    def reset_statistics(self) -> None:
+        self.stats = {
+            'sources_merged': 0,
+            'sources_failed': 0,
+            'results_read': 0,
+            'results_merged': 0,
+            'duplicates_dropped': 0,
+            'total_duration': 0.0
+        }
+
+    def merge(self, sources: List[str], output_path: str,
+              git_branch: str = None, execution_label: str = None) -> Dict[str, Any]:
+        """Merge sources (JSON report files or result cache directories) into output_path.
+
+        Returns the merge statistics.
+        """
+        start_time = time.time()
+        self.reset_statistics()
+
+        written = self._output_files(output_path)
+        for source in sources:
+            if Path(source).resolve() in written:
+                print(f"Error: {source} would be overwritten by the merged report; choose another --output")
+                return self.stats
+
+        if self.enable_progress:
+            print(f"Merging {len(sources)} sources...")
+
+        results = self.iter_results(sources)
+        if hasattr(self.output_generator, 'begin_output'):
+            self.output_generator.begin_output(output_path, git_branch=git_branch,
+                                               execution_label=execution_label)
+            try:
+                for result in results:
+                    self.output_generator.add_result(result)
+            except BaseException:
+                self.output_generator.abort_output()
+                raise
+            self.output_generator.finish_output()
+        else:
+            self.output_generator.generate_output(list(results), output_path,
+                                                  git_branch=git_branch,
+                                                  execution_label=execution_label)
+
+        self.stats['total_duration'] = time.time() - start_time
+        if self.enable_progress:
+            self._print_summary()
+        return self.stats
+
+    def iter_results(self, sources: List[str]) -> Iterator[ProcessedResult]:
+        """The results of all sources, in order, without duplicates."""
+        seen_runs: Set[str] = set()
+        seen_iterations: Set[str] = set()
+        seen_files: Set[Tuple[str, str]] = set()
+
+        for source in sources:
+            try:
+                source_results = self._read_source(source)
+                for result in source_results:
+                    self.stats['results_read'] += 1
+                    if self._is_duplicate(result, seen_runs, seen_iterations, seen_files):
+                        self.stats['duplicates_dropped'] += 1
+                        continue
+                    self.stats['results_merged'] += 1
+                    yield result
+                self.stats['sources_merged'] += 1
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Error reading {source}: {e}")
+                self.stats['sources_failed'] += 1
+
+    def _read_source(self, source: str) -> Iterator[ProcessedResult]:
+        """Results of one JSON report or result cache directory."""
+        path = Path(source)
+        if path.is_dir():
+            cache = ResultCache(str(path))
+            if not cache.db_path.exists():
+                raise ValueError("not a JSON report or a result cache directory")
+            return cache.iter_results()
+
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        if not isinstance(report, dict) or not isinstance(report.get('results'), list):
+            raise ValueError("no results array; not a report")
+        return (result_from_report_entry(entry) for entry in report['results'])
+
+    def _is_duplicate(self, result: ProcessedResult, seen_runs: Set[str],
+                      seen_iterations: Set[str], seen_files: Set[Tuple[str, str]]) -> bool:
+        """Check result against everything merged so far, and remember it if it is new."""
+        run_id = result.data.get('run_id')
+        if run_id:
+            if run_id in seen_runs:
+                return True
+            seen_runs.add(run_id)
+            seen_iterations.update(_iteration_ids(result))
+            return False
+
+        iteration_ids = _iteration_ids(result)
+        if iteration_ids:
+            if seen_iterations.issuperset(iteration_ids):
+                return True
+            seen_iterations.update(iteration_ids)
+            return False
+
+        key = (result.benchmark, result.regulus_data)
+        if key in seen_files:
+            return True
+        seen_files.add(key)
+        return False
+
+    def _output_files(self, output_path: str) -> Set[Path]:
+        """Files the output generator may write for output_path."""
+        base = Path(output_path)
+        formats = getattr(self.output_generator, 'enabled_formats', ['json'])
+        files = {(base.parent / f"{base.stem}.{fmt}").resolve() for fmt in formats}
+        files.add(base.resolve())
+        return files
+
+    def _print_summary(self) -> None:
+        print("=" * 60)
+        print("MERGE SUMMARY")
+        print("=" * 60)
+        print(f"Sources merged: {self.stats['sources_merged']}")
+        print(f"Sources failed: {self.stats['sources_failed']}")
+        print(f"Results read: {self.stats['results_read']}")
+        print(f"Results merged: {self.stats['results_merged']}")
+        print(f"Duplicates dropped: {self.stats['duplicates_dropped']}")
+        print(f"Total duration: {self.stats['total_duration']:.2f} seconds")
+        print("=" * 60)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return self.stats.copy()
+
+
+def result_from_report_entry(entry: Dict[str, Any]) -> ProcessedResult:
+    """Rebuild the ProcessedResult a report entry was written from.
+
+    Inverse of SchemaAwareOutputGenerator._enhance_result_data(): writing the
+    returned result again produces the same entry.
+    """
+    data = {key: value for key, value in entry.items() if key not in _ENHANCED_KEYS}
+    processing_metadata: Dict[str, Any] = {'status': entry.get('processing_status', 'success')}
+    extraction_metadata: Optional[Dict[str, Any]] = entry.get('extraction_metadata')
+    if isinstance(extraction_metadata, dict) and 'rules_applied' in extraction_metadata:
+        processing_metadata['extraction_metadata'] = {'rules_applied': extraction_metadata['rules_applied']}
+    return ProcessedResult(
+        regulus_data=data.get('regulus_data', ''),
+        benchmark=data.get('benchmark', 'unknown'),
+        data=data,
+        processing_metadata=processing_metadata
+    )
+
+
+def _iteration_ids(result: ProcessedResult) -> List[str]:
+    iterations = result.data.get('iterations')
+    if not isinstance(iterations, list):
+        return []
+    return [it['iteration_id'] for it in iterations if isinstance(it, dict) and it.get('iteration_id')]
@@ -0,0 +1,347 @@
+"""
+CSV output generator (one row per iteration).
+"""
+
+import csv
+import gzip
+import os
+from typing import Dict, List, Optional, Iterable
+from pathlib import Path
+
+from ..extraction.data_extractor import KNOWN_PARAM_KEYS, RESULT_KEYS
+from ..models.data_models import ProcessedResult
+
+
+class CsvOutputGenerator:
+    """CSV output generator for tabular data export - iteration level.
+
+    The header is the standard columns followed by the known_columns (the
+    parameter and result keys the extractor produces) and any other keys of
+    the results, sorted. Rows can also be written as results arrive
+    (begin_output/add_result/finish_output): the header is then written with
+    the first result, from its keys and the known columns. Only a column that
+    is in neither makes finish_output() rewrite the file once with the final
+    header, moving the rows written so far through a spill file; the output
+    is the same as generate_output() would write for the same results.
+    compress=True writes <output>.csv.gz.
+    """
+
+    # Standard columns in desired order
+    STANDARD_HEADERS = [
+        'file',           # First
+        'benchmark',     #  skip 'status',
+        'model',          # Move model/offload/cpu up
+        'perf',
+        'config',
+        'cpu',
+        'test_type',
+        'threads',
+        'wsize',
+        'rsize',
+        'samples',
+        'mean',
+        'unit',
+        'busyCPU',
+        'stddev%',
+        'iteration_id',
+        'protocol'        # Last
+    ]
+
+    # Result fields that never become columns
+    EXCLUDED_FIELDS = ('type', 'sample_values', 'sample_count', 'range', 'sample_stats')
+
+    # Extra columns in every header: the keys the extractor produces
+    KNOWN_COLUMNS = KNOWN_PARAM_KEYS + RESULT_KEYS
+    
+    def __init__(self, delimiter: str = ',', include_metadata: bool = False, base_url: str = '',
+                 compress: bool = False, known_columns: Optional[Iterable[str]] = None):
+        self.delimiter = delimiter
+        self.include_metadata = include_metadata
+        self.base_url = base_url
+        self.compress = compress
+        self.known_columns = tuple(known_columns) if known_columns is not None else self.KNOWN_COLUMNS
+        self._stream = None
+
+    def _get_param_value(self, param_name: str, unique_params: dict, common_params: dict):
+        """Get parameter value: check unique_params first, then fall back to common_params."""
+        return unique_params.get(param_name) or common_params.get(param_name)
+    
+    def generate_output(self, results: List[ProcessedResult], output_path: str) -> None:
+        """Generate CSV output file with one row per iteration."""
+        if not results:
+            print("No results to export to CSV")
+            return
+        
+        try:
+            self.begin_output(output_path, results=results)
+            for result in results:
+                self.add_result(result)
+            self.finish_output()
+        except Exception as e:
+            self.abort_output()
+            print(f"Error generating CSV output: {e}")
+
+    def begin_output(self, output_path: str, results: Optional[List[ProcessedResult]] = None) -> None:
+        """Open the CSV file.
+
+        With the full result list the header is written now and is final;
+        otherwise add_result() writes it with the first result.
+        """
+        self.abort_output()
+        if self.compress and not output_path.endswith('.gz'):
+            output_path += '.gz'
+
+        f = self._open(output_path, 'w')
+        writer = csv.writer(f, delimiter=self.delimiter)
+        headers = None
+        if results is not None:
+            headers = self._generate_headers(results)
+            writer.writerow(headers)
+        self._stream = {
+            'file': f,
+            'writer': writer,
+            'output_path': output_path,
+            'headers': headers,
+            'columns': set(),
+            'rows': 0
+        }
+
+    def add_result(self, result: ProcessedResult) -> None:
+        """Write the rows of one result."""
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("begin_output() must be called before add_result()")
+
+        columns = self._result_columns(result)
+        if stream['headers'] is None:
+            stream['headers'] = self._headers_for_columns(columns)
+            stream['writer'].writerow(stream['headers'])
+        stream['columns'].update(columns)
+        rows = self._result_to_rows(result, stream['headers'])
+        stream['writer'].writerows(rows)
+        stream['rows'] += len(rows)
+
+    def finish_output(self) -> None:
+        """Close the file, rewriting it if columns turned up after the header was written."""
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("begin_output() must be called before finish_output()")
+        self._stream = None
+        stream['file'].close()
+
+        output_path = stream['output_path']
+        if not stream['rows']:
+            os.remove(output_path)
+            print("No results to export to CSV")
+            return
+
+        late_columns = stream['columns'].difference(stream['headers'], self.EXCLUDED_FIELDS)
+        if late_columns:
+            self._rewrite_headers(output_path, stream['headers'], self._headers_for_columns(stream['columns']))
+        print(f"CSV output generated: {output_path}")
+
+    def abort_output(self) -> None:
+        """Close a partially written file, if any."""
+        if self._stream is not None:
+            self._stream['file'].close()
+            self._stream = None
+
+    def _open(self, path: str, mode: str):
+        if self.compress:
+            return gzip.open(path, mode + 't', newline='', encoding='utf-8')
+        return open(path, mode, newline='', encoding='utf-8')
+
+    def _rewrite_headers(self, output_path: str, old_headers: List[str], headers: List[str]) -> None:
+        """Rewrite output_path with a new header, moving values to their new columns."""
+        spill_path = output_path + '.spill'
+        os.replace(output_path, spill_path)
+        try:
+            positions = [old_headers.index(h) if h in old_headers else None for h in headers]
+            with self._open(spill_path, 'r') as src, self._open(output_path, 'w') as dst:
+                reader = csv.reader(src, delimiter=self.delimiter)
+                writer = csv.writer(dst, delimiter=self.delimiter)
+                next(reader)
+                writer.writerow(headers)
+                writer.writerows([row[p] if p is not None else '' for p in positions] for row in reader)
+        finally:
+            os.remove(spill_path)
+    
+    def _generate_headers(self, results: List[ProcessedResult]) -> List[str]:
+        """Generate CSV headers from iteration data."""
+        all_keys = set()
+        for result in results:
+            all_keys.update(self._result_columns(result))
+        return self._headers_for_columns(all_keys)
+
+    def _result_columns(self, result: ProcessedResult) -> set:
+        """Keys of a result that can become columns: iteration params and result fields."""
+        keys = set()
+        for iteration in result.data.get('iterations', []):
+            unique_params = iteration.get('unique_params', {})
+            keys.update(unique_params.keys())
+
+            # Get result fields
+            iteration_results = iteration.get('results', [])
+            if iteration_results:
+                keys.update(iteration_results[0].keys())
+        return keys
+
+    def _headers_for_columns(self, keys: Iterable[str]) -> List[str]:
+        """Standard headers followed by the known columns and any other keys, sorted."""
+        final_headers = list(self.STANDARD_HEADERS)
+
+        # Add any extra fields not in standard list
+        for key in sorted(set(keys).union(self.known_columns)):
+            if key not in final_headers and key not in self.EXCLUDED_FIELDS:
+                final_headers.append(key)
+
+        return final_headers
+
+    def _result_to_rows(self, result: ProcessedResult, headers: List[str]) -> List[List[str]]:
+        """Convert a result with multiple iterations into multiple CSV rows."""
+        rows = []
+
+        file_name = Path(result.regulus_data).name
+        benchmark = result.benchmark
+        status = result.processing_metadata.get('status', 'unknown')
+
+        # Get file-level common params and tags
+        file_common_params = result.data.get('common_params', {})
+        key_tags = result.data.get('key_tags', {})
+
+        # Config string
+        config = f"{key_tags.get('pods-per-worker', '?')},{key_tags.get('scale_out_factor', '?')},{key_tags.get('topo', '?')}"
+
+        # Get iterations
+        iterations = result.data.get('iterations', [])
+
+        if not iterations:
+            # No iterations - create one row with basic info
+            row = [''] * len(headers)
+            if 'file' in headers:
+                if self.base_url:
+                    full_url = f"{self.base_url}/{result.regulus_data}"
+                    row[headers.index('file')] = f'=HYPERLINK("{full_url}","{file_name}")'
+                else:
+                    row[headers.index('file')] = file_name
+            if 'benchmark' in headers:
+                row[headers.index('benchmark')] = benchmark
+            if 'status' in headers:
+                row[headers.index('status')] = status
+            if 'config' in headers:
+                row[headers.index('config')] = config
+            rows.append(row)
+        else:
+            # One row per iteration
+            for iteration in iterations:
+                row = self._iteration_to_row(
+                    iteration, headers, file_name, benchmark, status,
+                    config, file_common_params, key_tags, result.regulus_data
+                )
+                rows.append(row)
+
+        return rows
+
+    def _iteration_to_row(self, iteration: Dict, headers: List[str], file_name: str, 
+                      benchmark: str, status: str, config: str, 
+                      file_common_params: Dict, key_tags: Dict,
+                      file_path: str = '') -> List[str]:
+        """Convert a single iteration to a CSV row."""
+        row = [''] * len(headers)
+
+        iteration_id = iteration.get('iteration_id', '')
+        unique_params = iteration.get('unique_params', {})
+        iteration_results = iteration.get('results', [])
+
+        # Helper to get param value
+        def get_param(key):
+            return unique_params.get(key) or file_common_params.get(key) or ''
+
+        # Fill in standard columns
+        if 'file' in headers:
+            if self.base_url:
+                full_url = f"{self.base_url}/{file_path}"
+                row[headers.index('file')] = f'=HYPERLINK("{full_url}","{file_name}")'
+            else:
+                row[headers.index('file')] = file_name
+        if 'benchmark' in headers:
+            row[headers.index('benchmark')] = benchmark
+        if 'status' in headers:
+            row[headers.index('status')] = status
+        if 'config' in headers:
+            row[headers.index('config')] = config
+        if 'iteration_id' in headers:
+            row[headers.index('iteration_id')] = iteration_id[:16]  # Shortened
+
+        # Protocol and test type
+        protocol = get_param('protocol')
+        test_type = get_param('test-type')
+
+        if 'protocol' in headers:
+            row[headers.index('protocol')] = protocol
+
+        if 'test_type' in headers:
+            if test_type and protocol:
+                row[headers.index('test_type')] = f"{protocol}, {test_type}"
+            elif test_type:
+                row[headers.index('test_type')] = test_type
+            elif protocol:
+                row[headers.index('test_type')] = protocol
+        # Check for iperf3 custom/passthru parameters (same as HTML)
+        if benchmark == 'iperf':
+            known_params = {'protocol', 'max-loss-pct', 'bitrate-range', 'length', 'nthreads',
+                        'test-type', 'wsize', 'rsize', 'num_clients', 'ifname', 'ipv', 'time'}
+            has_custom = any(key not in known_params for key in unique_params.keys())
+            if not has_custom:
+                has_custom = any(key not in known_params for key in file_common_params.keys())
+            if has_custom and 'test_type' in headers:
+                current_test_type = row[headers.index('test_type')]
+                if current_test_type:
+                    row[headers.index('test_type')] = f"{current_test_type}, custom"
+        # Other params
+        if 'threads' in headers:
+            threads = self._get_param_value('nthreads', unique_params, file_common_params)
+            row[headers.index('threads')] = threads if threads else ''
+        if 'wsize' in headers:
+            # Try wsize first, then length (for iperf)
+            wsize = self._get_param_value('wsize', unique_params, file_common_params)
+            if not wsize:
+                wsize = self._get_param_value('length', unique_params, file_common_params)
+            row[headers.index('wsize')] = wsize if wsize else ''
+        if 'rsize' in headers:
+            rsize = self._get_param_value('rsize', unique_params, file_common_params)
+            row[headers.index('rsize')] = rsize if rsize else ''
+
+        # Tags
+        if 'model' in headers:
+            row[headers.index('model')] = key_tags.get('model', '')
+        if 'perf' in headers:
+            row[headers.index('perf')] = key_tags.get('perf', '')
+        if 'cpu' in headers:
+            row[headers.index('cpu')] = key_tags.get('cpu', '')
+
+        # Results data
+        if iteration_results and len(iteration_results) > 0:
+            primary_result = iteration_results[0]
+
+            if 'mean' in headers and 'mean' in primary_result:
+                mean = primary_result['mean']
+                row[headers.index('mean')] = f"{mean:.2f}" if isinstance(mean, (int, float)) else str(mean)
+
+            if 'unit' in headers and 'unit' in primary_result:
+                row[headers.index('unit')] = primary_result['unit']
+
+            if 'samples' in headers and 'sample_count' in primary_result:
+                row[headers.index('samples')] = str(primary_result['sample_count'])
+
+            if 'stddev%' in headers and 'stddevpct' in primary_result:
+                stddev = primary_result['stddevpct']
+                if isinstance(stddev, (int, float)) and stddev > 0:
+                    row[headers.index('stddev%')] = f"{stddev:.2f}"
+
+            if 'busyCPU' in headers and 'busyCPU' in primary_result:
+                cpu = primary_result['busyCPU']
+                if isinstance(cpu, (int, float)):
+                    row[headers.index('busyCPU')] = f"{cpu:.2f}"
+
+        return row
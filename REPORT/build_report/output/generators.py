@@ -3,11 +3,14 @@ Output generation implementations. V24
 
 Handles creating various output formats for the processed results.
 Now with full support for multiple iterations and multiple results per iteration.
+
+The JSON generators and the multi-format generators live here; the other
+formats have their own modules (csv_report, xml_report, html_report,
+parquet), which the multi-format generators import through the format
+registry only when the format is enabled.
 """
 
 import json
-import csv
-import xml.etree.ElementTree as ET
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import datetime
@@ -17,6 +20,17 @@ import socket
 from ..interfaces.protocols import OutputGeneratorInterface
 from ..models.data_models import ProcessedResult, SchemaInfo
 from ..schema.schema_manager import SchemaManager
+from .json_stream import JsonStreamWriter
+from .registry import OUTPUT_FORMATS, load_generator_class
+from ..instrumentation.timing import timed
+
+
+def __getattr__(name):
+    """Generator classes that moved to their own modules, imported on first access."""
+    for format_name, (_, class_name) in OUTPUT_FORMATS.items():
+        if class_name == name:
+            return load_generator_class(format_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class JsonOutputGenerator:
@@ -65,62 +79,180 @@ class JsonOutputGenerator:
 
 
 class SchemaAwareOutputGenerator(JsonOutputGenerator):
-    """Output generator with schema awareness and validation."""
+    """Output generator with schema awareness and validation.
+
+    The report is streamed to disk one result at a time and each result is
+    validated on its own, so memory does not grow with the size of the
+    document. Results can be passed as a list to generate_output() or fed
+    incrementally through begin_output()/add_result()/finish_output().
+    """
+    
+    # Cap on validation messages kept in the report's validation_report
+    max_validation_errors = 100
     
-    def __init__(self, schema_manager: SchemaManager, **kwargs):
+    def __init__(self, schema_manager: SchemaManager, compact: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.schema_manager = schema_manager
         self.validate_output = True
+        self.compact = compact
+        self._stream = None
     
     def generate_output(self, results: List[ProcessedResult], output_path: str,
                        git_branch: str = None, execution_label: str = None) -> None:
         """Generate schema-compliant output with validation."""
-        summary = self._build_schema_compliant_summary(results, git_branch, execution_label)
-        
-        # Validate against schema
-        if self.validate_output:
-            is_valid, error_msg = self.schema_manager.validate_report(summary)
-            if not is_valid:
-                print(f"Schema validation failed: {error_msg}")
-                summary["validation_report"] = {
-                    "schema_validation": False,
-                    "validation_errors": [error_msg] if error_msg else [],
-                    "validation_warnings": [],
-                    "data_quality_score": 0.0
-                }
-            else:
-                summary["validation_report"] = {
-                    "schema_validation": True,
-                    "validation_errors": [],
-                    "validation_warnings": [],
-                    "data_quality_score": 1.0
-                }
-        
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=self.indent, ensure_ascii=self.ensure_ascii)
-            print(f"Schema-compliant output generated: {output_path}")
-            
-            # Also export the schema
-            schema_path = output_path.replace('.json', '_schema.json')
-            self.schema_manager.export_schema(schema_path)
-            
+            self.begin_output(output_path, git_branch, execution_label, results=results)
+            for result in results:
+                self.add_result(result)
+            self.finish_output()
         except Exception as e:
+            self.abort_output()
             print(f"Error generating output: {e}")
     
-    def _build_schema_compliant_summary(self, results: List[ProcessedResult],
-                                        git_branch: str = None, execution_label: str = None) -> Dict[str, Any]:
-        """Build summary structure compliant with current schema version."""
-        schema_info = self.schema_manager.get_schema_info()
-        successful_results = [r for r in results if r.processing_metadata.get('status') != 'failed']
-        failed_results = [r for r in results if r.processing_metadata.get('status') == 'failed']
+    def begin_output(self, output_path: str, git_branch: str = None, execution_label: str = None,
+                     results: Optional[List[ProcessedResult]] = None) -> None:
+        """Open the report and write its leading sections.
 
+        When the full result list is known up front, generation_info and
+        benchmark_definitions are written ahead of the results as before;
+        otherwise they are written after the last result by finish_output().
+        """
+        self.abort_output()
+        
+        f = open(output_path, 'w', encoding='utf-8')
+        writer = JsonStreamWriter(f, indent=self.indent, ensure_ascii=self.ensure_ascii,
+                                  compact=self.compact)
+        self._stream = {
+            'file': f,
+            'writer': writer,
+            'output_path': output_path,
+            'git_branch': git_branch,
+            'execution_label': execution_label,
+            'frame': {},
+            'total': 0,
+            'failed': 0,
+            'benchmarks': set(),
+            'benchmark_fields': {},
+            'benchmark_summary': {},
+            'validation_errors': [],
+            'validation_error_count': 0
+        }
+        
+        self._write_frame_member('schema_info', self.schema_manager.get_schema_info().to_dict())
+        if results is not None:
+            self._write_frame_member('generation_info', self._build_generation_info(
+                len(results),
+                sum(1 for r in results if r.processing_metadata.get('status') == 'failed'),
+                set(r.benchmark for r in results),
+                git_branch, execution_label))
+            self._write_frame_member('benchmark_definitions', self._generate_benchmark_definitions(results))
+        writer.begin_array('results')
+    
+    def add_result(self, result: ProcessedResult) -> None:
+        """Validate and write one result."""
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("begin_output() must be called before add_result()")
+        
+        enhanced = self._enhance_result_data(result)
+        if self.validate_output:
+            is_valid, error_msg = self.schema_manager.validate_result(enhanced)
+            if not is_valid:
+                self._record_validation_error(f"results[{stream['total']}]: {error_msg}")
+        stream['writer'].write_item(enhanced)
+        
+        stream['total'] += 1
+        if result.processing_metadata.get('status') == 'failed':
+            stream['failed'] += 1
+        stream['benchmarks'].add(result.benchmark)
+        stream['benchmark_fields'].setdefault(result.benchmark, set()).update(result.data.keys())
+        self._add_to_benchmark_summary(stream['benchmark_summary'], result)
+    
+    def finish_output(self) -> None:
+        """Write the trailing sections, close the report and export the schema."""
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("begin_output() must be called before finish_output()")
+        writer = stream['writer']
+        writer.end_array()
+        
+        if 'generation_info' not in stream['frame']:
+            self._write_frame_member('generation_info', self._build_generation_info(
+                stream['total'], stream['failed'], stream['benchmarks'],
+                stream['git_branch'], stream['execution_label']))
+            self._write_frame_member('benchmark_definitions',
+                                     self._definitions_from_fields(stream['benchmark_fields']))
+        
+        summary = stream['benchmark_summary']
+        self._compute_success_rates(summary)
+        self._write_frame_member('summary_by_benchmark', summary)
+        
+        if self.validate_output:
+            frame = dict(stream['frame'], results=[])
+            is_valid, error_msg = self.schema_manager.validate_report_frame(frame)
+            if not is_valid:
+                self._record_validation_error(error_msg)
+            writer.write_member('validation_report', self._build_validation_report())
+        
+        writer.close()
+        stream['file'].close()
+        self._stream = None
+        output_path = stream['output_path']
+        print(f"Schema-compliant output generated: {output_path}")
+        
+        # Also export the schema
+        schema_path = output_path.replace('.json', '_schema.json')
+        self.schema_manager.export_schema(schema_path)
+    
+    def _write_frame_member(self, key: str, value: Any) -> None:
+        """Write a top-level section and keep it for the final frame validation."""
+        self._stream['frame'][key] = value
+        self._stream['writer'].write_member(key, value)
+    
+    def _record_validation_error(self, error_msg: Optional[str]) -> None:
+        stream = self._stream
+        if stream['validation_error_count'] == 0:
+            print(f"Schema validation failed: {error_msg}")
+        stream['validation_error_count'] += 1
+        if error_msg and len(stream['validation_errors']) < self.max_validation_errors:
+            stream['validation_errors'].append(error_msg)
+    
+    def _build_validation_report(self) -> Dict[str, Any]:
+        stream = self._stream
+        if stream['validation_error_count'] == 0:
+            return {
+                "schema_validation": True,
+                "validation_errors": [],
+                "validation_warnings": [],
+                "data_quality_score": 1.0
+            }
+        
+        warnings = []
+        omitted = stream['validation_error_count'] - len(stream['validation_errors'])
+        if omitted > 0:
+            warnings.append(f"{omitted} further validation errors omitted")
+        return {
+            "schema_validation": False,
+            "validation_errors": stream['validation_errors'],
+            "validation_warnings": warnings,
+            "data_quality_score": 0.0
+        }
+    
+    def abort_output(self) -> None:
+        """Close a partially written report, if any."""
+        if self._stream is not None:
+            self._stream['file'].close()
+            self._stream = None
+    
+    def _build_generation_info(self, total: int, failed: int, benchmarks: set,
+                               git_branch: str = None, execution_label: str = None) -> Dict[str, Any]:
+        """Build the generation_info section."""
         generation_info = {
-            "total_results": len(results),
-            "successful_results": len(successful_results),
-            "failed_results": len(failed_results),
+            "total_results": total,
+            "successful_results": total - failed,
+            "failed_results": failed,
             "timestamp": datetime.datetime.now().isoformat(),
-            "benchmarks": list(set(r.benchmark for r in results)),
+            "benchmarks": list(benchmarks),
             "processing_duration_seconds": 0.0,
             "hostname": socket.gethostname(),
             "reg_root": os.environ.get('REG_ROOT', '')
@@ -132,15 +264,7 @@ class SchemaAwareOutputGenerator(JsonOutputGenerator):
         if execution_label is not None:
             generation_info["execution_label"] = execution_label
 
-        summary = {
-            "schema_info": schema_info.to_dict(),
-            "generation_info": generation_info,
-            "benchmark_definitions": self._generate_benchmark_definitions(results),
-            "results": [self._enhance_result_data(r) for r in results],
-            "summary_by_benchmark": self._create_enhanced_benchmark_summary(results)
-        }
-
-        return summary
+        return generation_info
     
     def _enhance_result_data(self, result: ProcessedResult) -> Dict[str, Any]:
         """Enhance result data with schema-compliant structure."""
@@ -160,8 +284,6 @@ class SchemaAwareOutputGenerator(JsonOutputGenerator):
     
     def _generate_benchmark_definitions(self, results: List[ProcessedResult]) -> Dict[str, Any]:
         """Generate benchmark definitions based on observed data."""
-        definitions = {}
-        
         benchmark_fields = {}
         for result in results:
             benchmark = result.benchmark
@@ -169,6 +291,12 @@ class SchemaAwareOutputGenerator(JsonOutputGenerator):
                 benchmark_fields[benchmark] = set()
             benchmark_fields[benchmark].update(result.data.keys())
         
+        return self._definitions_from_fields(benchmark_fields)
+    
+    def _definitions_from_fields(self, benchmark_fields: Dict[str, set]) -> Dict[str, Any]:
+        """Build benchmark definitions from the data keys seen per benchmark."""
+        definitions = {}
+        
         for benchmark, fields in benchmark_fields.items():
             definitions[benchmark] = {
                 "description": f"Auto-generated definition for {benchmark} benchmark",
@@ -180,362 +308,60 @@ class SchemaAwareOutputGenerator(JsonOutputGenerator):
         
         return definitions
     
-    def _create_enhanced_benchmark_summary(self, results: List[ProcessedResult]) -> Dict[str, Any]:
-        """Create enhanced benchmark summary with success metrics."""
-        summary = {}
+    def _add_to_benchmark_summary(self, summary: Dict[str, Any], result: ProcessedResult) -> None:
+        """Count one result in the per-benchmark summary."""
+        benchmark = result.benchmark
+        if benchmark not in summary:
+            summary[benchmark] = {
+                "count": 0,
+                "successful_count": 0,
+                "failed_count": 0,
+                "files": [],
+                "success_rate": 0.0
+            }
         
-        for result in results:
-            benchmark = result.benchmark
-            if benchmark not in summary:
-                summary[benchmark] = {
-                    "count": 0,
-                    "successful_count": 0,
-                    "failed_count": 0,
-                    "files": [],
-                    "success_rate": 0.0
-                }
-            
-            summary[benchmark]["count"] += 1
-            summary[benchmark]["files"].append(result.regulus_data)
-            
-            status = result.processing_metadata.get('status', 'success')
-            if status == 'success':
-                summary[benchmark]["successful_count"] += 1
-            else:
-                summary[benchmark]["failed_count"] += 1
+        summary[benchmark]["count"] += 1
+        summary[benchmark]["files"].append(result.regulus_data)
         
-        # Calculate success rates
+        status = result.processing_metadata.get('status', 'success')
+        if status == 'success':
+            summary[benchmark]["successful_count"] += 1
+        else:
+            summary[benchmark]["failed_count"] += 1
+    
+    def _compute_success_rates(self, summary: Dict[str, Any]) -> None:
+        """Fill in success_rate for every benchmark in the summary."""
         for benchmark_data in summary.values():
             if benchmark_data["count"] > 0:
                 benchmark_data["success_rate"] = benchmark_data["successful_count"] / benchmark_data["count"]
-        
-        return summary
-
-class CsvOutputGenerator:
-    """CSV output generator for tabular data export - iteration level."""
-    
-    def __init__(self, delimiter: str = ',', include_metadata: bool = False, base_url: str = ''):
-        self.delimiter = delimiter
-        self.include_metadata = include_metadata
-        self.base_url = base_url
-
-    def _get_param_value(self, param_name: str, unique_params: dict, common_params: dict):
-        """Get parameter value: check unique_params first, then fall back to common_params."""
-        return unique_params.get(param_name) or common_params.get(param_name)
-    
-    def generate_output(self, results: List[ProcessedResult], output_path: str) -> None:
-        """Generate CSV output file with one row per iteration."""
-        if not results:
-            print("No results to export to CSV")
-            return
-        
-        try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f, delimiter=self.delimiter)
-                
-                # Generate headers
-                headers = self._generate_headers(results)
-                writer.writerow(headers)
-                
-                # Write one row per iteration
-                for result in results:
-                    rows = self._result_to_rows(result, headers)
-                    for row in rows:
-                        writer.writerow(row)
-            
-            print(f"CSV output generated: {output_path}")
-        except Exception as e:
-            print(f"Error generating CSV output: {e}")
-    
-    def _generate_headers(self, results: List[ProcessedResult]) -> List[str]:
-        """Generate CSV headers from iteration data."""
-        # Standard columns in desired order
-        standard_headers = [
-            'file',           # First
-            'benchmark',     #  skip 'status',
-            'model',          # Move model/offload/cpu up
-            'perf',
-            'config',
-            'cpu',
-            'test_type',
-            'threads',
-            'wsize',
-            'rsize',
-            'samples',
-            'mean',
-            'unit',
-            'busyCPU',
-            'stddev%',
-            'iteration_id',
-            'protocol'        # Last
-        ]
-
-        # Collect all unique keys from iterations
-        all_keys = set()
-        for result in results:
-            iterations = result.data.get('iterations', [])
-            for iteration in iterations:
-                unique_params = iteration.get('unique_params', {})
-                all_keys.update(unique_params.keys())
-
-                # Get result fields
-                iteration_results = iteration.get('results', [])
-                if iteration_results:
-                    all_keys.update(iteration_results[0].keys())
-
-        # Combine standard headers with any extra fields found
-        final_headers = []
-        for h in standard_headers:
-            if h not in final_headers:
-                final_headers.append(h)
-
-        # Add any extra fields not in standard list
-        for key in sorted(all_keys):
-            if key not in final_headers and key not in ['type', 'sample_values', 'sample_count', 'range']:
-                final_headers.append(key)
-
-        return final_headers
-
-    def _result_to_rows(self, result: ProcessedResult, headers: List[str]) -> List[List[str]]:
-        """Convert a result with multiple iterations into multiple CSV rows."""
-        rows = []
-
-        file_name = Path(result.regulus_data).name
-        benchmark = result.benchmark
-        status = result.processing_metadata.get('status', 'unknown')
-
-        # Get file-level common params and tags
-        file_common_params = result.data.get('common_params', {})
-        key_tags = result.data.get('key_tags', {})
-
-        # Config string
-        config = f"{key_tags.get('pods-per-worker', '?')},{key_tags.get('scale_out_factor', '?')},{key_tags.get('topo', '?')}"
-
-        # Get iterations
-        iterations = result.data.get('iterations', [])
-
-        if not iterations:
-            # No iterations - create one row with basic info
-            row = [''] * len(headers)
-            if 'file' in headers:
-                if self.base_url:
-                    full_url = f"{self.base_url}/{result.regulus_data}"
-                    row[headers.index('file')] = f'=HYPERLINK("{full_url}","{file_name}")'
-                else:
-                    row[headers.index('file')] = file_name
-            if 'benchmark' in headers:
-                row[headers.index('benchmark')] = benchmark
-            if 'status' in headers:
-                row[headers.index('status')] = status
-            if 'config' in headers:
-                row[headers.index('config')] = config
-            rows.append(row)
-        else:
-            # One row per iteration
-            for iteration in iterations:
-                row = self._iteration_to_row(
-                    iteration, headers, file_name, benchmark, status,
-                    config, file_common_params, key_tags, result.regulus_data
-                )
-                rows.append(row)
-
-        return rows
-
-    def _iteration_to_row(self, iteration: Dict, headers: List[str], file_name: str, 
-                      benchmark: str, status: str, config: str, 
-                      file_common_params: Dict, key_tags: Dict,
-                      file_path: str = '') -> List[str]:
-        """Convert a single iteration to a CSV row."""
-        row = [''] * len(headers)
-
-        iteration_id = iteration.get('iteration_id', '')
-        unique_params = iteration.get('unique_params', {})
-        iteration_results = iteration.get('results', [])
-
-        # Helper to get param value
-        def get_param(key):
-            return unique_params.get(key) or file_common_params.get(key) or ''
-
-        # Fill in standard columns
-        if 'file' in headers:
-            if self.base_url:
-                full_url = f"{self.base_url}/{file_path}"
-                row[headers.index('file')] = f'=HYPERLINK("{full_url}","{file_name}")'
-            else:
-                row[headers.index('file')] = file_name
-        if 'benchmark' in headers:
-            row[headers.index('benchmark')] = benchmark
-        if 'status' in headers:
-            row[headers.index('status')] = status
-        if 'config' in headers:
-            row[headers.index('config')] = config
-        if 'iteration_id' in headers:
-            row[headers.index('iteration_id')] = iteration_id[:16]  # Shortened
-
-        # Protocol and test type
-        protocol = get_param('protocol')
-        test_type = get_param('test-type')
-
-        if 'protocol' in headers:
-            row[headers.index('protocol')] = protocol
-
-        if 'test_type' in headers:
-            if test_type and protocol:
-                row[headers.index('test_type')] = f"{protocol}, {test_type}"
-            elif test_type:
-                row[headers.index('test_type')] = test_type
-            elif protocol:
-                row[headers.index('test_type')] = protocol
-        # Check for iperf3 custom/passthru parameters (same as HTML)
-        if benchmark == 'iperf':
-            known_params = {'protocol', 'max-loss-pct', 'bitrate-range', 'length', 'nthreads',
-                        'test-type', 'wsize', 'rsize', 'num_clients', 'ifname', 'ipv', 'time'}
-            has_custom = any(key not in known_params for key in unique_params.keys())
-            if not has_custom:
-                has_custom = any(key not in known_params for key in file_common_params.keys())
-            if has_custom and 'test_type' in headers:
-                current_test_type = row[headers.index('test_type')]
-                if current_test_type:
-                    row[headers.index('test_type')] = f"{current_test_type}, custom"
-        # Other params
-        if 'threads' in headers:
-            threads = self._get_param_value('nthreads', unique_params, file_common_params)
-            row[headers.index('threads')] = threads if threads else ''
-        if 'wsize' in headers:
-            # Try wsize first, then length (for iperf)
-            wsize = self._get_param_value('wsize', unique_params, file_common_params)
-            if not wsize:
-                wsize = self._get_param_value('length', unique_params, file_common_params)
-            row[headers.index('wsize')] = wsize if wsize else ''
-        if 'rsize' in headers:
-            rsize = self._get_param_value('rsize', unique_params, file_common_params)
-            row[headers.index('rsize')] = rsize if rsize else ''
-
-        # Tags
-        if 'model' in headers:
-            row[headers.index('model')] = key_tags.get('model', '')
-        if 'perf' in headers:
-            row[headers.index('perf')] = key_tags.get('perf', '')
-        if 'cpu' in headers:
-            row[headers.index('cpu')] = key_tags.get('cpu', '')
-
-        # Results data
-        if iteration_results and len(iteration_results) > 0:
-            primary_result = iteration_results[0]
-
-            if 'mean' in headers and 'mean' in primary_result:
-                mean = primary_result['mean']
-                row[headers.index('mean')] = f"{mean:.2f}" if isinstance(mean, (int, float)) else str(mean)
-
-            if 'unit' in headers and 'unit' in primary_result:
-                row[headers.index('unit')] = primary_result['unit']
-
-            if 'samples' in headers and 'sample_count' in primary_result:
-                row[headers.index('samples')] = str(primary_result['sample_count'])
-
-            if 'stddev%' in headers and 'stddevpct' in primary_result:
-                stddev = primary_result['stddevpct']
-                if isinstance(stddev, (int, float)) and stddev > 0:
-                    row[headers.index('stddev%')] = f"{stddev:.2f}"
-
-            if 'busyCPU' in headers and 'busyCPU' in primary_result:
-                cpu = primary_result['busyCPU']
-                if isinstance(cpu, (int, float)):
-                    row[headers.index('busyCPU')] = f"{cpu:.2f}"
-
-        return row
-
-class XmlOutputGenerator:
-    """XML output generator."""
-    
-    def __init__(self, root_element: str = "build_report", pretty_print: bool = True):
-        self.root_element = root_element
-        self.pretty_print = pretty_print
-    
-    def generate_output(self, results: List[ProcessedResult], output_path: str) -> None:
-        """Generate XML output file."""
-        try:
-            root = ET.Element(self.root_element)
-            
-            # Add metadata
-            metadata_elem = ET.SubElement(root, "metadata")
-            ET.SubElement(metadata_elem, "timestamp").text = datetime.datetime.now().isoformat()
-            ET.SubElement(metadata_elem, "total_results").text = str(len(results))
-            
-            # Add results
-            results_elem = ET.SubElement(root, "results")
-            for result in results:
-                self._add_result_to_xml(results_elem, result)
-            
-            # Write to file
-            tree = ET.ElementTree(root)
-            if self.pretty_print:
-                self._indent(root)
-            
-            tree.write(output_path, encoding='utf-8', xml_declaration=True)
-            print(f"XML output generated: {output_path}")
-            
-        except Exception as e:
-            print(f"Error generating XML output: {e}")
-    
-    def _add_result_to_xml(self, parent: ET.Element, result: ProcessedResult) -> None:
-        """Add a result to the XML structure."""
-        result_elem = ET.SubElement(parent, "result")
-        result_elem.set("benchmark", result.benchmark)
-        result_elem.set("regulus_data", result.regulus_data)
-
-        for key, value in result.data.items():
-            if key in ["benchmark", "regulus_data"]:
-                continue  # Already added as attributes
-            
-            elem = ET.SubElement(result_elem, key)
-            if isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    sub_elem = ET.SubElement(elem, sub_key)
-                    sub_elem.text = str(sub_value)
-            elif isinstance(value, list):
-                for item in value:
-                    item_elem = ET.SubElement(elem, "item")
-                    item_elem.text = str(item)
-            else:
-                elem.text = str(value)
-    
-    def _indent(self, elem: ET.Element, level: int = 0) -> None:
-        """Add indentation for pretty printing."""
-        indent = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = indent + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = indent
-            for elem in elem:
-                self._indent(elem, level + 1)
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = indent
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = indent
-
 
 class MultiFormatOutputGenerator:
     """Output generator that can produce multiple formats simultaneously."""
     
     def __init__(self, schema_manager: Optional[SchemaManager] = None):
         self.schema_manager = schema_manager
-        self.generators = {
-            'json': SchemaAwareOutputGenerator(schema_manager) if schema_manager else JsonOutputGenerator(),
-            'csv': CsvOutputGenerator(),
-            'xml': XmlOutputGenerator()
-        }
-        self.enabled_formats = ['json']  # Default to JSON only
+        # Generators are created (and their modules imported) when their format is enabled
+        self.generators = {}
+        self.enabled_formats = []
+        self.enable_format('json')  # Default to JSON only
     
     def enable_format(self, format_name: str) -> bool:
-        """Enable a specific output format."""
-        if format_name in self.generators:
-            if format_name not in self.enabled_formats:
-                self.enabled_formats.append(format_name)
-            return True
-        return False
+        """Enable a specific output format (any format in output.registry, or a custom generator)."""
+        if format_name not in self.generators:
+            generator = self._create_generator(format_name)
+            if generator is None:
+                return False
+            self.generators[format_name] = generator
+        if format_name not in self.enabled_formats:
+            self.enabled_formats.append(format_name)
+        return True
+    
+    def _create_generator(self, format_name: str) -> Optional[OutputGeneratorInterface]:
+        """New generator for a registered format (None if the format is unknown)."""
+        if format_name == 'json' and self.schema_manager:
+            return SchemaAwareOutputGenerator(self.schema_manager)
+        generator_class = load_generator_class(format_name)
+        return generator_class() if generator_class else None
     
     def disable_format(self, format_name: str) -> bool:
         """Disable a specific output format."""
@@ -575,1149 +401,137 @@ class MultiFormatOutputGenerator:
         return self.enabled_formats.copy()
 
 
-class HtmlOutputGenerator:
-    """HTML output generator with rich formatting and full iteration support."""
-    
-    def __init__(self, template_style: str = "bootstrap", include_charts: bool = True):
-        self.template_style = template_style
-        self.include_charts = include_charts
-
-    def _get_param_value(self, param_name: str, unique_params: dict, common_params: dict):
-        """Get parameter value: check unique_params first, then fall back to common_params."""
-        return unique_params.get(param_name) or common_params.get(param_name)    
-
-    def generate_output(self, results: List[ProcessedResult], output_path: str) -> None:
-        """Generate HTML output file."""
-        try:
-            html_content = self._build_html_report(results)
-            
-            # Ensure .html extension
-            if not output_path.endswith('.html'):
-                output_path = output_path.replace('.json', '.html').replace('.xml', '.html')
-                if not output_path.endswith('.html'):
-                    output_path += '.html'
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            print(f"HTML report generated: {output_path}")
-        except Exception as e:
-            print(f"Error generating HTML output: {e}")
-    
-    def _build_html_report(self, results: List[ProcessedResult]) -> str:
-        """Build complete HTML report."""
-        summary_stats = self._calculate_summary_stats(results)
-        benchmark_data = self._group_by_benchmark(results)
-        
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dataplane Performance Report Summary</title>
-    {self._get_css_styles()}
-    {self._get_chart_scripts() if self.include_charts else ''}
-</head>
-<body>
-    <div class="container">
-        {self._generate_header(summary_stats)}
-        {self._generate_summary_cards(summary_stats)}
-        {self._generate_benchmark_sections(benchmark_data)}
-        {self._generate_detailed_results_table(results)}
-        {self._generate_charts_section(benchmark_data) if self.include_charts else ''}
-        {self._generate_footer()}
-    </div>
-    {self._get_javascript() if self.include_charts else ''}
-</body>
-</html>"""
-        return html
-    
-    def _calculate_summary_stats(self, results: List[ProcessedResult]) -> Dict[str, Any]:
-        """Calculate summary statistics including iteration counts."""
-        total_files = len(results)
-        successful = len([r for r in results if r.processing_metadata.get('status') == 'success'])
-        failed = total_files - successful
-        benchmarks = list(set(r.benchmark for r in results))
-        
-        # Calculate total iterations across all files
-        total_iterations = 0
-        for result in results:
-            iterations = result.data.get('iterations', [])
-            total_iterations += len(iterations)
-        
-        # Calculate file size stats
-        file_sizes = [r.data.get('file_size', 0) for r in results]
-        avg_file_size = sum(file_sizes) / len(file_sizes) if file_sizes else 0
-
-        # Extract kernel and rcos from tags (NEW)
-        kernels = set()
-        rcos_versions = set()
-        for result in results:
-            key_tags = result.data.get('key_tags', {})
-            if 'kernel' in key_tags:
-                kernels.add(key_tags['kernel'])
-            if 'rcos' in key_tags:
-                rcos_versions.add(key_tags['rcos'])
-        return {
-            'total_files': total_files,
-            'total_iterations': total_iterations,
-            'successful': successful,
-            'failed': failed,
-            'success_rate': (successful / total_files * 100) if total_files > 0 else 0,
-            'benchmarks': benchmarks,
-            'benchmark_count': len(benchmarks),
-            'avg_file_size': avg_file_size,
-            'kernel': ', '.join(sorted(kernels)) if kernels else 'Unknown',
-            'rcos': ', '.join(sorted(rcos_versions)) if rcos_versions else 'Unknown',
-            'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-    
-    def _group_by_benchmark(self, results: List[ProcessedResult]) -> Dict[str, List[ProcessedResult]]:
-        """Group results by benchmark type."""
-        groups = {}
-        for result in results:
-            benchmark = result.benchmark
-            if benchmark not in groups:
-                groups[benchmark] = []
-            groups[benchmark].append(result)
-        return groups
-    
-    def _generate_header(self, stats: Dict[str, Any]) -> str:
-        """Generate HTML header section with title and summary stats."""
-        return f"""
-        <header class="header">
-            <h1><i class="icon">📊</i> Regulus/Crucible Performance Report Summary</h1>
-            <p class="subtitle">Generated on {stats['timestamp']}</p>
-            <p class="subtitle">Kernel: {stats['kernel']} | RCOS: {stats['rcos']}</p>
-
-            <!-- Regex Filter Box -->
-            <div style="margin: 20px 0; padding: 15px; background: #f8fafc; border-radius: 8px; border: 1px solid #e2e8f0;">
-                <label for="filterInput" style="display: block; margin-bottom: 8px; font-weight: 500; color: #374151;">
-                    Filter by Regex Pattern:
-                </label>
-                <input type="text" id="filterInput" placeholder="e.g., tcp|udp or .*200Mbps.* or ^test.*"
-                       style="width: calc(100% - 150px); padding: 10px; font-size: 0.95rem; border: 2px solid #cbd5e1;
-                              border-radius: 6px; font-family: 'Courier New', monospace;">
-                <button onclick="clearFilter()"
-                        style="margin-left: 10px; padding: 10px 20px; background: #64748b; color: white;
-                               border: none; border-radius: 6px; cursor: pointer; font-weight: 500;">
-                    Clear
-                </button>
-                <div id="matchCount" style="margin-top: 8px; color: #64748b; font-weight: 500;"></div>
-            </div>
-        </header>
-        """
-    
-    def _generate_summary_cards(self, stats: Dict[str, Any]) -> str:
-        """Generate summary cards section."""
-        return f"""
-        <section class="summary-cards">
-            <div class="card success">
-                <div class="card-header">
-                    <h3>📁 Total Files</h3>
-                </div>
-                <div class="card-body">
-                    <div class="metric">{stats['total_files']}</div>
-                    <div class="detail">Files processed</div>
-                </div>
-            </div>
-            
-            <div class="card info">
-                <div class="card-header">
-                    <h3>🔄 Total Iterations</h3>
-                </div>
-                <div class="card-body">
-                    <div class="metric">{stats['total_iterations']}</div>
-                    <div class="detail">Test iterations found</div>
-                </div>
-            </div>
-            
-            <div class="card {'success' if stats['success_rate'] > 90 else 'warning' if stats['success_rate'] > 70 else 'danger'}">
-                <div class="card-header">
-                    <h3>✅ Success Rate</h3>
-                </div>
-                <div class="card-body">
-                    <div class="metric">{stats['success_rate']:.1f}%</div>
-                    <div class="detail">{stats['successful']}/{stats['total_files']} successful</div>
-                </div>
-            </div>
-            
-            <div class="card neutral">
-                <div class="card-header">
-                    <h3>🔧 Benchmarks</h3>
-                </div>
-                <div class="card-body">
-                    <div class="metric">{stats['benchmark_count']}</div>
-                    <div class="detail">Different types found</div>
-                </div>
-            </div>
-        </section>
-        """
-    
-    def _generate_benchmark_sections(self, benchmark_data: Dict[str, List[ProcessedResult]]) -> str:
-        """Generate sections for each benchmark type."""
-        sections = []
-        
-        for benchmark, results in benchmark_data.items():
-            success_count = len([r for r in results if r.processing_metadata.get('status') == 'success'])
-            
-            # Count total iterations for this benchmark
-            total_iterations = sum(len(r.data.get('iterations', [])) for r in results)
-            
-            # Extract key metrics for this benchmark
-            key_metrics = self._extract_benchmark_metrics(benchmark, results)
-            
-            section = f"""
-            <section class="benchmark-section">
-                <h2>🚀 {benchmark.title()} Benchmark</h2>
-                <div class="benchmark-stats">
-                    <span class="stat">Files: {len(results)}</span>
-                    <span class="stat">Iterations: {total_iterations}</span>
-                    <span class="stat">Success: {success_count}/{len(results)}</span>
-                    <span class="stat">Rate: {(success_count/len(results)*100):.1f}%</span>
-                </div>
-                
-                {self._generate_metrics_table(key_metrics)}
-                
-                <details class="file-list">
-                    <summary>📋 Files in this benchmark ({len(results)})</summary>
-                    <ul class="file-list-items">
-                        {self._generate_file_list(results)}
-                    </ul>
-                </details>
-            </section>
-            """
-            sections.append(section)
-        
-        return '\n'.join(sections)
-    
-    def _extract_benchmark_metrics(self, benchmark: str, results: List[ProcessedResult]) -> List[Dict[str, Any]]:
-        """Extract key metrics for a benchmark - ONE METRIC PER ITERATION."""
-        metrics = []
-        
-        for result in results:
-            data = result.data
-            file_name = Path(result.regulus_data).name
-            # Get common_params from file level
-            file_common_params = data.get('common_params', {})
-            regulus_data = result.regulus_data
-            status = result.processing_metadata.get('status', 'unknown')
-
-            # Get all iterations from this file
-            iterations = data.get('iterations', [])
-
-            if not iterations:
-                # No iterations found - create single metric entry
-                metrics.append({
-                    'file': file_name,
-                    'regulus_data': regulus_data,
-                    'status': status,
-                    'iteration': 'N/A',
-                    'result': 'No iterations found'
-                })
-            else:
-                # Create one metric entry per iteration
-                for iteration in iterations:
-                    iteration_id = iteration.get('iteration_id', 'unknown')
-                    unique_params = iteration.get('unique_params', {})
-                    iteration_results = iteration.get('results', [])  # Now plural - list of results
-
-                    metric = {
-                        'file': file_name,
-                        'regulus_data': regulus_data,
-                        'status': status,
-                        'iteration': iteration_id[:8] + '...',
-                    }
-                    
-                    # Add key tags in compact format (NEW)
-                    key_tags = data.get('key_tags', {})
-                    tag_parts = [
-                        key_tags.get('pods-per-worker', '?'),
-                        key_tags.get('scale_out_factor', '?'),
-                        key_tags.get('topo', '?')
-                    ]
-                    metric['config'] = ','.join(tag_parts)
-
-                    if 'model' in key_tags:
-                        metric['model'] = key_tags['model']
-                    if 'offload' in key_tags:
-                        metric['offload'] = key_tags['offload']
-                    if 'perf' in key_tags:
-                        metric['perf'] = key_tags['perf']
-                    if 'cpu' in key_tags:
-                        metric['cpu'] = key_tags['cpu']
-
-                    # Add test configuration - use helper for ALL params
-                    protocol = self._get_param_value('protocol', unique_params, file_common_params)
-                    
-                    # Handle iperf benchmark specially
-                    if benchmark == 'iperf3' or benchmark == 'iperf':
-                        # For iperf, check for max-loss-pct or bitrate-range as the "test type"
-                        max_loss_pct = self._get_param_value('max-loss-pct', unique_params, file_common_params)
-                        bitrate_range = self._get_param_value('bitrate-range', unique_params, file_common_params)
-                        
-                        if max_loss_pct is not None:
-                            if protocol:
-                                metric['test_type'] = f"{protocol}, max-loss-pct={max_loss_pct}"
-                            else:
-                                metric['test_type'] = f"max-loss-pct={max_loss_pct}"
-                        elif bitrate_range:
-                            # Don't show the actual list, just use it as test type indicator
-                            if protocol:
-                                metric['test_type'] = f"{protocol}, bitrate-range"
-                            else:
-                                metric['test_type'] = "bitrate-range"
-                        elif protocol:
-                            metric['test_type'] = protocol
-
-                        length = self._get_param_value('length', unique_params, file_common_params)
-                        if length:
-                            metric['wsize'] = length
-#
-                        # Check for custom parameters and append ",special"
-                        known_params = {'protocol', 'max-loss-pct', 'bitrate-range', 'length', 'nthreads', 
-                                        'test-type', 'wsize', 'rsize', 'num_clients','ifname','ipv','time'}
-    
-                        has_custom = any(key not in known_params for key in unique_params.keys())
-                        if not has_custom:
-                            has_custom = any(key not in known_params for key in file_common_params.keys())
-    
-                        if has_custom and 'test_type' in metric:
-                            metric['test_type'] += ', custom'
-#
-                    
-                    nthreads = self._get_param_value('nthreads', unique_params, file_common_params)
-                    if nthreads:
-                        metric['threads'] = nthreads
-                    
-                    test_type = self._get_param_value('test-type', unique_params, file_common_params)
-                    if test_type:
-                        # Combine protocol with test-type if protocol exists (for uperf)
-                        if protocol:
-                            metric['test_type'] = f"{protocol}, {test_type}"
-                        else:
-                            metric['test_type'] = test_type
-                    
-                    wsize = self._get_param_value('wsize', unique_params, file_common_params)
-                    if wsize:
-                        metric['wsize'] = wsize
-                    
-                    rsize = self._get_param_value('rsize', unique_params, file_common_params)
-                    if rsize:
-                        metric['rsize'] = rsize
-
-                    # Extract result metrics from first/primary result
-                    if iteration_results and isinstance(iteration_results, list) and len(iteration_results) > 0:
-                        primary_result = iteration_results[0]  # Take first result
-                        if isinstance(primary_result, dict):
-                            if 'mean' in primary_result:
-                                mean = primary_result['mean']
-                                if isinstance(mean, (int, float)):
-                                    metric['mean'] = f"{mean:,.2f}"
-                                else:
-                                    metric['mean'] = str(mean)
-                            
-                            #if 'type' in primary_result:
-                            #    metric['metric_type'] = primary_result['type']
-                            
-                            if 'unit' in primary_result:
-                                metric['unit'] = primary_result['unit']
-                            
-                            if 'sample_count' in primary_result:
-                                metric['samples'] = primary_result['sample_count']
-                            
-                            if 'stddevpct' in primary_result:
-                                stddev = primary_result['stddevpct']
-                                if isinstance(stddev, (int, float)) and stddev > 0:
-                                    metric['stddev%'] = f"{stddev:.2f}%"
-
-                            if 'busyCPU' in primary_result:
-                                cpu = primary_result['busyCPU']
-                                if isinstance(cpu, (int, float)):
-                                    metric['busyCPU'] = f"{cpu:.2f}"
-                                else:
-                                    metric['busyCPU'] = str(cpu)
-                    
-                    metrics.append(metric)
-        
-        return metrics
-    
-    def _generate_metrics_table(self, metrics: List[Dict[str, Any]]) -> str:
-        """Generate metrics table for a benchmark."""
-        if not metrics:
-            return "<p>No metrics available</p>"
-        
-        # Get all unique keys (columns)
-        all_keys = set()
-        for metric in metrics:
-            all_keys.update(metric.keys())
-
-        # Remove status and file from main columns (they'll be handled specially)
-        #columns = sorted([k for k in all_keys if k not in ['file', 'regulus_data', 'status']])
-        column_order = ['model','perf', 'offload', 'config', 'cpu', 'test_type', 'threads', 'wsize', 'rsize', 'samples', 'mean', 'unit', 'busyCPU', 'stddev%', 'iteration']
-
-        # Sort with custom order
-        def custom_sort(col):
-            try:
-                return column_order.index(col)
-            except ValueError:
-                return 999  # Put unknown columns at end
-
-        columns = sorted([k for k in all_keys if k not in ['file', 'regulus_data', 'status']], 
-                 key=custom_sort)
-
-        table = """
-        <div class="metrics-table-container">
-            <table class="metrics-table">
-                <thead>
-                    <tr>
-                        <th style="width: 40px;">#</th>
-                        <th>📄 File</th>
-                        <th>📊 Status</th>
-        """
-        
-        for col in columns:
-            table += f"<th>{col.title().replace('_', ' ')}</th>"
-        
-        table += """
-                    </tr>
-                </thead>
-                <tbody>
-        """
-        row_num =1
-        for metric in metrics:
-            status_class = {
-                'success': 'status-success',
-                'failed': 'status-failed',
-                'partial': 'status-warning'
-            }.get(metric.get('status', 'unknown'), 'status-unknown')
-            regulus_data = metric.get('regulus_data', '#')
-
-            table += f"""
-                    <tr>
-                        <td style="text-align: center; color: #94a3b8; font-weight: 500;">{row_num}</td>
-                        <td class="file-name"><a href="{regulus_data}" target="_blank">{metric.get('file', 'Unknown')}</a></td>
-                        <td><span class="status-badge {status_class}">{metric.get('status', 'unknown').title()}</span></td>
-            """
-            
-            for col in columns:
-                value = metric.get(col, 'N/A')
-                table += f"<td>{value}</td>"
-            
-            table += "</tr>"
-            row_num += 1
-        
-        table += """
-                </tbody>
-            </table>
-        </div>
-        """
-        
-        return table
-    
-    def _generate_file_list(self, results: List[ProcessedResult]) -> str:
-        """Generate file list items."""
-        items = []
-        for result in results:
-            status_icon = {
-                'success': '✅',
-                'failed': '❌',
-                'partial': '⚠️'
-            }.get(result.processing_metadata.get('status', 'unknown'), '❓')
-            
-            # Count iterations in this file
-            iterations = result.data.get('iterations', [])
-            iter_count = len(iterations)
-            
-            items.append(f"""
-                <li>
-                    {status_icon} <code>{Path(result.regulus_data).name}</code>
-                    <small>({iter_count} iteration{'s' if iter_count != 1 else ''}, {self._format_file_size(result.data.get('file_size', 0))})</small>
-                </li>
-            """)
-        
-        return ''.join(items)
-    
-    def _generate_detailed_results_table(self, results: List[ProcessedResult]) -> str:
-        """Generate detailed results table with one row per iteration."""
-        return f"""
-        <section class="detailed-results">
-            <h2>📋 Detailed Results (All Iterations)</h2>
-            <div class="table-container">
-                <table class="results-table">
-                    <thead>
-                        <tr>
-                            <th>File</th>
-                            <th>Config</th>
-                            <th>Iteration ID</th>
-                            <th>Test Config</th>
-                            <th>Benchmark</th>
-                            <th>Status</th>
-                            <th>Results</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {self._generate_results_rows(results)}
-                    </tbody>
-                </table>
-            </div>
-        </section>
-        """
-    
-    def _generate_results_rows(self, results: List[ProcessedResult]) -> str:
-        """Generate table rows - ONE ROW PER ITERATION (not per file)."""
-        rows = []
-
-        for result in results:
-            status = result.processing_metadata.get('status', 'unknown')
-            status_class = f"status-{status}"
-            file_name = Path(result.regulus_data).name
-            # Get common_params from file level
-            file_common_params = result.data.get('common_params', {})
-
-            # Get iterations from the data
-            iterations = result.data.get('iterations', [])
-            
-            if not iterations:
-                # Fallback: show file-level row if no iterations found
-                rows.append(f"""
-                    <tr>
-                        <td class="file-name"><a href="{result.regulus_data}" target="_blank">{file_name}</a></td>
-                        <td colspan="2"><em>No iterations found</em></td>
-                        <td><span class="benchmark-badge">{result.benchmark}</span></td>
-                        <td><span class="status-badge {status_class}">{status.title()}</span></td>
-                        <td class="key-data">N/A</td>
-                    </tr>
-                """)
-            else:
-                # Show ONE ROW per iteration
-                for iteration in iterations:
-                    iteration_id = iteration.get('iteration_id', 'unknown')
-                    unique_params = iteration.get('unique_params', {})
-                    iteration_results = iteration.get('results', [])
-
-                    key_tags = result.data.get('key_tags', {})
-                    config_str = f"{key_tags.get('pods-per-worker', '?')},{key_tags.get('scale_out_factor', '?')},{key_tags.get('topo', '?')}"
-                    rows.append(f"""
-                        <tr>
-                            <td class="file-name"><a href="{result.regulus_data}" target="_blank">{file_name}</a></td>
-                            <td style="font-size: 0.85rem;">{config_str}</td>  <!-- NEW -->
-                            <td><code style="font-size: 0.75rem;">{iteration_id[:8]}...</code></td>
-                            <!-- rest of columns -->
-                        </tr>
-                    """)        
-#
-                    # Format test configuration - use helper for ALL params
-                    config_parts = []
-                    
-                    protocol = self._get_param_value('protocol', unique_params, file_common_params)
-                    
-                    # Handle iperf benchmark specially
-                    if result.benchmark == 'iperf3' or result.benchmark == 'iperf':
-                        max_loss_pct = self._get_param_value('max-loss-pct', unique_params, file_common_params)
-                        bitrate_range = self._get_param_value('bitrate-range', unique_params, file_common_params)
-                        
-                        if max_loss_pct is not None:
-                            if protocol:
-                                config_parts.append(f"type={protocol}, max-loss-pct={max_loss_pct}")
-                            else:
-                                config_parts.append(f"type=max-loss-pct={max_loss_pct}")
-                        elif bitrate_range:
-                            if protocol:
-                                config_parts.append(f"type={protocol}, bitrate-range")
-                            else:
-                                config_parts.append("type=bitrate-range")
-                        elif protocol:
-                            config_parts.append(f"type={protocol}")
-
-                        length = self._get_param_value('length', unique_params, file_common_params)
-                        if length:
-                            config_parts.append(f"wsize={length}")
-                        # add "special" if there are other passthru params
-                        known_params = {'protocol', 'max-loss-pct', 'bitrate-range', 'length', 'nthreads', 
-                                        'test-type', 'wsize', 'rsize', 'num_clients','ifname','ipv','time',''}
-    
-                        has_custom = any(key not in known_params for key in unique_params.keys())
-                        if not has_custom:
-                            has_custom = any(key not in known_params for key in file_common_params.keys())
-    
-                        if has_custom:
-                            # Find and append to the type= entry
-                            for i, part in enumerate(config_parts):
-                                if part.startswith('type='):
-                                    config_parts[i] += ', special'
-                                    break
-
-                    #
-                    nthreads = self._get_param_value('nthreads', unique_params, file_common_params)
-                    if nthreads:
-                        config_parts.append(f"threads={nthreads}")
-                    
-                    test_type = self._get_param_value('test-type', unique_params, file_common_params)
-                    if test_type:
-                        if protocol:
-                            config_parts.append(f"type={protocol}, {test_type}")
-                        else:
-                            config_parts.append(f"type={test_type}")
-                    
-                    wsize = self._get_param_value('wsize', unique_params, file_common_params)
-                    if wsize:
-                        config_parts.append(f"wsize={wsize}")
-                    
-                    rsize = self._get_param_value('rsize', unique_params, file_common_params)
-                    if rsize:
-                        config_parts.append(f"rsize={rsize}")
-
-                    config_str = ", ".join(config_parts) if config_parts else "default"
-                    
-                    # Format result data - show all results
-                    result_str = self._format_iteration_results(iteration_results)
-
-                    rows.append(f"""
-                        <tr>
-                            <td class="file-name"><a href="{result.regulus_data}" target="_blank">{file_name}</a></td>
-                            <td><code style="font-size: 0.75rem;">{iteration_id[:8]}...</code></td>
-                            <td style="font-size: 0.85rem;">{config_str}</td>
-                            <td><span class="benchmark-badge">{result.benchmark}</span></td>
-                            <td><span class="status-badge {status_class}">{status.title()}</span></td>
-                            <td class="key-data">{result_str}</td>
-                        </tr>
-                    """)
-        
-        return ''.join(rows)
-    
-    def _format_iteration_results(self, results_list: List[Dict[str, Any]]) -> str:
-        """Format multiple iteration results for display."""
-        if not results_list:
-            return "N/A"
-        
-        # Format each result
-        formatted_results = []
-        for result_data in results_list:
-            if not isinstance(result_data, dict):
-                continue
-            
-            parts = []
-            
-            if 'type' in result_data:
-                parts.append(f"<strong>{result_data['type']}</strong>")
-            
-            if 'mean' in result_data:
-                mean = result_data['mean']
-                unit = result_data.get('unit', '')
-                if isinstance(mean, (int, float)):
-                    parts.append(f"{mean:,.2f} {unit}")
-                else:
-                    parts.append(f"{mean} {unit}")
-            
-            if 'sample_count' in result_data and result_data['sample_count'] > 1:
-                parts.append(f"({result_data['sample_count']} samples)")
-            
-            if 'stddevpct' in result_data and result_data.get('stddevpct', 0) > 0:
-                stddev = result_data['stddevpct']
-                if isinstance(stddev, (int, float)):
-                    parts.append(f"±{stddev:.1f}%")
-            
-            if parts:
-                formatted_results.append(" ".join(parts))
-        
-        # Join multiple results with line breaks
-        return "<br>".join(formatted_results) if formatted_results else "N/A"
-    
-    def _generate_charts_section(self, benchmark_data: Dict[str, List[ProcessedResult]]) -> str:
-        """Generate charts section."""
-        return f"""
-        <section class="charts-section">
-            <h2>📊 Visual Analysis</h2>
-            <div class="charts-container">
-                <div class="chart-item">
-                    <canvas id="benchmarkChart"></canvas>
-                </div>
-                <div class="chart-item">
-                    <canvas id="statusChart"></canvas>
-                </div>
-            </div>
-        </section>
-        """
-    
-    def _format_file_size(self, size: int) -> str:
-        """Format file size in human readable format."""
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.1f} GB"
-    
-    def _generate_footer(self) -> str:
-        """Generate footer."""
-        return f"""
-        <footer class="footer">
-            <p>Generated by Modular Regulus Report Generator v2.4.0 | 
-               <a href="#top">Back to top ↑</a></p>
-        </footer>
-        """
-    
-    def _get_css_styles(self) -> str:
-        """Get CSS styles for the HTML report."""
-        return """
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f8fafc;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .header {
-            text-align: center;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px 20px;
-            border-radius: 12px;
-            margin-bottom: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-        }
-        
-        .header h1 {
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }
-        
-        .icon { font-size: 1.2em; margin-right: 10px; }
-        .subtitle { font-size: 1.1rem; opacity: 0.9; }
-        
-        .summary-cards {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 40px;
-        }
-        
-        .card {
-            background: white;
-            border-radius: 12px;
-            padding: 0;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.08);
-            transition: transform 0.2s ease, box-shadow 0.2s ease;
-            overflow: hidden;
-        }
-        
-        .card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(0,0,0,0.12);
-        }
-        
-        .card-header {
-            padding: 15px 20px 10px;
-            border-bottom: 1px solid #e2e8f0;
-        }
-        
-        .card-header h3 {
-            font-size: 1rem;
-            color: #64748b;
-            font-weight: 600;
-        }
-        
-        .card-body {
-            padding: 15px 20px 20px;
-        }
-        
-        .metric {
-            font-size: 2.5rem;
-            font-weight: 700;
-            line-height: 1;
-            margin-bottom: 5px;
-        }
-        
-        .detail {
-            color: #64748b;
-            font-size: 0.9rem;
-        }
-        
-        .card.success .metric { color: #10b981; }
-        .card.warning .metric { color: #f59e0b; }
-        .card.danger .metric { color: #ef4444; }
-        .card.info .metric { color: #3b82f6; }
-        .card.neutral .metric { color: #6b7280; }
-        
-        .benchmark-section {
-            background: white;
-            border-radius: 12px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.08);
-        }
-        
-        .benchmark-section h2 {
-            color: #1e293b;
-            margin-bottom: 15px;
-            font-size: 1.5rem;
-        }
-        
-        .benchmark-stats {
-            display: flex;
-            gap: 20px;
-            margin-bottom: 25px;
-            flex-wrap: wrap;
-        }
-        
-        .stat {
-            background: #f1f5f9;
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }
-        
-        .metrics-table-container {
-            overflow-x: auto;
-            overflow-y: visible;
-            margin-bottom: 20px;
-            width: 100%;
-        }
-        
-        .metrics-table, .results-table {
-            width: max-content;
-            min-width: 100%;
-            border-collapse: collapse;
-            background: white;
-            border-radius: 8px;
-            overflow: visible;
-        }
-        
-        .metrics-table th, .results-table th {
-            background: #f8fafc;
-            padding: 12px 15px;
-            text-align: left;
-            font-weight: 600;
-            color: #374151;
-            border-bottom: 2px solid #e5e7eb;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-        }
-        
-        .metrics-table td, .results-table td {
-            padding: 10px 15px;
-            border-bottom: 1px solid #f3f4f6;
-        }
-        
-        .metrics-table tr:hover, .results-table tr:hover {
-            background: #f9fafb;
-        }
-        
-        .file-name {
-            font-family: 'SF Mono', Monaco, 'Cascadia Code', monospace;
-            font-size: 0.9rem;
-        }
-        
-        .file-name a {
-            color: #6366f1;
-            text-decoration: none;
-        }
-        
-        .file-name a:hover {
-            text-decoration: underline;
-        }
-        
-        .status-badge {
-            padding: 4px 8px;
-            border-radius: 12px;
-            font-size: 0.8rem;
-            font-weight: 500;
-            text-transform: uppercase;
-        }
-        
-        .status-success { background: #dcfce7; color: #166534; }
-        .status-failed { background: #fee2e2; color: #991b1b; }
-        .status-warning { background: #fef3c7; color: #92400e; }
-        .status-unknown { background: #f3f4f6; color: #6b7280; }
-        
-        .benchmark-badge {
-            background: #e0e7ff;
-            color: #3730a3;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 0.8rem;
-            font-weight: 500;
-        }
-        
-        .file-list {
-            margin-top: 20px;
-        }
-        
-        .file-list summary {
-            cursor: pointer;
-            font-weight: 600;
-            color: #4f46e5;
-            padding: 10px 0;
-        }
-        
-        .file-list summary:hover {
-            color: #4338ca;
-        }
-        
-        .file-list-items {
-            list-style: none;
-            padding: 15px 0 5px 20px;
-        }
-        
-        .file-list-items li {
-            padding: 5px 0;
-            color: #6b7280;
-        }
-        
-        .file-list-items code {
-            background: #f1f5f9;
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-size: 0.85rem;
-            color: #1e293b;
-        }
-        
-        .detailed-results {
-            background: white;
-            border-radius: 12px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.08);
-        }
-        
-        .detailed-results h2 {
-            margin-bottom: 20px;
-            color: #1e293b;
-        }
-        
-        .table-container {
-            overflow-x: auto;
-            max-height: 800px;
-            overflow-y: auto;
-        }
-        
-        .key-data {
-            font-family: 'SF Mono', Monaco, 'Cascadia Code', monospace;
-            font-size: 0.85rem;
-            color: #4f46e5;
-            max-width: 300px;
-        }
-        
-        .charts-section {
-            background: white;
-            border-radius: 12px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.08);
-        }
-        
-        .charts-container {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 30px;
-        }
-        
-        .chart-item {
-            position: relative;
-            height: 300px;
-        }
-        
-        .footer {
-            text-align: center;
-            padding: 30px;
-            color: #64748b;
-            border-top: 1px solid #e2e8f0;
-            margin-top: 40px;
-        }
-        
-        .footer a {
-            color: #4f46e5;
-            text-decoration: none;
-        }
-        
-        .footer a:hover {
-            text-decoration: underline;
-        }
-        
-        @media (max-width: 768px) {
-            .container { padding: 10px; }
-            .summary-cards { grid-template-columns: 1fr; }
-            .benchmark-stats { flex-direction: column; gap: 10px; }
-            .charts-container { grid-template-columns: 1fr; }
-        }
-
-       /* Filter input styling */
-        #filterInput:focus {
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }
-
-        #filterInput.error {
-            border-color: #ef4444;
-        }
-
-        button:hover {
-            background: #475569 !important;
-        }
-
-        button:active {
-            transform: scale(0.98);
-        }
-
-    </style>
-        """
-    
-    def _get_chart_scripts(self) -> str:
-        """Get Chart.js script."""
-        return """
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-        """
-
-    def _get_javascript(self) -> str:
-        """Get JavaScript for filtering and charts."""
-        return """
-<script>
-    // Regex Filter Implementation
-    const filterInput = document.getElementById('filterInput');
-    const matchCount = document.getElementById('matchCount');
-
-    if (filterInput) {
-        // Debounced input handler (300ms delay)
-        let debounceTimer;
-        filterInput.addEventListener('input', function() {
-            clearTimeout(debounceTimer);
-            debounceTimer = setTimeout(() => {
-                filterTables(this.value);
-            }, 300);
-        });
-
-        // Enter key applies filter immediately
-        filterInput.addEventListener('keydown', function(e) {
-            if (e.key === 'Enter') {
-                clearTimeout(debounceTimer);
-                filterTables(this.value);
-            } else if (e.key === 'Escape') {
-                clearFilter();
-            }
-        });
-    }
-
-    function filterTables(pattern) {
-        const tables = document.querySelectorAll('.metrics-table, .results-table');
-        let totalRows = 0;
-        let matchedRows = 0;
-
-        // Clear error state
-        filterInput.classList.remove('error');
-
-        if (!pattern) {
-            // Show all rows if filter is empty
-            tables.forEach(table => {
-                const rows = table.querySelectorAll('tbody tr');
-                rows.forEach(row => {
-                    row.style.display = '';
-                    totalRows++;
-                });
-            });
-            matchCount.textContent = '';
-            return;
-        }
-
-        // Try to create regex, fall back to plain text search if invalid
-        let regex;
-        let isRegex = true;
-        try {
-            regex = new RegExp(pattern, 'i');
-        } catch (e) {
-            isRegex = false;
-            filterInput.classList.add('error');
-            matchCount.textContent = '⚠️ Invalid regex pattern - using plain text search';
-            matchCount.style.color = '#ef4444';
-        }
-
-        tables.forEach(table => {
-            const rows = table.querySelectorAll('tbody tr');
-
-            rows.forEach(row => {
-                totalRows++;
-                const text = row.textContent || row.innerText;
-                let matches = false;
-
-                if (isRegex) {
-                    matches = regex.test(text);
-                } else {
-                    matches = text.toLowerCase().includes(pattern.toLowerCase());
-                }
-
-                if (matches) {
-                    row.style.display = '';
-                    matchedRows++;
-                } else {
-                    row.style.display = 'none';
-                }
-            });
-        });
-
-        matchCount.textContent = `Showing ${matchedRows} of ${totalRows} rows`;
-        matchCount.style.color = matchedRows === 0 ? '#ef4444' : '#16a34a';
-    }
-
-    function clearFilter() {
-        filterInput.value = '';
-        filterInput.classList.remove('error');
-        filterTables('');
-    }
-</script>
-    """
-
 # Enhanced MultiFormatOutputGenerator to include HTML
 class EnhancedMultiFormatOutputGenerator(MultiFormatOutputGenerator):
     """Extended multi-format generator with HTML support."""
     
-    def __init__(self, schema_manager=None, base_url=''):
-        super().__init__(schema_manager)
+    def __init__(self, schema_manager=None, base_url='', compact_json=False, html_mode='inline',
+                 compress_csv=False):
         self.base_url = base_url
-        self.generators['html'] = HtmlOutputGenerator()
-        self.generators['csv'] = CsvOutputGenerator(base_url=base_url)
+        self.compact_json = compact_json
+        self.html_mode = html_mode
+        self.compress_csv = compress_csv
+        self._stream = None
+        # PipelineInstrumentation set by the orchestrator; times each format as output:<format>
+        self.instrumentation = None
+        super().__init__(schema_manager)
+    
+    def _create_generator(self, format_name):
+        """New generator for a format, configured with this generator's options."""
+        if format_name == 'json' and self.schema_manager:
+            return SchemaAwareOutputGenerator(self.schema_manager, compact=self.compact_json)
+        if format_name == 'html' and self.html_mode == 'paged':
+            from .html_paged import PagedHtmlOutputGenerator
+            return PagedHtmlOutputGenerator()
+        if format_name == 'csv':
+            return load_generator_class('csv')(base_url=self.base_url, compress=self.compress_csv)
+        return super()._create_generator(format_name)
     
     def generate_output(self, results, output_path, git_branch=None, execution_label=None):
         """Generate output with HTML support and metadata."""
-        base_path = Path(output_path)
-        base_name = base_path.stem
-        base_dir = base_path.parent
-
         for format_name in self.enabled_formats:
             if format_name in self.generators:
                 try:
-                    if format_name == 'html':
-                        format_path = base_dir / f"{base_name}.html"
-                    elif format_name == 'json':
-                        format_path = base_dir / f"{base_name}.json"
-                    elif format_name == 'csv':
-                        format_path = base_dir / f"{base_name}.csv"
-                    elif format_name == 'xml':
-                        format_path = base_dir / f"{base_name}.xml"
-                    else:
-                        format_path = base_dir / f"{base_name}.{format_name}"
+                    format_path = self._format_path(output_path, format_name)
+                    self._generate_format(format_name, results, format_path, git_branch, execution_label)
+                except Exception as e:
+                    print(f"Error generating {format_name} output: {e}")
+    
+    def begin_output(self, output_path, git_branch=None, execution_label=None):
+        """Start an incremental run over all enabled formats.
 
-                    # Pass metadata only to JSON generator (others don't need it)
+        Formats whose generator can stream (begin_output/add_result/finish_output)
+        are written as results arrive; results for the others are buffered and
+        handed to their generate_output() by finish_output().
+        """
+        self.abort_output()
+        self._stream = {
+            'output_path': output_path,
+            'git_branch': git_branch,
+            'execution_label': execution_label,
+            'streaming': [],
+            'buffered': [],
+            'results': []
+        }
+        
+        for format_name in self.enabled_formats:
+            generator = self.generators.get(format_name)
+            if generator is None:
+                continue
+            if not hasattr(generator, 'begin_output'):
+                self._stream['buffered'].append(format_name)
+                continue
+            try:
+                format_path = self._format_path(output_path, format_name)
+                with timed(self.instrumentation, f'output:{format_name}'):
                     if format_name == 'json':
-                        self.generators[format_name].generate_output(results, str(format_path),
-                                                                    git_branch=git_branch,
-                                                                    execution_label=execution_label)
+                        generator.begin_output(format_path, git_branch=git_branch, execution_label=execution_label)
                     else:
-                        self.generators[format_name].generate_output(results, str(format_path))
-                except Exception as e:
-                    print(f"Error generating {format_name} output: {e}")
+                        generator.begin_output(format_path)
+                self._stream['streaming'].append(format_name)
+            except Exception as e:
+                print(f"Error generating {format_name} output: {e}")
+    
+    def add_result(self, result):
+        """Pass one result to the streaming formats and buffer it for the rest."""
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("begin_output() must be called before add_result()")
+        
+        for format_name in list(stream['streaming']):
+            try:
+                with timed(self.instrumentation, f'output:{format_name}'):
+                    self.generators[format_name].add_result(result)
+            except Exception as e:
+                print(f"Error generating {format_name} output: {e}")
+                self.generators[format_name].abort_output()
+                stream['streaming'].remove(format_name)
+        
+        if stream['buffered']:
+            stream['results'].append(result)
+    
+    def finish_output(self):
+        """Complete the streaming formats and generate the buffered ones."""
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("begin_output() must be called before finish_output()")
+        self._stream = None
+        
+        for format_name in self.enabled_formats:
+            try:
+                if format_name in stream['streaming']:
+                    with timed(self.instrumentation, f'output:{format_name}'):
+                        self.generators[format_name].finish_output()
+                elif format_name in stream['buffered']:
+                    format_path = self._format_path(stream['output_path'], format_name)
+                    self._generate_format(format_name, stream['results'], format_path,
+                                          stream['git_branch'], stream['execution_label'])
+            except Exception as e:
+                print(f"Error generating {format_name} output: {e}")
+                if format_name in stream['streaming']:
+                    self.generators[format_name].abort_output()
+    
+    def abort_output(self):
+        """Close any partially written streaming outputs."""
+        stream = self._stream
+        self._stream = None
+        if stream is not None:
+            for format_name in stream['streaming']:
+                self.generators[format_name].abort_output()
+    
+    def _format_path(self, output_path, format_name) -> str:
+        """Output file for a format: the base name with the format as extension."""
+        base_path = Path(output_path)
+        return str(base_path.parent / f"{base_path.stem}.{format_name}")
+    
+    def _generate_format(self, format_name, results, format_path, git_branch, execution_label):
+        """Run one format's generate_output()."""
+        with timed(self.instrumentation, f'output:{format_name}'):
+            # Pass metadata only to JSON generator (others don't need it)
+            if format_name == 'json':
+                self.generators[format_name].generate_output(results, format_path,
+                                                            git_branch=git_branch,
+                                                            execution_label=execution_label)
+            else:
+                self.generators[format_name].generate_output(results, format_path)
 
@@ -0,0 +1,246 @@
+"""
+Paged HTML output generator.
+
+For large campaigns the inline HTML report grows to tens of MB, most of it
+table rows, and the browser stalls parsing and laying them out. This mode
+writes the same document without the rows: the metrics tables, file lists
+and the detailed results table get a placeholder, and their rows go to a
+gzip-compressed NDJSON sidecar (<report>.rows.ndjson.gz, one
+{"table": ..., "row": ...} record per row). The page streams the sidecar in,
+decompressing as it arrives, and only ever puts the current page of each
+table into the DOM; the regex filter runs over the loaded rows.
+
+The sidecar is fetched, so the report has to be served over HTTP (e.g.
+`python3 -m http.server` in the report directory); browsers block fetch()
+from file:// pages.
+"""
+
+import gzip
+import json
+import os
+from typing import Iterable, Iterator, List
+
+from ..models.data_models import ProcessedResult
+from .html_report import HtmlOutputGenerator
+
+
+SIDECAR_SUFFIX = '.rows.ndjson'
+
+
+class PagedHtmlOutputGenerator(HtmlOutputGenerator):
+    """HTML generator that loads table rows lazily from a compressed sidecar."""
+
+    def __init__(self, page_size: int = 100, compress: bool = True, **kwargs):
+        super().__init__(**kwargs)
+        self.page_size = page_size
+        self.compress = compress
+        self._sidecar = None
+        self._sidecar_name = None
+
+    def generate_output(self, results: List[ProcessedResult], output_path: str) -> None:
+        """Generate the HTML shell and its row sidecar."""
+        if not output_path.endswith('.html'):
+            output_path = output_path.replace('.json', '.html').replace('.xml', '.html')
+            if not output_path.endswith('.html'):
+                output_path += '.html'
+
+        sidecar_path = output_path[:-len('.html')] + SIDECAR_SUFFIX + ('.gz' if self.compress else '')
+        self._sidecar_name = os.path.basename(sidecar_path)
+        try:
+            if self.compress:
+                sidecar = gzip.open(sidecar_path, 'wt', encoding='utf-8', compresslevel=6)
+            else:
+                sidecar = open(sidecar_path, 'w', encoding='utf-8')
+            with sidecar, open(output_path, 'w', encoding='utf-8') as f:
+                self._sidecar = sidecar
+                f.writelines(self._iter_html_report(results))
+
+            print(f"HTML report generated: {output_path} (rows in {sidecar_path})")
+        except Exception as e:
+            print(f"Error generating HTML output: {e}")
+        finally:
+            self._sidecar = None
+
+    def _table_rows(self, table_id: str, rows: Iterable[str]) -> Iterator[str]:
+        """Write the rows to the sidecar and leave a placeholder in the document."""
+        if self._sidecar is None:
+            # Called outside generate_output (e.g. _build_html_report): inline
+            yield from rows
+            return
+
+        write = self._sidecar.write
+        for row in rows:
+            write(json.dumps({'table': table_id, 'row': row.strip()}, ensure_ascii=False))
+            write('\n')
+
+        tag = 'li' if table_id.startswith('files-') else 'tr'
+        yield f'<{tag} class="lazy-rows" data-table="{table_id}"></{tag}>'
+
+    def _get_javascript(self) -> str:
+        """Loader, pager and filter for the lazily loaded tables."""
+        if self._sidecar is None:
+            return super()._get_javascript()
+        return """
+<script>
+    const ROWS_URL = __ROWS_URL__;
+    const PAGE_SIZE = __PAGE_SIZE__;
+    const tables = {};
+    const filterInput = document.getElementById('filterInput');
+    const matchCount = document.getElementById('matchCount');
+    let filterRegex = null;
+    let filterText = '';
+
+    document.querySelectorAll('.lazy-rows').forEach(placeholder => {
+        const container = placeholder.parentElement;
+        const anchor = container.closest('table') || container;
+        const pager = document.createElement('div');
+        pager.className = 'pager';
+        pager.style.cssText = 'margin: 8px 0; display: flex; gap: 8px; align-items: center; color: #64748b;';
+        pager.innerHTML = '<button type="button" data-step="-1">&lsaquo; Prev</button>' +
+            '<span class="pager-status">Loading...</span>' +
+            '<button type="button" data-step="1">Next &rsaquo;</button>';
+        anchor.insertAdjacentElement('afterend', pager);
+        const table = {container: container, pager: pager, rows: [], texts: [], view: null, page: 0};
+        pager.querySelectorAll('button').forEach(button => {
+            button.addEventListener('click', () => {
+                table.page += parseInt(button.dataset.step, 10);
+                render(table);
+            });
+        });
+        tables[placeholder.dataset.table] = table;
+        placeholder.remove();
+    });
+
+    function rowText(table, index) {
+        if (table.texts[index] === undefined) {
+            table.texts[index] = table.rows[index].replace(/<[^>]*>/g, ' ');
+        }
+        return table.texts[index];
+    }
+
+    function matches(table, index) {
+        if (filterRegex) return filterRegex.test(rowText(table, index));
+        if (filterText) return rowText(table, index).toLowerCase().includes(filterText);
+        return true;
+    }
+
+    function applyFilter(table) {
+        if (!filterRegex && !filterText) {
+            table.view = null;
+            return;
+        }
+        table.view = [];
+        for (let i = 0; i < table.rows.length; i++) {
+            if (matches(table, i)) table.view.push(i);
+        }
+    }
+
+    function render(table) {
+        const total = table.view ? table.view.length : table.rows.length;
+        const pages = Math.max(1, Math.ceil(total / PAGE_SIZE));
+        table.page = Math.min(Math.max(table.page, 0), pages - 1);
+        const start = table.page * PAGE_SIZE;
+        const end = Math.min(start + PAGE_SIZE, total);
+        const html = [];
+        for (let i = start; i < end; i++) {
+            html.push(table.rows[table.view ? table.view[i] : i]);
+        }
+        table.container.innerHTML = html.join('');
+        table.pager.querySelector('.pager-status').textContent =
+            total ? `Rows ${start + 1}-${end} of ${total} (page ${table.page + 1} of ${pages})` : 'No rows';
+        table.pager.querySelector('[data-step="-1"]').disabled = table.page === 0;
+        table.pager.querySelector('[data-step="1"]').disabled = table.page >= pages - 1;
+    }
+
+    function renderAll() {
+        let shown = 0;
+        let total = 0;
+        Object.values(tables).forEach(table => {
+            applyFilter(table);
+            render(table);
+            total += table.rows.length;
+            shown += table.view ? table.view.length : table.rows.length;
+        });
+        if (matchCount && (filterRegex || filterText)) {
+            matchCount.textContent = `Showing ${shown} of ${total} rows`;
+            matchCount.style.color = shown === 0 ? '#ef4444' : '#16a34a';
+        }
+    }
+
+    function setFilter(pattern) {
+        filterRegex = null;
+        filterText = '';
+        filterInput.classList.remove('error');
+        if (matchCount) matchCount.textContent = '';
+        if (pattern) {
+            try {
+                filterRegex = new RegExp(pattern, 'i');
+            } catch (e) {
+                filterText = pattern.toLowerCase();
+                filterInput.classList.add('error');
+            }
+        }
+        Object.values(tables).forEach(table => { table.page = 0; });
+        renderAll();
+    }
+
+    if (filterInput) {
+        let debounceTimer;
+        filterInput.addEventListener('input', function() {
+            clearTimeout(debounceTimer);
+            debounceTimer = setTimeout(() => setFilter(this.value), 300);
+        });
+        filterInput.addEventListener('keydown', function(e) {
+            if (e.key === 'Enter') {
+                clearTimeout(debounceTimer);
+                setFilter(this.value);
+            } else if (e.key === 'Escape') {
+                this.value = '';
+                setFilter('');
+            }
+        });
+    }
+
+    function addRecord(line) {
+        if (!line) return;
+        const record = JSON.parse(line);
+        const table = tables[record.table];
+        if (table) table.rows.push(record.row);
+    }
+
+    async function loadRows() {
+        const response = await fetch(ROWS_URL);
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        let stream = response.body;
+        if (ROWS_URL.endsWith('.gz')) {
+            if (typeof DecompressionStream === 'undefined') throw new Error('browser cannot decompress gzip');
+            stream = stream.pipeThrough(new DecompressionStream('gzip'));
+        }
+        const reader = stream.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        let lastRender = 0;
+        for (;;) {
+            const {value, done} = await reader.read();
+            if (done) break;
+            const lines = (buffer + value).split('\\n');
+            buffer = lines.pop();
+            lines.forEach(addRecord);
+            // Show the first pages while the rest is still arriving
+            if (Date.now() - lastRender > 500) {
+                renderAll();
+                lastRender = Date.now();
+            }
+        }
+        addRecord(buffer);
+        renderAll();
+    }
+
+    loadRows().catch(error => {
+        Object.values(tables).forEach(table => {
+            table.pager.querySelector('.pager-status').textContent =
+                `Could not load ${ROWS_URL} (${error.message}). Serve this directory over HTTP, ` +
+                'e.g. python3 -m http.server';
+        });
+    });
+</script>
+    """.replace('__ROWS_URL__', json.dumps(self._sidecar_name)).replace('__PAGE_SIZE__', str(int(self.page_size)))
@@ -0,0 +1,100 @@
+"""
+Incremental JSON writer.
+
+Writes a single top-level JSON object member by member, with arrays whose
+items can be appended one at a time, so large reports never have to exist as
+one in-memory tree. With an indent the bytes written are the same as
+json.dump(..., indent=indent) of the equivalent dict.
+"""
+
+import json
+from typing import Any, IO, Optional
+
+
+class JsonStreamWriter:
+    """Streams one JSON object to a text file."""
+
+    def __init__(self, fileobj: IO[str], indent: Optional[int] = 2,
+                 ensure_ascii: bool = False, compact: bool = False):
+        self.fileobj = fileobj
+        self.ensure_ascii = ensure_ascii
+        if compact:
+            self.indent = None
+            self.separators = (',', ':')
+        else:
+            self.indent = indent
+            self.separators = (',', ': ') if indent is not None else (', ', ': ')
+
+        self._members_written = 0
+        self._array_items = None  # item count of the array being streamed, if any
+        self._closed = False
+
+        self.fileobj.write('{')
+
+    def write_member(self, key: str, value: Any) -> None:
+        """Write a complete "key": value member."""
+        self._start_member(key)
+        self.fileobj.write(self._encode(value, level=1))
+
+    def begin_array(self, key: str) -> None:
+        """Start a "key": [ ... ] member whose items are added with write_item()."""
+        if self._array_items is not None:
+            raise RuntimeError("Array already open")
+        self._start_member(key)
+        self.fileobj.write('[')
+        self._array_items = 0
+
+    def write_item(self, value: Any) -> None:
+        """Append one item to the open array."""
+        if self._array_items is None:
+            raise RuntimeError("No array open")
+        if self._array_items:
+            self.fileobj.write(self.separators[0])
+        self.fileobj.write(self._newline(2))
+        self.fileobj.write(self._encode(value, level=2))
+        self._array_items += 1
+
+    def end_array(self) -> None:
+        """Close the open array."""
+        if self._array_items is None:
+            raise RuntimeError("No array open")
+        if self._array_items:
+            self.fileobj.write(self._newline(1))
+        self.fileobj.write(']')
+        self._array_items = None
+
+    def close(self) -> None:
+        """Close the top-level object. Does not close the file."""
+        if self._closed:
+            return
+        if self._array_items is not None:
+            self.end_array()
+        if self._members_written:
+            self.fileobj.write(self._newline(0))
+        self.fileobj.write('}')
+        self._closed = True
+
+    def _start_member(self, key: str) -> None:
+        if self._closed:
+            raise RuntimeError("Writer already closed")
+        if self._array_items is not None:
+            raise RuntimeError("Array still open")
+        if self._members_written:
+            self.fileobj.write(self.separators[0])
+        self.fileobj.write(self._newline(1))
+        self.fileobj.write(json.dumps(key, ensure_ascii=self.ensure_ascii))
+        self.fileobj.write(self.separators[1])
+        self._members_written += 1
+
+    def _newline(self, level: int) -> str:
+        if self.indent is None:
+            return ''
+        return '\n' + ' ' * (self.indent * level)
+
+    def _encode(self, value: Any, level: int) -> str:
+        text = json.dumps(value, indent=self.indent, separators=self.separators,
+                          ensure_ascii=self.ensure_ascii)
+        if self.indent:
+            # JSON strings never contain raw newlines, so every newline is layout
+            text = text.replace('\n', '\n' + ' ' * (self.indent * level))
+        return text
@@ -0,0 +1,227 @@
+"""
+Columnar (Parquet) output generator.
+
+Writes one flat row per iteration x result, so analysis tools can load a
+report without re-parsing and re-flattening the nested JSON. Key tags and
+parameters become one column each (tag_<name>, param_<name>), metrics are
+float64 columns, sample timestamps are real timestamp columns, and every
+string column is dictionary-encoded (the same handful of values repeats
+across thousands of rows).
+
+Requires pyarrow; without it the format reports an error and is skipped.
+"""
+
+import datetime
+from typing import Any, Dict, List, Optional
+
+from ..models.data_models import ProcessedResult
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Fixed leading columns, in output order: name -> kind
+BASE_COLUMNS = {
+    'file': 'string',
+    'benchmark': 'string',
+    'run_id': 'string',
+    'status': 'string',
+    'file_modified': 'timestamp',
+    'iteration_id': 'string',
+    'result_type': 'string',
+    'unit': 'string',
+    'sample_count': 'int',
+    'mean': 'float',
+    'min': 'float',
+    'max': 'float',
+    'stddev': 'float',
+    'stddevpct': 'float',
+    'busyCPU': 'float',
+    'begin': 'timestamp',
+    'end': 'timestamp',
+}
+
+TAG_PREFIX = 'tag_'
+PARAM_PREFIX = 'param_'
+
+
+class ParquetOutputGenerator:
+    """Parquet output generator - one row per iteration result."""
+
+    def __init__(self, compression: str = 'snappy', row_group_size: int = 64 * 1024):
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self._stream = None
+
+    def generate_output(self, results: List[ProcessedResult], output_path: str) -> None:
+        """Generate the Parquet file for a complete list of results."""
+        try:
+            self.begin_output(output_path)
+            for result in results:
+                self.add_result(result)
+            self.finish_output()
+        except Exception as e:
+            self.abort_output()
+            print(f"Error generating Parquet output: {e}")
+
+    def begin_output(self, output_path: str) -> None:
+        """Start collecting rows for output_path.
+
+        Rows are accumulated column by column (scalars only, no result
+        objects are kept) and written by finish_output().
+        """
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow is not installed; install it to enable parquet output")
+        self._stream = {
+            'output_path': output_path,
+            'columns': {name: [] for name in BASE_COLUMNS},
+            'rows': 0
+        }
+
+    def add_result(self, result: ProcessedResult) -> None:
+        """Add the rows of one result."""
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("begin_output() must be called before add_result()")
+
+        data = result.data
+        common_params = data.get('common_params', {}) or {}
+        key_tags = data.get('key_tags', {}) or {}
+        file_modified = _to_timestamp(data.get('file_modified'), 1.0)
+        status = result.processing_metadata.get('status', data.get('processing_status'))
+
+        for iteration in data.get('iterations', []) or []:
+            params = dict(common_params)
+            params.update(iteration.get('unique_params', {}) or {})
+            begin, end = _sample_window(iteration.get('samples', []) or [])
+
+            row_base = {
+                'file': result.regulus_data,
+                'benchmark': result.benchmark,
+                'run_id': data.get('run_id'),
+                'status': status,
+                'file_modified': file_modified,
+                'iteration_id': iteration.get('iteration_id'),
+                'begin': begin,
+                'end': end,
+            }
+            for key, value in key_tags.items():
+                row_base[TAG_PREFIX + key] = _to_string(value)
+            for key, value in params.items():
+                row_base[PARAM_PREFIX + key] = _to_string(value)
+
+            # An iteration without results still gets a row (metrics null)
+            for iteration_result in iteration.get('results', []) or [{}]:
+                row = dict(row_base)
+                row.update({
+                    'result_type': iteration_result.get('type'),
+                    'unit': iteration_result.get('unit'),
+                    'sample_count': _to_int(iteration_result.get('sample_count')),
+                    'mean': _to_float(iteration_result.get('mean')),
+                    'min': _to_float(iteration_result.get('min')),
+                    'max': _to_float(iteration_result.get('max')),
+                    'stddev': _to_float(iteration_result.get('stddev')),
+                    'stddevpct': _to_float(iteration_result.get('stddevpct')),
+                    'busyCPU': _to_float(iteration_result.get('busyCPU')),
+                })
+                self._append_row(row)
+
+    def finish_output(self) -> None:
+        """Build the table and write the Parquet file."""
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("begin_output() must be called before finish_output()")
+        self._stream = None
+
+        table = self._build_table(stream['columns'])
+        pq.write_table(table, stream['output_path'], compression=self.compression,
+                       row_group_size=self.row_group_size)
+        print(f"Parquet output generated: {stream['output_path']} ({stream['rows']} rows)")
+
+    def abort_output(self) -> None:
+        """Drop the rows collected so far."""
+        self._stream = None
+
+    def _append_row(self, row: Dict[str, Any]) -> None:
+        stream = self._stream
+        columns = stream['columns']
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                # First time this tag/param is seen: earlier rows lack it
+                column = columns[name] = [None] * stream['rows']
+            column.append(value)
+        stream['rows'] += 1
+        for column in columns.values():
+            if len(column) < stream['rows']:
+                column.append(None)
+
+    def _build_table(self, columns: Dict[str, list]) -> 'pa.Table':
+        """Typed Arrow table: base columns first, then tag_* and param_* sorted."""
+        extra = sorted(name for name in columns if name not in BASE_COLUMNS)
+        names = list(BASE_COLUMNS) + [name for name in extra if name.startswith(TAG_PREFIX)] \
+            + [name for name in extra if not name.startswith(TAG_PREFIX)]
+
+        arrays = []
+        for name in names:
+            kind = BASE_COLUMNS.get(name, 'string')
+            values = columns[name]
+            if kind == 'string':
+                arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+            elif kind == 'int':
+                arrays.append(pa.array(values, type=pa.int64()))
+            elif kind == 'float':
+                arrays.append(pa.array(values, type=pa.float64()))
+            else:
+                arrays.append(pa.array(values, type=pa.timestamp('ms', tz='UTC')))
+        return pa.Table.from_arrays(arrays, names=names)
+
+
+def _to_string(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    number = _to_float(value)
+    return int(number) if number is not None and number.is_integer() else None
+
+
+def _to_timestamp(value: Any, seconds_per_unit: float) -> Optional[datetime.datetime]:
+    """Convert an epoch number (in units of seconds_per_unit) to an aware datetime."""
+    number = _to_float(value)
+    if number is None or number != number:
+        return None
+    try:
+        return datetime.datetime.fromtimestamp(number * seconds_per_unit, tz=datetime.timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _sample_window(samples: List[Dict[str, Any]]):
+    """Earliest sample begin and latest sample end (epoch milliseconds in the data)."""
+    begins = [s.get('begin') for s in samples if _to_float(s.get('begin')) is not None]
+    ends = [s.get('end') for s in samples if _to_float(s.get('end')) is not None]
+    begin = _to_timestamp(min(begins, key=float), 0.001) if begins else None
+    end = _to_timestamp(max(ends, key=float), 0.001) if ends else None
+    return begin, end
@@ -0,0 +1,39 @@
+"""
+Registry of output formats.
+
+Maps a format name to the module and class of its generator. Modules are
+only imported when a generator for the format is requested, so a run that
+writes JSON and CSV never loads the HTML generator or pyarrow.
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+
+# format name -> (module, relative to this package or absolute; generator class name)
+OUTPUT_FORMATS: Dict[str, Tuple[str, str]] = {
+    'json': ('.generators', 'JsonOutputGenerator'),
+    'csv': ('.csv_report', 'CsvOutputGenerator'),
+    'xml': ('.xml_report', 'XmlOutputGenerator'),
+    'html': ('.html_report', 'HtmlOutputGenerator'),
+    'parquet': ('.parquet', 'ParquetOutputGenerator'),
+}
+
+
+def register_format(format_name: str, module: str, class_name: str) -> None:
+    """Register (or replace) the generator class for a format."""
+    OUTPUT_FORMATS[format_name] = (module, class_name)
+
+
+def load_generator_class(format_name: str) -> Optional[type]:
+    """Import and return the generator class of a format (None if unknown)."""
+    entry = OUTPUT_FORMATS.get(format_name)
+    if entry is None:
+        return None
+    module, class_name = entry
+    return getattr(importlib.import_module(module, __package__), class_name)
+
+
+def available_formats() -> List[str]:
+    """Names of all registered formats."""
+    return list(OUTPUT_FORMATS)
@@ -0,0 +1,81 @@
+"""
+XML output generator.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import List
+import datetime
+
+from ..models.data_models import ProcessedResult
+
+
+class XmlOutputGenerator:
+    """XML output generator."""
+    
+    def __init__(self, root_element: str = "build_report", pretty_print: bool = True):
+        self.root_element = root_element
+        self.pretty_print = pretty_print
+    
+    def generate_output(self, results: List[ProcessedResult], output_path: str) -> None:
+        """Generate XML output file."""
+        try:
+            root = ET.Element(self.root_element)
+            
+            # Add metadata
+            metadata_elem = ET.SubElement(root, "metadata")
+            ET.SubElement(metadata_elem, "timestamp").text = datetime.datetime.now().isoformat()
+            ET.SubElement(metadata_elem, "total_results").text = str(len(results))
+            
+            # Add results
+            results_elem = ET.SubElement(root, "results")
+            for result in results:
+                self._add_result_to_xml(results_elem, result)
+            
+            # Write to file
+            tree = ET.ElementTree(root)
+            if self.pretty_print:
+                self._indent(root)
+            
+            tree.write(output_path, encoding='utf-8', xml_declaration=True)
+            print(f"XML output generated: {output_path}")
+            
+        except Exception as e:
+            print(f"Error generating XML output: {e}")
+    
+    def _add_result_to_xml(self, parent: ET.Element, result: ProcessedResult) -> None:
+        """Add a result to the XML structure."""
+        result_elem = ET.SubElement(parent, "result")
+        result_elem.set("benchmark", result.benchmark)
+        result_elem.set("regulus_data", result.regulus_data)
+
+        for key, value in result.data.items():
+            if key in ["benchmark", "regulus_data"]:
+                continue  # Already added as attributes
+            
+            elem = ET.SubElement(result_elem, key)
+            if isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    sub_elem = ET.SubElement(elem, sub_key)
+                    sub_elem.text = str(sub_value)
+            elif isinstance(value, list):
+                for item in value:
+                    item_elem = ET.SubElement(elem, "item")
+                    item_elem.text = str(item)
+            else:
+                elem.text = str(value)
+    
+    def _indent(self, elem: ET.Element, level: int = 0) -> None:
+        """Add indentation for pretty printing."""
+        indent = "\n" + level * "  "
+        if len(elem):
+            if not elem.text or not elem.text.strip():
+                elem.text = indent + "  "
+            if not elem.tail or not elem.tail.strip():
+                elem.tail = indent
+            for elem in elem:
+                self._indent(elem, level + 1)
+            if not elem.tail or not elem.tail.strip():
+                elem.tail = indent
+        else:
+            if level and (not elem.tail or not elem.tail.strip()):
+                elem.tail = indent
@@ -4,11 +4,25 @@ Content parsing implementations.
 Handles reading and parsing file contents with various strategies.
 """
 
-from typing import Optional, Dict, Any
+import sys
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 
 from ..interfaces.protocols import ContentParserInterface
 from ..models.data_models import FileInfo
 
+try:
+    import zlib
+    ZLIB_AVAILABLE = True
+except ImportError:
+    ZLIB_AVAILABLE = False
+    print("Warning: zlib not available. Parser cache compression disabled.")
+
+
+# Bytes kept when stripping binary content: printable ASCII, tab, LF and CR
+_NON_PRINTABLE_BYTES = bytes(b for b in range(256) if not (32 <= b <= 126 or b in (9, 10, 13)))
+
 
 class TextFileParser:
     """Simple text file parser."""
@@ -28,35 +42,121 @@ class TextFileParser:
 
 
 class CachingParser:
-    """Parser with caching capabilities."""
+    """Parser with a bounded LRU cache of file contents.
+
+    Entries are keyed by (path, modification time) and evicted least recently
+    used first once either max_entries or max_bytes is exceeded; a file larger
+    than the whole byte budget is not cached at all. Sizes are the memory held
+    by the cached objects (sys.getsizeof), so max_bytes bounds the cache's
+    real footprint. With compress=True contents are stored zlib-compressed,
+    trading CPU on every hit for a much smaller footprint on text results.
+    """
     
-    def __init__(self, base_parser: ContentParserInterface):
+    def __init__(self, base_parser: ContentParserInterface,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 max_entries: int = 4096,
+                 compress: bool = False,
+                 compression_level: int = 1):
         self.base_parser = base_parser
-        self._cache: Dict[tuple, str] = {}
-    
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.compress = compress and ZLIB_AVAILABLE
+        self.compression_level = compression_level
+        self._cache: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    def __getstate__(self):
+        # Settings only (the lock cannot be pickled): a process worker starts with an empty cache
+        return {'base_parser': self.base_parser, 'max_bytes': self.max_bytes,
+                'max_entries': self.max_entries, 'compress': self.compress,
+                'compression_level': self.compression_level}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
     def parse_file(self, file_info: FileInfo) -> Optional[str]:
         """Parse file with caching based on modification time."""
         cache_key = (str(file_info.path), file_info.modified_time)
         
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                self._cache.move_to_end(cache_key)
+                self.stats['hits'] += 1
+            else:
+                self.stats['misses'] += 1
+        
+        if entry is not None:
+            return self._unpack(entry[0])
         
         content = self.base_parser.parse_file(file_info)
         if content is not None:
-            self._cache[cache_key] = content
+            self._store(cache_key, content)
         
         return content
     
     def clear_cache(self) -> None:
         """Clear the parser cache."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._total_bytes = 0
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        return {
-            "cache_size": len(self._cache),
-            "memory_usage_estimate": sum(len(content) for content in self._cache.values())
-        }
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            stats = self.stats.copy()
+            stats.update({
+                "cache_size": len(self._cache),
+                "memory_usage_estimate": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "compressed": self.compress,
+                "hit_rate": self.stats['hits'] / lookups if lookups else 0.0
+            })
+        return stats
+    
+    def reset_stats(self) -> None:
+        """Zero the hit/miss/eviction counters."""
+        with self._lock:
+            self.stats = self._empty_stats()
+    
+    def _store(self, cache_key: tuple, content: str) -> None:
+        payload = self._pack(content)
+        size = sys.getsizeof(payload)
+        
+        with self._lock:
+            if size > self.max_bytes:
+                self.stats['oversized'] += 1
+                return
+            
+            previous = self._cache.pop(cache_key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            self._cache[cache_key] = (payload, size)
+            self._total_bytes += size
+            self.stats['stores'] += 1
+            
+            while len(self._cache) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._cache.popitem(last=False)
+                self._total_bytes -= evicted_size
+                self.stats['evictions'] += 1
+    
+    def _pack(self, content: str) -> Any:
+        if self.compress:
+            return zlib.compress(content.encode('utf-8', 'surrogatepass'), self.compression_level)
+        return content
+    
+    def _unpack(self, payload: Any) -> str:
+        if isinstance(payload, bytes):
+            return zlib.decompress(payload).decode('utf-8', 'surrogatepass')
+        return payload
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'oversized': 0}
 
 
 class MultiEncodingParser:
@@ -115,7 +215,7 @@ class BinaryAwareParser:
                 content = f.read()
             
             # Simple text extraction - remove non-printable chars
-            text = ''.join(chr(b) for b in content if 32 <= b <= 126 or b in [9, 10, 13])
+            text = content.translate(None, _NON_PRINTABLE_BYTES).decode('ascii')
             return text if text.strip() else None
             
         except Exception as e:
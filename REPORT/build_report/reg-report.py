@@ -3,33 +3,119 @@
  Usage:
     $ find /home/user/this-run/REPORT/ -name "__pycache__" -exec rm -rf {} +
     $ python3.9 /home/user/this-run/reg-report.py --formats html  --output nvd_report  --root /home/user/regulus
+    $ python3.9 -m build_report.reg-report --formats json --workers 16 --executor process
+    $ python3.9 -m build_report.reg-report --formats json --cache-dir generated/.cache
+    $ python3.9 -m build_report.reg-report --formats json --pipeline --workers 8 --executor thread
+    $ python3.9 -m build_report.reg-report --formats json parquet
+    $ python3.9 -m build_report.reg-report --formats json html --merge lab1/report.json lab2/report.json
 
 """
 import argparse
-from .factories import create_multi_format_orchestrator
+from pathlib import Path
+from .factories import create_multi_format_orchestrator, create_report_merger
+from .instrumentation.timing import PipelineInstrumentation
 import sys
 
 # CLI parser for wrapper
 parser = argparse.ArgumentParser(description="Wrapper for main.py to support multiple output formats")
 parser.add_argument('--root', type=str, default='.', help='Root directory to scan for result-summary.txt')
 parser.add_argument('--output', type=str, default='report', help='Base name for output files')
-parser.add_argument('--formats', nargs='+', default=['json', 'html', 'csv'], help='Output formats')
+parser.add_argument('--formats', nargs='+', default=['json', 'html', 'csv'],
+                    help='Output formats (json, html, csv, xml, parquet)')
 parser.add_argument('--base-url', type=str, default='', help='Base URL for CSV hyperlinks')
 # New execution metadata arguments
 parser.add_argument('--git-branch', type=str, default=None, help='Git branch name for execution context')
 parser.add_argument('--execution-label', type=str, default=None, help='Execution label for test campaign grouping')
-args = parser.parse_args()
+# Parallel processing
+parser.add_argument('--workers', type=int, default=1, help='Number of parallel workers (1 = sequential)')
+parser.add_argument('--executor', choices=['thread', 'process'], default='process',
+                    help='Parallel executor used when --workers > 1')
+parser.add_argument('--discovery-workers', type=int, default=1,
+                    help='Threads walking top-level subdirectories during discovery (helps on NFS)')
+parser.add_argument('--pipeline', action='store_true',
+                    help='Overlap discovery, processing and output generation (uses --workers/--executor)')
+# Incremental builds
+parser.add_argument('--cache-dir', type=str, default=None,
+                    help='Directory for the persistent per-file result cache (disabled if not set)')
+parser.add_argument('--compact-json', action='store_true',
+                    help='Write the JSON report without indentation (smaller, faster to write)')
+parser.add_argument('--html-mode', choices=['inline', 'paged'], default='inline',
+                    help='HTML tables inline, or paged from a compressed rows sidecar (large reports; serve over HTTP)')
+parser.add_argument('--compress-csv', action='store_true',
+                    help='Write the CSV report gzip-compressed (<output>.csv.gz)')
+# Merging
+parser.add_argument('--merge', nargs='+', default=None, metavar='SOURCE',
+                    help='Merge existing JSON reports and/or --cache-dir directories into one report '
+                         'instead of scanning --root (duplicate run_ids are dropped; first source wins)')
+# Profiling
+parser.add_argument('--profile', action='store_true',
+                    help='Time every stage and write <output>.timing.json and <output>.pstats (cProfile, main process only)')
 
-# Create orchestrator with requested formats
-orchestrator = create_multi_format_orchestrator(args.formats, base_url=args.base_url)
 
-# Call generate_report with the root path and output path, plus new metadata
-orchestrator.generate_report(
-    root_path=args.root,
-    output_path=args.output,
-    git_branch=args.git_branch,
-    execution_label=args.execution_label
-)
+def main():
+    args = parser.parse_args()
+    if args.merge:
+        merger = create_report_merger(args.formats, base_url=args.base_url,
+                                      compact_json=args.compact_json,
+                                      html_mode=args.html_mode,
+                                      compress_csv=args.compress_csv)
+        stats = merger.merge(args.merge, args.output, git_branch=args.git_branch,
+                             execution_label=args.execution_label)
+        if stats['sources_failed'] or not stats['sources_merged']:
+            sys.exit(1)
+        print(f"Generated report in formats: {', '.join(args.formats)}")
+        return
 
-print(f"Generated report in formats: {', '.join(args.formats)}")
+    instrumentation = PipelineInstrumentation() if args.profile else None
 
+    # Create orchestrator with requested formats
+    orchestrator = create_multi_format_orchestrator(args.formats, base_url=args.base_url,
+                                                    workers=args.workers, executor=args.executor,
+                                                    cache_dir=args.cache_dir,
+                                                    compact_json=args.compact_json,
+                                                    pipeline=args.pipeline,
+                                                    discovery_workers=args.discovery_workers,
+                                                    html_mode=args.html_mode,
+                                                    compress_csv=args.compress_csv,
+                                                    instrumentation=instrumentation)
+
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    # Call generate_report with the root path and output path, plus new metadata
+    orchestrator.generate_report(
+        root_path=args.root,
+        output_path=args.output,
+        git_branch=args.git_branch,
+        execution_label=args.execution_label
+    )
+
+    if profiler:
+        profiler.disable()
+        write_profile(profiler, instrumentation, args.output)
+
+    print(f"Generated report in formats: {', '.join(args.formats)}")
+
+
+def write_profile(profiler, instrumentation, output):
+    """Write the timing report and cProfile stats next to the outputs."""
+    import pstats
+
+    base = Path(output)
+    timing_path = base.parent / f"{base.stem}.timing.json"
+    stats_path = base.parent / f"{base.stem}.pstats"
+    instrumentation.write_report(str(timing_path))
+    profiler.dump_stats(str(stats_path))
+
+    print("Top functions by cumulative time:")
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+    print(f"Timing report: {timing_path}")
+    print(f"Profile: {stats_path} (python3 -m pstats {stats_path})")
+
+
+# Guarded so worker processes started with 'spawn'/'forkserver' do not re-run the CLI
+if __name__ == '__main__':
+    main()
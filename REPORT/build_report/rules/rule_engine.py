@@ -6,6 +6,7 @@ Handles benchmark-specific rule sets and rule management.
 
 from typing import Dict, List
 import json
+import re
 from pathlib import Path
 
 from ..interfaces.protocols import RuleEngineInterface
@@ -13,10 +14,17 @@ from ..models.data_models import BenchmarkRuleSet, ExtractionRule
 
 
 class ConfigurableRuleEngine:
-    """Rule engine with configurable rule sets."""
+    """Rule engine with configurable rule sets.
+
+    Every rule's pattern is compiled once, when its rule set is added, and
+    get_rules_for_benchmark() hands out rule sets whose ExtractionRules carry
+    the compiled pattern. Compiled rule sets are tracked per benchmark; a
+    benchmark whose rules change is recompiled on its next lookup.
+    """
     
     def __init__(self):
         self.rulesets: Dict[str, BenchmarkRuleSet] = {}
+        self._compiled_rulesets: Dict[str, BenchmarkRuleSet] = {}
         self._initialize_default_rules()
     
     def _initialize_default_rules(self):
@@ -53,13 +61,33 @@ class ConfigurableRuleEngine:
         self.rulesets["trafficgen"] = trafficgen_rules
     
     def get_rules_for_benchmark(self, benchmark: str) -> BenchmarkRuleSet:
-        """Get rules for a specific benchmark."""
-        return self.rulesets.get(benchmark, self.rulesets["default"])
+        """Get rules for a specific benchmark, with compiled patterns."""
+        ruleset = self.rulesets.get(benchmark, self.rulesets["default"])
+        if self._compiled_rulesets.get(ruleset.benchmark_name) is not ruleset:
+            self._compile_ruleset(ruleset)
+        return ruleset
     
     def add_benchmark_rules(self, ruleset: BenchmarkRuleSet) -> None:
-        """Add or update rules for a benchmark."""
+        """Add or update rules for a benchmark.
+
+        Raises re.error if one of the patterns does not compile.
+        """
+        self._compile_ruleset(ruleset)
         self.rulesets[ruleset.benchmark_name] = ruleset
     
+    def invalidate_compiled_rules(self, benchmark_name: str = None) -> None:
+        """Forget compiled rule sets (all of them if no benchmark is given)."""
+        if benchmark_name is None:
+            self._compiled_rulesets.clear()
+        else:
+            self._compiled_rulesets.pop(benchmark_name, None)
+    
+    def _compile_ruleset(self, ruleset: BenchmarkRuleSet) -> None:
+        """Compile every rule of a rule set and remember it as compiled."""
+        for rule in ruleset.rules + (ruleset.metadata_rules or []):
+            rule.compiled_pattern()
+        self._compiled_rulesets[ruleset.benchmark_name] = ruleset
+    
     def list_available_benchmarks(self) -> List[str]:
         """List all available benchmark rule sets."""
         return list(self.rulesets.keys())
@@ -68,6 +96,7 @@ class ConfigurableRuleEngine:
         """Remove rules for a benchmark."""
         if benchmark_name in self.rulesets and benchmark_name != "default":
             del self.rulesets[benchmark_name]
+            self.invalidate_compiled_rules(benchmark_name)
             return True
         return False
 
@@ -168,9 +197,21 @@ class DynamicRuleEngine(ConfigurableRuleEngine):
     def __init__(self):
         super().__init__()
         self._rule_change_callbacks = []
+        # Changed benchmarks are recompiled on their next lookup (a bound method, so the engine stays picklable)
+        self.add_rule_change_callback(self._on_rule_change)
+
+    def _on_rule_change(self, benchmark_name: str, action: str, rule: ExtractionRule) -> None:
+        """Drop the compiled rules of a changed benchmark."""
+        self.invalidate_compiled_rules(benchmark_name)
     
     def add_rule_to_benchmark(self, benchmark_name: str, rule: ExtractionRule, is_metadata: bool = False) -> bool:
         """Add a single rule to an existing benchmark."""
+        try:
+            rule.compiled_pattern()
+        except re.error as e:
+            print(f"Invalid pattern for rule {rule.field_name}: {e}")
+            return False
+        
         if benchmark_name not in self.rulesets:
             # Create new benchmark ruleset
             self.rulesets[benchmark_name] = BenchmarkRuleSet(
@@ -1,63 +1,161 @@
 """
 Schema management for the build report generator.
 
-Handles schema definitions, validation, and version management.
+Handles schema definitions, validation, and version management. Schema
+versions are only built (and their modules imported) when first used, and
+each gets its validators (whole report, single result, report frame)
+compiled once and reused. jsonschema itself is imported by the first
+validation, so runs that never validate do not pay for it.
 """
 
+import importlib
+import importlib.util
 import json
 from typing import Dict, Any, Optional, Tuple
 
 from ..interfaces.protocols import SchemaManagerInterface
 from ..models.data_models import SchemaVersion, SchemaInfo
-from .versions.v1_0 import get_v1_0_schema
-from .versions.v1_1 import get_v1_1_schema  
-from .versions.v2_0 import get_v2_0_schema
 
-try:
-    from jsonschema import validate, ValidationError
-    JSONSCHEMA_AVAILABLE = True
-except ImportError:
-    JSONSCHEMA_AVAILABLE = False
+JSONSCHEMA_AVAILABLE = importlib.util.find_spec('jsonschema') is not None
+if not JSONSCHEMA_AVAILABLE:
     print("Warning: jsonschema not available. Schema validation disabled.")
 
 
+# Builders of the bundled schema versions (module in .versions, function),
+# imported and called when a version is first used
+SCHEMA_BUILDERS = {
+    SchemaVersion.V1_0.value: ('v1_0', 'get_v1_0_schema'),
+    SchemaVersion.V1_1.value: ('v1_1', 'get_v1_1_schema'),
+    SchemaVersion.V2_0.value: ('v2_0', 'get_v2_0_schema')
+}
+
+# Formats checked during validation. date-time is left out: timestamps are
+# written as local time without a UTC offset, which RFC 3339 (and so the
+# date-time checker, when rfc3339-validator is installed) rejects.
+CHECKED_FORMATS = ('date',)
+
+
 class SchemaManager:
     """Manages report schemas and validation."""
     
     def __init__(self, schema_version: SchemaVersion = SchemaVersion.V2_0):
         self.schema_version = schema_version
-        self.schemas = self._initialize_schemas()
-    
-    def _initialize_schemas(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize all supported schemas."""
-        return {
-            SchemaVersion.V1_0.value: get_v1_0_schema(),
-            SchemaVersion.V1_1.value: get_v1_1_schema(),
-            SchemaVersion.V2_0.value: get_v2_0_schema()
-        }
+        # Schemas built so far, by version
+        self.schemas = {}
+        # (kind, version) -> compiled validator; kind is 'report', 'result' or 'frame'
+        self._validators = {}
+        # version -> exported JSON text
+        self._schema_texts = {}
     
     def get_schema(self, version: str = None) -> Dict[str, Any]:
         """Get schema for specified version."""
         version = version or self.schema_version.value
-        return self.schemas.get(version, self.schemas[SchemaVersion.V1_0.value])
+        if version not in SCHEMA_BUILDERS:
+            version = SchemaVersion.V1_0.value
+        schema = self.schemas.get(version)
+        if schema is None:
+            module, builder = SCHEMA_BUILDERS[version]
+            versions = importlib.import_module(f'.versions.{module}', __package__)
+            schema = self.schemas[version] = getattr(versions, builder)()
+        return schema
     
     def validate_report(self, report_data: Dict[str, Any], version: str = None) -> Tuple[bool, Optional[str]]:
         """Validate report against schema."""
         if not JSONSCHEMA_AVAILABLE:
             return True, "Schema validation skipped (jsonschema not available)"
         
-        schema = self.get_schema(version)
-        try:
-            validate(instance=report_data, schema=schema)
-            return True, None
-        except ValidationError as e:
-            return False, str(e)
+        return self._validate('report', report_data, version)
+    
+    def validate_result(self, result_data: Dict[str, Any], version: str = None) -> Tuple[bool, Optional[str]]:
+        """Validate a single entry of the report's results array.
+
+        Lets streaming writers validate each result as it is written instead of
+        holding the whole document for validate_report().
+        """
+        if not JSONSCHEMA_AVAILABLE:
+            return True, "Schema validation skipped (jsonschema not available)"
+        
+        return self._validate('result', result_data, version)
+    
+    def validate_report_frame(self, report_data: Dict[str, Any], version: str = None) -> Tuple[bool, Optional[str]]:
+        """Validate a report without checking the entries of its results array.
+
+        Together with validate_result() on every result this covers the same
+        rules as validate_report() on the full document.
+        """
+        if not JSONSCHEMA_AVAILABLE:
+            return True, "Schema validation skipped (jsonschema not available)"
+        
+        return self._validate('frame', report_data, version)
+    
+    def _validate(self, kind: str, instance: Any, version: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """Validate instance with the cached validator; reports the same error jsonschema.validate() would."""
+        from jsonschema.exceptions import best_match
+        
+        error = best_match(self._get_validator(kind, version or self.schema_version.value).iter_errors(instance))
+        if error is not None:
+            return False, str(error)
+        return True, None
+    
+    def _get_validator(self, kind: str, version: str):
+        """Build (once per kind and version) a validator with the schema checked up front."""
+        validator = self._validators.get((kind, version))
+        if validator is None:
+            from jsonschema import FormatChecker
+            from jsonschema.validators import validator_for
+            
+            schema = self.get_schema(version)
+            if kind == 'result':
+                target = schema.get('properties', {}).get('results', {}).get('items', {})
+            elif kind == 'frame':
+                target = self._frame_schema(schema)
+            else:
+                target = schema
+            validator_class = validator_for(schema)
+            validator_class.check_schema(target)
+            validator = validator_class(target, format_checker=FormatChecker(formats=CHECKED_FORMATS))
+            self._validators[(kind, version)] = validator
+        return validator
+    
+    def _frame_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """The schema without the item schema of its results array."""
+        schema = dict(schema)
+        properties = dict(schema.get('properties', {}))
+        if 'results' in properties:
+            results_schema = dict(properties['results'])
+            results_schema.pop('items', None)
+            properties['results'] = results_schema
+        schema['properties'] = properties
+        return schema
+    
+    def _invalidate_schema(self, version: str) -> None:
+        """Forget validators and exported text of a version whose schema changed."""
+        self._schema_texts.pop(version, None)
+        for key in [key for key in self._validators if key[1] == version]:
+            del self._validators[key]
     
     def export_schema(self, output_path: str, version: str = None) -> None:
-        """Export schema to JSON file."""
-        schema = self.get_schema(version)
+        """Export schema to JSON file.
+
+        An existing file that already holds the same schema is left alone, so
+        its modification time only changes when the schema does.
+        """
+        version = version or self.schema_version.value
+        text = self._schema_texts.get(version)
+        if text is None:
+            text = self._schema_texts[version] = json.dumps(self.get_schema(version), indent=2)
+        
+        try:
+            with open(output_path, 'r', encoding='utf-8') as f:
+                unchanged = f.read(len(text) + 1) == text
+        except (OSError, UnicodeDecodeError):
+            unchanged = False
+        if unchanged:
+            print(f"Schema unchanged: {output_path}")
+            return
+        
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(schema, f, indent=2)
+            f.write(text)
         print(f"Schema exported to: {output_path}")
     
     def get_schema_info(self, version: str = None) -> SchemaInfo:
@@ -87,7 +185,7 @@ class SchemaManager:
     
     def list_available_versions(self) -> list[str]:
         """List all available schema versions."""
-        return list(self.schemas.keys())
+        return list(SCHEMA_BUILDERS)
     
     def upgrade_report(self, report_data: Dict[str, Any], target_version: str) -> Dict[str, Any]:
         """Upgrade a report to a newer schema version."""
@@ -199,6 +297,7 @@ class DynamicSchemaManager(SchemaManager):
                 schema['$schema'] = "https://json-schema.org/draft/2020-12/schema"
             
             self.custom_schemas[version_name] = schema
+            self._invalidate_schema(version_name)
             return True
         except Exception as e:
             print(f"Error adding custom schema {version_name}: {e}")
@@ -237,6 +336,7 @@ class DynamicSchemaManager(SchemaManager):
             base_schema['title'] = f"Build Report Schema {new_version}"
             
             self.custom_schemas[new_version] = base_schema
+            self._invalidate_schema(new_version)
             return True
             
         except Exception as e:
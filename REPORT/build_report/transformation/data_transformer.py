@@ -13,11 +13,16 @@ from ..models.data_models import (
     ExtractedData, ProcessedResult, ResultStatus,
     MultiResultExtractedData
 )
+from . import statistics
+from .statistics import segment_statistics
 
 
 class StandardDataTransformer:
     """Standard data transformation implementation with iteration support."""
     
+    # Modules besides this one whose code shapes the output (result cache fingerprint)
+    source_modules = (statistics,)
+    
     def __init__(self):
         self.processors = {
             'trafficgen_result': self._process_trafficgen_result,
@@ -35,9 +40,14 @@ class StandardDataTransformer:
             return self._transform_legacy(extracted_data)
     
     def _transform_multi_result(self, extracted_data: MultiResultExtractedData) -> ProcessedResult:
-        """Transform multi-iteration extracted data."""
+        """Transform multi-iteration extracted data.
+
+        The extractor's dicts and lists (params, samples, results, tags) are
+        handed over by reference, not copied.
+        """
+        regulus_data = str(extracted_data.file_info.path)
         transformed_data = {
-            "regulus_data": str(extracted_data.file_info.path),
+            "regulus_data": regulus_data,
             "benchmark": extracted_data.benchmark,
             "run_id": extracted_data.run_id,
             "common_params": extracted_data.common_params,
@@ -78,7 +88,7 @@ class StandardDataTransformer:
         }
         
         return ProcessedResult(
-            regulus_data=str(extracted_data.file_info.path),
+            regulus_data=regulus_data,
             benchmark=extracted_data.benchmark,
             data=transformed_data,
             processing_metadata=processing_metadata
@@ -191,7 +201,12 @@ class StandardDataTransformer:
         return results[0]
  
     def _generate_summary_statistics(self, extracted_data: MultiResultExtractedData) -> Dict[str, Any]:
-        """Generate summary statistics across all iterations."""
+        """Generate summary statistics across all iterations.
+
+        Also adds 'sample_stats' to every result that has sample values, and
+        per-result-type statistics of the result means ('by_result_type').
+        All of these are computed in one segment_statistics() batch per file.
+        """
         iterations = extracted_data.iterations
         
         if not iterations:
@@ -200,6 +215,9 @@ class StandardDataTransformer:
         # Collect all result means
         result_means = []
         result_types = set()
+        means_by_type: Dict[str, List[float]] = {}
+        iterations_by_type: Dict[str, List[str]] = {}
+        sampled_results = []
         
         for iteration in iterations:
             for result in iteration.results:
@@ -208,6 +226,11 @@ class StandardDataTransformer:
                     result_means.append(result['mean'])
                 if 'type' in result:
                     result_types.add(result['type'])
+                    if isinstance(result.get('mean'), (int, float)):
+                        means_by_type.setdefault(result['type'], []).append(result['mean'])
+                        iterations_by_type.setdefault(result['type'], []).append(iteration.iteration_id)
+                if result.get('sample_values'):
+                    sampled_results.append(result)
         
         summary = {
             'total_iterations': len(iterations),
@@ -216,26 +239,42 @@ class StandardDataTransformer:
         }
         
         if result_means:
+            min_val = min(result_means)
+            max_val = max(result_means)
+            avg_val = sum(result_means) / len(result_means)
             summary.update({
-                'overall_mean': sum(result_means) / len(result_means),
-                'overall_min': min(result_means),
-                'overall_max': max(result_means),
-                'result_range': max(result_means) - min(result_means),
-                'performance_summary': self._performance_summary(result_means)
+                'overall_mean': avg_val,
+                'overall_min': min_val,
+                'overall_max': max_val,
+                'result_range': max_val - min_val,
+                'performance_summary': self._format_performance_summary(len(result_means), min_val, max_val, avg_val)
             })
         
+        segments = [result['sample_values'] for result in sampled_results] + list(means_by_type.values())
+        if segments:
+            stats = segment_statistics(segments)
+            for result, sample_stats in zip(sampled_results, stats):
+                result['sample_stats'] = {
+                    'median': sample_stats['median'],
+                    'p5': sample_stats['p5'],
+                    'p95': sample_stats['p95'],
+                    'cov_pct': sample_stats['cov_pct'],
+                    'outliers': len(sample_stats['outliers'])
+                }
+            
+            by_result_type = {}
+            for result_type, type_stats in zip(means_by_type, stats[len(sampled_results):]):
+                type_iterations = iterations_by_type[result_type]
+                type_stats['outlier_iterations'] = [type_iterations[i] for i in type_stats.pop('outliers')]
+                by_result_type[result_type] = type_stats
+            if by_result_type:
+                summary['by_result_type'] = by_result_type
+        
         return summary
     
-    def _performance_summary(self, means) -> str:
-        """Generate human-readable performance summary."""
-        if not means:
-            return "No performance data"
-        
-        min_val = min(means)
-        max_val = max(means)
-        avg_val = sum(means) / len(means)
-        
-        if len(means) == 1:
+    def _format_performance_summary(self, count: int, min_val: float, max_val: float, avg_val: float) -> str:
+        """Human-readable performance summary from precomputed statistics."""
+        if count == 1:
             return f"Single test: {avg_val:.2f}"
         
         variance_pct = ((max_val - min_val) / avg_val * 100) if avg_val > 0 else 0
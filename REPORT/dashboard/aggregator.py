@@ -3,12 +3,21 @@ Aggregator for multi-report analytics.
 
 Provides trend analysis, comparisons, and statistical aggregations
 across multiple performance benchmark reports.
+
+With NumPy installed, large result lists are grouped, pivoted and ranked
+on a columnar ResultTable (see result_table.py) instead of per-row Python
+loops. Its mean(), median() and stdev() take exact sums and round them
+once, so they equal statistics.mean() and statistics.median(), and on
+Python 3.11+ statistics.stdev(); groups they cannot sum exactly (and
+stdev() before 3.11) fall back to the statistics module. Both paths
+return the same numbers.
 """
 
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 from datetime import datetime
+import importlib.util
 import statistics
 
 try:
@@ -16,6 +25,11 @@ try:
 except ImportError:
     from data_loader import BenchmarkResult
 
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+# Below this many results building NumPy columns costs more than the loops it replaces
+NUMPY_MIN_RESULTS = 500
+
 
 @dataclass
 class TrendDataPoint:
@@ -43,8 +57,40 @@ class ComparisonResult:
 class BenchmarkAggregator:
     """Aggregates and analyzes benchmark results across multiple reports."""
 
-    def __init__(self, results: List[BenchmarkResult]):
+    def __init__(self, results: List[BenchmarkResult], use_numpy: Optional[bool] = None):
+        """use_numpy forces or disables the columnar path; by default it is used for large inputs."""
         self.results = results
+        if use_numpy is None:
+            use_numpy = len(results) >= NUMPY_MIN_RESULTS
+        self.use_numpy = use_numpy and NUMPY_AVAILABLE
+        self._table = None
+        self._rows = None  # Rows of results in a shared table (None: the table holds exactly results)
+
+    @property
+    def table(self):
+        """Columnar ResultTable of the results, built on first use (requires NumPy)."""
+        if self._table is None:
+            try:
+                from .result_table import ResultTable
+            except ImportError:
+                from result_table import ResultTable
+            self._table = ResultTable(self.results)
+        return self._table
+
+    def subset(self, results: List[BenchmarkResult]) -> 'BenchmarkAggregator':
+        """
+        Aggregator over some of this aggregator's results (e.g. a filtered list).
+
+        If results are a subset in the same order, the new aggregator works on
+        this one's columnar table, so no columns are extracted again.
+        """
+        aggregator = BenchmarkAggregator(results)
+        if aggregator.use_numpy and self.use_numpy:
+            rows = self.table.rows_of(results)
+            if rows is not None:
+                aggregator._table = self.table
+                aggregator._rows = rows
+        return aggregator
 
     def get_trend_over_time(
         self,
@@ -65,6 +111,46 @@ class BenchmarkAggregator:
         Returns:
             Dictionary mapping group values to trend data points
         """
+        if self.use_numpy:
+            groups = self._trend_groups_columnar(metric, group_by, benchmark, unit_filter)
+        else:
+            groups = self._trend_groups(metric, group_by, benchmark, unit_filter)
+
+        # Create trend data points for each group
+        trends = {}
+        for group_key, timestamp_groups in groups.items():
+            data_points = []
+            for ts in sorted(timestamp_groups.keys()):
+                values, rows = timestamp_groups[ts]
+                data_point = TrendDataPoint(
+                    timestamp=ts,
+                    mean=self._mean(metric, values, rows),
+                    stddev=self._stdev(metric, values, rows) if len(values) > 1 else None,
+                    count=len(values),
+                    label=group_key
+                )
+                data_points.append(data_point)
+
+            trends[group_key] = data_points
+
+        return trends
+
+    def _mean(self, metric: str, values: List[Any], rows: Optional[List[int]]) -> Any:
+        """statistics.mean(values); from the columnar table when rows (the values' rows) are given."""
+        return statistics.mean(values) if rows is None else self.table.mean(metric, rows)
+
+    def _stdev(self, metric: str, values: List[Any], rows: Optional[List[int]]) -> float:
+        """statistics.stdev(values); from the columnar table when rows (the values' rows) are given."""
+        return statistics.stdev(values) if rows is None else self.table.stdev(metric, rows)
+
+    def _trend_groups(
+        self,
+        metric: str,
+        group_by: Optional[str],
+        benchmark: Optional[str],
+        unit_filter: Optional[str]
+    ) -> Dict[str, Dict[str, Tuple[List[Any], None]]]:
+        """(metric values, None) per group and timestamp, groups in order of first appearance."""
         # Filter by benchmark if specified
         filtered = self.results
         if benchmark:
@@ -74,8 +160,8 @@ class BenchmarkAggregator:
         if unit_filter:
             filtered = [r for r in filtered if r.unit and unit_filter in r.unit]
 
-        # Group results
-        groups = defaultdict(list)
+        # Group results, then aggregate by timestamp (in case multiple results have same timestamp)
+        groups = defaultdict(lambda: defaultdict(list))
 
         for result in filtered:
             # Determine group key
@@ -88,38 +174,38 @@ class BenchmarkAggregator:
 
             metric_value = getattr(result, metric, None)
             if metric_value is not None and result.timestamp:
-                groups[str(group_key)].append(result)
-
-        # Create trend data points for each group
-        trends = {}
-        for group_key, group_results in groups.items():
-            # Sort by timestamp
-            sorted_results = sorted(
-                group_results,
-                key=lambda r: r.timestamp if r.timestamp else ''
-            )
-
-            # Aggregate by timestamp (in case multiple results have same timestamp)
-            timestamp_groups = defaultdict(list)
-            for result in sorted_results:
-                timestamp_groups[result.timestamp].append(getattr(result, metric))
-
-            # Create data points
-            data_points = []
-            for ts in sorted(timestamp_groups.keys()):
-                values = timestamp_groups[ts]
-                data_point = TrendDataPoint(
-                    timestamp=ts,
-                    mean=statistics.mean(values),
-                    stddev=statistics.stdev(values) if len(values) > 1 else None,
-                    count=len(values),
-                    label=group_key
-                )
-                data_points.append(data_point)
+                groups[str(group_key)][result.timestamp].append(metric_value)
 
-            trends[group_key] = data_points
+        return {group_key: {ts: (values, None) for ts, values in timestamp_groups.items()}
+                for group_key, timestamp_groups in groups.items()}
 
-        return trends
+    def _trend_groups_columnar(
+        self,
+        metric: str,
+        group_by: Optional[str],
+        benchmark: Optional[str],
+        unit_filter: Optional[str]
+    ) -> Dict[str, Dict[str, Tuple[List[Any], List[int]]]]:
+        """_trend_groups() on the columnar table, with the table rows of each value list."""
+        table = self.table
+        rows = table.select(self._rows, benchmark, unit_filter, required=(metric,))
+        rows = rows[table.where('timestamp', bool)[rows]]
+        values = table.values(metric)
+
+        if group_by:
+            codes, labels = table.labels(group_by, 'unknown')
+            parts = [(labels[code], members) for code, members in table.group(rows, codes)]
+        else:
+            parts = [('all', rows.tolist())] if len(rows) else []
+
+        ts_codes, timestamps = table.codes('timestamp')
+        groups = {}
+        for group_key, members in parts:
+            groups[group_key] = {
+                timestamps[code]: ([values[i] for i in ts_members], ts_members)
+                for code, ts_members in table.group(members, ts_codes)
+            }
+        return groups
 
     def compare_configurations(
         self,
@@ -219,34 +305,43 @@ class BenchmarkAggregator:
         Returns:
             Dictionary mapping group values to statistics (mean, median, stddev, min, max, count)
         """
-        # Filter by benchmark if specified
-        filtered = self.results
-        if benchmark:
-            filtered = [r for r in filtered if r.benchmark == benchmark]
-
-        # Filter by unit if specified (allows partial match like 'Gbps' matches 'tx-Gbps', 'rx-Gbps')
-        if unit_filter:
-            filtered = [r for r in filtered if r.unit and unit_filter in r.unit]
-
-        # Group results
-        groups = defaultdict(list)
-        for result in filtered:
-            group_key = getattr(result, group_by, 'unknown')
-            if group_key is None:
-                group_key = 'unknown'
+        if self.use_numpy:
+            table = self.table
+            rows = table.select(self._rows, benchmark, unit_filter, required=(metric,))
+            codes, labels = table.labels(group_by, 'unknown')
+            values = table.values(metric)
+            groups = {labels[code]: ([values[i] for i in members], members)
+                      for code, members in table.group(rows, codes)}
+        else:
+            # Filter by benchmark if specified
+            filtered = self.results
+            if benchmark:
+                filtered = [r for r in filtered if r.benchmark == benchmark]
+
+            # Filter by unit if specified (allows partial match like 'Gbps' matches 'tx-Gbps', 'rx-Gbps')
+            if unit_filter:
+                filtered = [r for r in filtered if r.unit and unit_filter in r.unit]
+
+            # Group results
+            groups = defaultdict(list)
+            for result in filtered:
+                group_key = getattr(result, group_by, 'unknown')
+                if group_key is None:
+                    group_key = 'unknown'
 
-            metric_value = getattr(result, metric, None)
-            if metric_value is not None:
-                groups[str(group_key)].append(metric_value)
+                metric_value = getattr(result, metric, None)
+                if metric_value is not None:
+                    groups[str(group_key)].append(metric_value)
+            groups = {group_key: (values, None) for group_key, values in groups.items()}
 
         # Calculate statistics for each group
         stats = {}
-        for group_key, values in groups.items():
+        for group_key, (values, rows) in groups.items():
             if values:
                 stats[group_key] = {
-                    'mean': statistics.mean(values),
-                    'median': statistics.median(values),
-                    'stddev': statistics.stdev(values) if len(values) > 1 else 0,
+                    'mean': self._mean(metric, values, rows),
+                    'median': statistics.median(values) if rows is None else self.table.median(metric, rows),
+                    'stddev': self._stdev(metric, values, rows) if len(values) > 1 else 0,
                     'min': min(values),
                     'max': max(values),
                     'count': len(values)
@@ -275,6 +370,13 @@ class BenchmarkAggregator:
         Returns:
             List of top performing benchmark results
         """
+        if self.use_numpy:
+            table = self.table
+            rows = table.select(self._rows, benchmark, unit_filter, required=(metric,))
+            top = table.top(rows, metric, top_n, ascending)
+            if top is not None:
+                return [table.results[i] for i in top]
+
         # Filter by benchmark if specified
         filtered = self.results
         if benchmark:
@@ -315,30 +417,47 @@ class BenchmarkAggregator:
         Returns:
             Dictionary with x_labels, y_labels, and matrix data
         """
-        # Filter by benchmark if specified
-        filtered = self.results
-        if benchmark:
-            filtered = [r for r in filtered if r.benchmark == benchmark]
-
-        # Get unique values for each dimension
-        x_values = sorted(set(str(getattr(r, field_x, 'unknown')) for r in filtered))
-        y_values = sorted(set(str(getattr(r, field_y, 'unknown')) for r in filtered))
-
-        # Build matrix
+        # Metric values per (y, x) cell, collected in one pass
+        if self.use_numpy:
+            table = self.table
+            rows = table.select(self._rows, benchmark)
+            x_codes, x_labels = table.labels(field_x, 'None')
+            y_codes, y_labels = table.labels(field_y, 'None')
+
+            # Get unique values for each dimension
+            x_values = sorted(x_labels[code] for code in set(x_codes[rows].tolist()))
+            y_values = sorted(y_labels[code] for code in set(y_codes[rows].tolist()))
+
+            width = len(x_labels)
+            values = table.values(metric)
+            cells = {
+                (y_labels[code // width], x_labels[code % width]): ([values[i] for i in members], members)
+                for code, members in table.group(rows[table.present(metric)[rows]], y_codes * width + x_codes)
+            }
+        else:
+            # Filter by benchmark if specified
+            filtered = self.results
+            if benchmark:
+                filtered = [r for r in filtered if r.benchmark == benchmark]
+
+            # Get unique values for each dimension
+            x_values = sorted(set(str(getattr(r, field_x, 'unknown')) for r in filtered))
+            y_values = sorted(set(str(getattr(r, field_y, 'unknown')) for r in filtered))
+
+            cells = defaultdict(list)
+            for r in filtered:
+                metric_value = getattr(r, metric, None)
+                if metric_value is not None:
+                    cells[(str(getattr(r, field_y, 'unknown')), str(getattr(r, field_x, 'unknown')))].append(metric_value)
+            cells = {cell: (values, None) for cell, values in cells.items()}
+
+        # Build matrix, averaging the metric per cell
         matrix = {}
         for y_val in y_values:
             matrix[y_val] = {}
             for x_val in x_values:
-                # Find matching results
-                matching = [
-                    r for r in filtered
-                    if str(getattr(r, field_x, 'unknown')) == x_val
-                    and str(getattr(r, field_y, 'unknown')) == y_val
-                ]
-
-                # Calculate average metric
-                values = [getattr(r, metric) for r in matching if getattr(r, metric, None) is not None]
-                matrix[y_val][x_val] = statistics.mean(values) if values else None
+                values, rows = cells.get((y_val, x_val), ([], None))
+                matrix[y_val][x_val] = self._mean(metric, values, rows) if values else None
 
         return {
             'x_labels': x_values,
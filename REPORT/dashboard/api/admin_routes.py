@@ -7,36 +7,39 @@ from flask import Blueprint, request, jsonify
 admin_bp = Blueprint('admin', __name__, url_prefix='/api')
 
 
-def init_admin_routes(loader, aggregator_callback):
+def init_admin_routes(loader, aggregator_callback, query_cache=None):
     """
     Initialize admin routes with dependencies.
 
     Args:
         loader: ReportLoader instance
         aggregator_callback: Callable that recreates the aggregator after reload
+        query_cache: Optional QueryCache of API responses, cleared on reload
     """
 
     @admin_bp.route('/reload', methods=['POST'])
     def api_reload():
-        """Reload reports from disk."""
+        """Reload new and changed reports from disk ({"full": true} reads every file)."""
         try:
             reports_dir = request.json.get('reports_dir') if request.json else None
-            if reports_dir:
-                loader.reports_dir = reports_dir
+            full = bool(request.json.get('full')) if request.json else False
 
-            # Reload reports (clear existing data)
-            loader.loaded_reports = []  # List, not dict
-            loader.metadata = []         # Also clear metadata
-            loader.load_from_directory(loader.reports_dir)
-            results = loader.extract_all_results()
+            # Load into a new store; requests keep using the old one until it is swapped in
+            store = loader.reload(reports_dir, full=full)
 
             # Recreate aggregator with new data
-            aggregator_callback(results)
+            aggregator_callback(store.results)
+
+            # Drop responses computed from the old store (or the old aggregator)
+            if query_cache is not None:
+                query_cache.clear()
 
             return jsonify({
                 'success': True,
-                'total_reports': len(loader.loaded_reports),
-                'total_results': len(results)
+                'total_reports': len(store.metadata),
+                'total_results': len(store.results),
+                'version': store.version,
+                'files': loader.last_reload
             })
         except Exception as e:
             import traceback
@@ -51,7 +54,8 @@ def init_admin_routes(loader, aggregator_callback):
         """List all available report files with metadata."""
         try:
             files = []
-            for idx, metadata in enumerate(loader.metadata):
+            store = loader.store
+            for idx, metadata in enumerate(store.metadata):
                 # Extract filename from path
                 import os
                 filename = os.path.basename(metadata.regulus_data)
@@ -69,7 +73,8 @@ def init_admin_routes(loader, aggregator_callback):
             return jsonify({
                 'success': True,
                 'files': files,
-                'total_files': len(files)
+                'total_files': len(files),
+                'version': store.version
             })
         except Exception as e:
             import traceback
@@ -79,4 +84,16 @@ def init_admin_routes(loader, aggregator_callback):
                 'traceback': traceback.format_exc()
             }), 500
 
+    @admin_bp.route('/cache_stats', methods=['GET'])
+    def api_cache_stats():
+        """Hit/miss counters and size of the API response cache (?reset=1 zeroes the counters)."""
+        if query_cache is None:
+            return jsonify({'enabled': False})
+
+        stats = query_cache.get_cache_stats()
+        stats['enabled'] = query_cache.enabled
+        if request.args.get('reset') in ('1', 'true'):
+            query_cache.reset_stats()
+        return jsonify(stats)
+
     return admin_bp
@@ -4,13 +4,18 @@ Comparison routes - Configuration comparisons and comparison matrices.
 
 from flask import Blueprint, request, jsonify
 
+from .response_cache import cached_response
+from ..services.data_service import FILTER_PARAMS
+
 comparison_bp = Blueprint('comparison', __name__, url_prefix='/api')
 
 
-def init_comparison_routes(data_service, comparison_service, aggregation_service):
+def init_comparison_routes(data_service, comparison_service, aggregation_service, query_cache=None):
     """Initialize comparison routes with service dependencies."""
+    cached = cached_response(query_cache, data_service)
 
     @comparison_bp.route('/compare')
+    @cached(*FILTER_PARAMS, 'field', 'value_a', 'value_b', 'metric')
     def api_compare():
         """Compare two configurations."""
         if not aggregation_service.aggregator:
@@ -29,7 +34,7 @@ def init_comparison_routes(data_service, comparison_service, aggregation_service
         filter_params = data_service.get_filter_params_from_request(request)
 
         # Perform comparison
-        all_results = data_service.loader.extract_all_results()
+        all_results = data_service.get_all_results()
         comparison = comparison_service.compare_configurations(
             all_results,
             field=field,
@@ -45,6 +50,7 @@ def init_comparison_routes(data_service, comparison_service, aggregation_service
         return jsonify(comparison)
 
     @comparison_bp.route('/matrix')
+    @cached('field_x', 'field_y', 'metric', 'benchmark')
     def api_matrix():
         """Get configuration matrix."""
         if not aggregation_service.aggregator:
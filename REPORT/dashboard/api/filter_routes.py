@@ -14,7 +14,7 @@ def init_filter_routes(data_service):
     @filter_bp.route('/filters')
     def api_filters():
         """Get available filter options."""
-        all_results = data_service.loader.extract_all_results()
+        all_results = data_service.get_all_results()
         if not all_results:
             return jsonify({})
 
@@ -33,7 +33,7 @@ def init_filter_routes(data_service):
     @filter_bp.route('/comparison_values')
     def api_comparison_values():
         """Get available values for comparison field based on current filters."""
-        all_results = data_service.loader.extract_all_results()
+        all_results = data_service.get_all_results()
         if not all_results:
             return jsonify([])
 
@@ -68,7 +68,7 @@ def init_filter_routes(data_service):
     @filter_bp.route('/dynamic_filters')
     def api_dynamic_filters():
         """Get available filter options based on current filter selections (cascading filters)."""
-        all_results = data_service.loader.extract_all_results()
+        all_results = data_service.get_all_results()
         if not all_results:
             return jsonify({})
 
@@ -0,0 +1,45 @@
+"""
+Response caching for API routes backed by a QueryCache.
+"""
+
+from functools import wraps
+
+from flask import current_app, request
+
+
+def cached_response(query_cache, data_service):
+    """
+    Decorator factory serving routes' JSON responses from query_cache.
+
+    cached_response(query_cache, data_service)(*params) decorates a route
+    that reads the query parameters params. The key is the route path, the
+    version of the data service's result store and the canonical signature
+    of those parameters, taken as the route reads them (request.args.get):
+    any other parameter, e.g. a cache-busting '_=<timestamp>', does not
+    change the key. Only 200 JSON responses are stored; with no cache (or a
+    disabled one) the route runs as before.
+    """
+    def cached(*params):
+        def decorator(view):
+            if query_cache is None or not query_cache.enabled:
+                return view
+
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                # Read before anything is computed, so a reload during the request discards it
+                generation = query_cache.generation
+                read = [(name, [request.args[name]]) for name in params if name in request.args]
+                key = (request.path, data_service.get_version(), query_cache.signature(read))
+
+                body = query_cache.get(key)
+                if body is not None:
+                    return current_app.response_class(body, mimetype='application/json')
+
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code == 200 and response.mimetype == 'application/json':
+                    query_cache.put(key, response.get_data(), generation)
+                return response
+
+            return wrapper
+        return decorator
+    return cached
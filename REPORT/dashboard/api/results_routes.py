@@ -4,16 +4,20 @@ Results routes - Raw results and top performers.
 
 from flask import Blueprint, request, jsonify
 
+from .response_cache import cached_response
+from ..services.data_service import RESULT_FILTER_PARAMS
+
 results_bp = Blueprint('results', __name__, url_prefix='/api')
 
 
-def init_results_routes(data_service, aggregation_service):
+def init_results_routes(data_service, aggregation_service, query_cache=None):
     """Initialize results routes with service dependencies."""
+    cached = cached_response(query_cache, data_service)
 
     @results_bp.route('/results')
     def api_results():
         """Get raw filtered results."""
-        all_results = data_service.loader.extract_all_results()
+        all_results = data_service.get_all_results()
         if not all_results:
             return jsonify({'error': 'No reports loaded'}), 404
 
@@ -73,6 +77,7 @@ def init_results_routes(data_service, aggregation_service):
         return jsonify(results_data)
 
     @results_bp.route('/top_performers')
+    @cached(*RESULT_FILTER_PARAMS, 'limit')
     def api_top_performers():
         """Get top N performers for each benchmark."""
         if not aggregation_service.aggregator:
@@ -88,7 +93,7 @@ def init_results_routes(data_service, aggregation_service):
         selected_files = selected_files_param.split(',') if selected_files_param else None
 
         # Apply filters
-        all_results = data_service.loader.extract_all_results()
+        all_results = data_service.get_all_results()
         filtered = data_service.apply_filters(
             all_results,
             filter_params,
@@ -97,8 +102,7 @@ def init_results_routes(data_service, aggregation_service):
         )
 
         # Create aggregator with filtered results
-        from aggregator import BenchmarkAggregator
-        temp_aggregator = BenchmarkAggregator(filtered)
+        temp_aggregator = aggregation_service.aggregator_for(filtered)
 
         # Get benchmarks from summary
         summary = temp_aggregator.get_benchmark_summary()
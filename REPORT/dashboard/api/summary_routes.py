@@ -4,13 +4,18 @@ Summary routes - Summary statistics and aggregations.
 
 from flask import Blueprint, request, jsonify
 
+from .response_cache import cached_response
+from ..services.data_service import RESULT_FILTER_PARAMS
+
 summary_bp = Blueprint('summary', __name__, url_prefix='/api')
 
 
-def init_summary_routes(data_service, aggregation_service):
+def init_summary_routes(data_service, aggregation_service, query_cache=None):
     """Initialize summary routes with service dependencies."""
+    cached = cached_response(query_cache, data_service)
 
     @summary_bp.route('/summary')
+    @cached(*RESULT_FILTER_PARAMS)
     def api_summary():
         """Get summary statistics with optional filtering."""
         if not aggregation_service.aggregator:
@@ -25,7 +30,7 @@ def init_summary_routes(data_service, aggregation_service):
 
         # Apply filters including date range
         filtered = data_service.apply_filters(
-            data_service.loader.extract_all_results(),
+            data_service.get_all_results(),
             filter_params,
             request.args.get('date_range_days'),
             selected_files
@@ -45,6 +50,7 @@ def init_summary_routes(data_service, aggregation_service):
         })
 
     @summary_bp.route('/statistics')
+    @cached(*RESULT_FILTER_PARAMS, 'group_by', 'metric', 'unit_filter')
     def api_statistics():
         """Get statistics grouped by a field."""
         if not aggregation_service.aggregator:
@@ -58,7 +64,7 @@ def init_summary_routes(data_service, aggregation_service):
         selected_files = selected_files_param.split(',') if selected_files_param else None
 
         # Apply filters
-        all_results = data_service.loader.extract_all_results()
+        all_results = data_service.get_all_results()
         filtered = data_service.apply_filters(
             all_results,
             filter_params,
@@ -72,8 +78,7 @@ def init_summary_routes(data_service, aggregation_service):
         unit_filter = request.args.get('unit_filter')  # Filter by unit (e.g., 'Gbps')
 
         # Create aggregator with filtered results
-        from aggregator import BenchmarkAggregator
-        temp_aggregator = BenchmarkAggregator(filtered)
+        temp_aggregator = aggregation_service.aggregator_for(filtered)
         stats = temp_aggregator.get_statistics_by_group(
             group_by=group_by,
             metric=metric,
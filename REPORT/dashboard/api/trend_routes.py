@@ -4,13 +4,18 @@ Trend routes - Time-series analysis.
 
 from flask import Blueprint, request, jsonify
 
+from .response_cache import cached_response
+from ..services.data_service import RESULT_FILTER_PARAMS
+
 trend_bp = Blueprint('trend', __name__, url_prefix='/api')
 
 
-def init_trend_routes(data_service, trend_service):
+def init_trend_routes(data_service, trend_service, query_cache=None):
     """Initialize trend routes with service dependencies."""
+    cached = cached_response(query_cache, data_service)
 
     @trend_bp.route('/trends')
+    @cached(*RESULT_FILTER_PARAMS, 'metric', 'group_by', 'unit_filter')
     def api_trends():
         """Get trend data over time."""
         # Get filter parameters
@@ -21,7 +26,7 @@ def init_trend_routes(data_service, trend_service):
         selected_files = selected_files_param.split(',') if selected_files_param else None
 
         # Apply filters including date range
-        all_results = data_service.loader.extract_all_results()
+        all_results = data_service.get_all_results()
         filtered = data_service.apply_filters(
             all_results,
             filter_params,
@@ -15,6 +15,7 @@ from .services.aggregation_service import AggregationService
 from .services.comparison_service import ComparisonService
 from .services.trend_service import TrendService
 from .services.drill_down_service import DrillDownService
+from .services.query_cache import QueryCache
 
 # Import blueprint initializers
 from .api.summary_routes import init_summary_routes
@@ -34,6 +35,9 @@ def create_app(reports_dir=None):
     Args:
         reports_dir: Directory containing benchmark reports (default: /tmp/regulus-data)
 
+    QUERY_CACHE_ENTRIES (default 256, 0 disables) bounds the cache of API
+    responses by filter combination.
+
     Returns:
         Configured Flask application instance
     """
@@ -48,7 +52,7 @@ def create_app(reports_dir=None):
     loader = ReportLoader()
     loader.reports_dir = reports_dir  # Load and reload from same directory
     loader.load_from_directory(reports_dir)
-    results = loader.extract_all_results()
+    results = loader.store.results
     print(f"Loaded {len(results)} benchmark results from {len(loader.loaded_reports)} reports")
 
     # Initialize aggregator
@@ -58,11 +62,13 @@ def create_app(reports_dir=None):
     data_service = DataService(loader)
     aggregation_service = AggregationService(aggregator)
     comparison_service = ComparisonService()
-    trend_service = TrendService()
+    trend_service = TrendService(aggregation_service)
     drill_down_service = DrillDownService()
+    query_cache = QueryCache(max_entries=int(os.environ.get('QUERY_CACHE_ENTRIES', 256)))
 
     # Store references for admin reload
     app.aggregator = aggregator  # Store for access in routes
+    app.query_cache = query_cache
 
     def recreate_aggregator(new_results):
         """Callback to recreate aggregator after reload."""
@@ -78,12 +84,12 @@ def create_app(reports_dir=None):
         return render_template('dashboard.html')
 
     # Initialize and register blueprints
-    summary_bp = init_summary_routes(data_service, aggregation_service)
-    results_bp = init_results_routes(data_service, aggregation_service)
-    trend_bp = init_trend_routes(data_service, trend_service)
-    comparison_bp = init_comparison_routes(data_service, comparison_service, aggregation_service)
+    summary_bp = init_summary_routes(data_service, aggregation_service, query_cache)
+    results_bp = init_results_routes(data_service, aggregation_service, query_cache)
+    trend_bp = init_trend_routes(data_service, trend_service, query_cache)
+    comparison_bp = init_comparison_routes(data_service, comparison_service, aggregation_service, query_cache)
     filter_bp = init_filter_routes(data_service)
-    admin_bp = init_admin_routes(loader, recreate_aggregator)
+    admin_bp = init_admin_routes(loader, recreate_aggregator, query_cache)
     drill_down_bp = init_drill_down_routes(drill_down_service)
     file_browser_bp = init_file_browser_routes()
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark for BenchmarkAggregator.
+
+Loads the reports of a directory (the dashboard test data by default),
+replicates their results up to --results rows, each copy with its own
+timestamp, and times every aggregation the API serves three ways: on the
+per-row Python path, on a columnar table built for the call ("cold"), and,
+as the API routes run it, on an aggregator from subset() of the aggregator
+over all results, whose table was built by an earlier request ("shared").
+Reports the best of --repeat runs and the speedup of the shared path over
+the Python one, and checks that all paths return the same data (exit
+status 1 if not).
+
+ Usage:
+    $ python3 -m dashboard.bench.aggregator_bench
+    $ python3 -m dashboard.bench.aggregator_bench --results 500000 --repeat 3
+    $ python3 -m dashboard.bench.aggregator_bench --reports-dir /tmp/regulus-data
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from ..aggregator import BenchmarkAggregator, NUMPY_AVAILABLE
+from ..data_loader import ReportLoader
+
+TEST_DATA = Path(__file__).resolve().parents[1] / 'test_data'
+
+# (label, method, keyword arguments), as the API routes call them
+CASES = [
+    ('statistics by model', 'get_statistics_by_group', {'group_by': 'model', 'metric': 'mean'}),
+    ('statistics by nic, Gbps', 'get_statistics_by_group', {'group_by': 'nic', 'metric': 'mean', 'unit_filter': 'Gbps'}),
+    ('trends by model', 'get_trend_over_time', {'metric': 'mean', 'group_by': 'model'}),
+    ('top 10 uperf', 'get_top_performers', {'metric': 'mean', 'top_n': 10, 'benchmark': 'uperf'}),
+    ('top 10 overall', 'get_top_performers', {'metric': 'mean', 'top_n': 10}),
+    ('matrix model x kernel', 'get_configuration_matrix', {'field_x': 'model', 'field_y': 'kernel'}),
+    ('matrix nic x threads', 'get_configuration_matrix', {'field_x': 'nic', 'field_y': 'threads'}),
+]
+
+
+def build_results(reports_dir: str, count: int) -> list:
+    """count results, copies of the directory's results with distinct timestamps."""
+    loader = ReportLoader()
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader.load_from_directory(reports_dir)
+    base = loader.store.results
+    if not base:
+        sys.exit(f"No results in {reports_dir}")
+    results = []
+    copy = 0
+    while len(results) < count:
+        for r in base[:count - len(results)]:
+            timestamp = f"{r.timestamp}-{copy}" if r.timestamp else None
+            results.append(replace(r, timestamp=timestamp))
+        copy += 1
+    return results
+
+
+def run(make_aggregator, method: str, kwargs: dict, repeat: int):
+    """Best time of repeat runs on a fresh aggregator, and the last output."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = getattr(make_aggregator(), method)(**kwargs)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time BenchmarkAggregator on the Python and NumPy paths")
+    parser.add_argument('--reports-dir', default=str(TEST_DATA), help='Directory of JSON reports to replicate')
+    parser.add_argument('--results', type=int, default=100000, help='Number of results to aggregate')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case (best is reported)')
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        sys.exit("NumPy is not installed; there is no columnar path to compare")
+
+    results = build_results(args.reports_dir, args.results)
+    print(f"Results: {len(results)}")
+
+    # The aggregator over all results, with the columns of every case extracted
+    started = time.perf_counter()
+    parent = BenchmarkAggregator(results, use_numpy=True)
+    for _, method, kwargs in CASES:
+        getattr(parent, method)(**kwargs)
+    print(f"Shared table: {(time.perf_counter() - started) * 1000:.1f}ms to build (once per load)")
+
+    print(f"{'case':<26} {'python':>10} {'cold':>10} {'shared':>10} {'speedup':>8}")
+    failed = False
+    for label, method, kwargs in CASES:
+        python_time, python_output = run(lambda: BenchmarkAggregator(results, use_numpy=False),
+                                         method, kwargs, args.repeat)
+        cold_time, cold_output = run(lambda: BenchmarkAggregator(results, use_numpy=True),
+                                     method, kwargs, args.repeat)
+        shared_time, shared_output = run(lambda: parent.subset(results), method, kwargs, args.repeat)
+        same = python_output == cold_output == shared_output
+        failed |= not same
+        print(f"{label:<26} {python_time * 1000:8.1f}ms {cold_time * 1000:8.1f}ms {shared_time * 1000:8.1f}ms "
+              f"{python_time / shared_time:7.1f}x{'' if same else '  OUTPUT DIFFERS'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Check of the API response cache.
+
+Serves a copy of a reports directory (the dashboard test data by default)
+and checks that:
+
+- queries that differ only in parameter order, in the order or repeats of
+  selected_files, or in parameters the route does not read (e.g. a
+  cache-busting '_=<timestamp>') are served from one cache entry, and
+  queries that differ in a parameter the route reads are not;
+- every cached response is the response computed on an empty cache;
+- after a report file is removed and POST /api/reload, no old response is
+  served: each answer is the one computed on an empty cache, and at least
+  one differs from before the reload.
+
+Each failure is printed; the exit status is 1 if there are any.
+
+ Usage:
+    $ python3 -m dashboard.bench.query_cache_check
+    $ python3 -m dashboard.bench.query_cache_check --reports-dir /tmp/regulus-data
+"""
+import argparse
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from ..app import create_app
+
+TEST_DATA = Path(__file__).resolve().parents[1] / 'test_data'
+
+# (label, first query, query that must be served from the first one's entry)
+SAME_ENTRY = [
+    ('parameter order', '/api/statistics?group_by=nic&metric=mean', '/api/statistics?metric=mean&group_by=nic'),
+    ('selected_files order', '/api/summary?selected_files={a},{b}', '/api/summary?selected_files={b},{a}'),
+    ('selected_files repeats', '/api/trends?group_by=model&selected_files={a}',
+     '/api/trends?selected_files={a},{a}&group_by=model'),
+    ('cache-busting parameter', '/api/top_performers?limit=5', '/api/top_performers?limit=5&_=1700000000000'),
+    ('parameter the route ignores', '/api/matrix?field_x=model&field_y=nic',
+     '/api/matrix?field_y=nic&field_x=model&model=OVNK&date_range_days=7'),
+    ('parameter of another route', '/api/compare?field=model&value_a={x}&value_b={y}',
+     '/api/compare?field=model&value_a={x}&value_b={y}&group_by=nic&selected_files={a}'),
+]
+
+# (label, first query, query that must not be served from the first one's entry)
+OTHER_ENTRY = [
+    ('group_by', '/api/statistics?group_by=nic', '/api/statistics?group_by=model'),
+    ('filter', '/api/trends?group_by=model', '/api/trends?group_by=model&nic={nic}'),
+    ('selected_files', '/api/summary?selected_files={a}', '/api/summary?selected_files={a},{b}'),
+    ('date range', '/api/top_performers', '/api/top_performers?date_range_days=1'),
+]
+
+# Queries compared with fresh responses before and after a reload
+RELOAD_QUERIES = [
+    '/api/summary',
+    '/api/statistics?group_by=model',
+    '/api/trends?group_by=model&_=1',
+    '/api/top_performers?limit=3',
+    '/api/matrix?field_x=model&field_y=kernel',
+]
+
+
+def query_values(client) -> dict:
+    """Values substituted into the queries: two report files, two models and a NIC."""
+    files = [f['filename'] for f in client.get('/api/list_files').get_json()['files']]
+    filters = client.get('/api/filters').get_json()
+    return {'a': files[0], 'b': files[-1], 'x': filters['model'][0], 'y': filters['model'][-1],
+            'nic': filters['nic'][0]}
+
+
+def fresh(client, query: str) -> bytes:
+    """Body of query computed by the route, not served from the cache."""
+    client.application.query_cache.clear()
+    return client.get(query).get_data()
+
+
+def check_entries(client, values: dict) -> list:
+    """Failures of the same-entry and other-entry cases."""
+    failures = []
+    cache = client.application.query_cache
+    for label, first, second, same in ([case + (True,) for case in SAME_ENTRY] +
+                                       [case + (False,) for case in OTHER_ENTRY]):
+        first, second = first.format(**values), second.format(**values)
+        cache.clear()
+        client.get(first)
+        hits = cache.stats['hits']
+        body = client.get(second).get_data()
+        if (cache.stats['hits'] > hits) != same:
+            failures.append(f"{label}: {second} was {'not ' if same else ''}served from the entry of {first}")
+        if body != fresh(client, second):
+            failures.append(f"{label}: {second} differs from the response computed on an empty cache")
+    return failures
+
+
+def check_reload(client, reports_dir: str) -> list:
+    """Failures of responses after the largest report is removed and the app reloads."""
+    before = [client.get(query).get_data() for query in RELOAD_QUERIES]  # also fills the cache
+
+    path = max(Path(reports_dir).glob('*.json'), key=lambda p: p.stat().st_size)
+    path.unlink()
+    with contextlib.redirect_stdout(io.StringIO()):
+        client.post('/api/reload', json={})
+
+    after = [client.get(query).get_data() for query in RELOAD_QUERIES]
+    failures = []
+    for query, body in zip(RELOAD_QUERIES, after):
+        if body != fresh(client, query):
+            failures.append(f"after reload: {query} is not the response computed on an empty cache")
+    if after == before:
+        failures.append(f"after reload: no response changed although {path.name} was removed")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the API response cache")
+    parser.add_argument('--reports-dir', default=str(TEST_DATA), help='Directory of JSON reports to serve')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as reports_dir:
+        for path in Path(args.reports_dir).glob('*.json'):
+            shutil.copy(path, reports_dir)
+        if not any(Path(reports_dir).iterdir()):
+            sys.exit(f"No reports found in {args.reports_dir}")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = create_app(reports_dir)
+        if not app.query_cache.enabled:
+            sys.exit("The response cache is disabled (QUERY_CACHE_ENTRIES=0); there is nothing to check")
+        client = app.test_client()
+        failures = check_entries(client, query_values(client))
+        failures.extend(check_reload(client, reports_dir))
+
+    for failure in failures:
+        print(failure)
+    print(f"Checked {len(SAME_ENTRY) + len(OTHER_ENTRY)} query pairs and {len(RELOAD_QUERIES)} queries "
+          f"after a reload: {len(failures)} failures")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
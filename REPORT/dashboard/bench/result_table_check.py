@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Check of ResultTable statistics against the statistics module.
+
+ResultTable.mean(), stdev() and median() must return exactly what
+statistics.mean(), stdev() and median() return (same value, same type,
+same exception). This runs them on fixed edge cases (-0.0, ints, mixed
+magnitudes, single values, subnormals, NaN and bools that take the
+fallback, groups on both sides of the bucketed-sum threshold) and on
+--count random groups. It also checks the exact-sum helper against
+Fraction arithmetic and the square-root helper against a 120-digit
+Decimal root. The first differences are printed; the exit status is 1 if
+there are any.
+
+ Usage:
+    $ python3 -m dashboard.bench.result_table_check
+    $ python3 -m dashboard.bench.result_table_check --count 20000 --seed 3
+"""
+import argparse
+import decimal
+import random
+import statistics
+import sys
+from fractions import Fraction
+from types import SimpleNamespace
+
+from ..aggregator import NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+    from .. import result_table
+    from ..result_table import ResultTable
+
+# Groups whose statistics are easy to get wrong
+EDGE_CASES = [
+    [-0.0],
+    [0.0],
+    [0],
+    [7],
+    [2.5],
+    [-0.0, -0.0],
+    [0.0, -0.0],
+    [-0.0, 0.0, -0.0],
+    [1, 2],
+    [1, 2, 4],
+    [1, 2, 3, 4],
+    [1, 2.5],
+    [3, 3.0, 3],
+    [10 ** 6, -10 ** 6, 1],
+    [0.1, 0.2, 0.3],
+    [1e16, 1.0, -1e16],
+    [1e16, 1.0, -1e16, 1.0],
+    [1e300, 1e-300, -1e300],
+    [5e-324, 5e-324, 1e-310],
+    [1e200, 1e200],
+    [50.000000001, 50.000000002, 50.000000003],
+    [2 ** 53 + 1, 2 ** 53 + 3],
+    [2 ** 60, 1],
+    [2 ** 60 + 1, 3, 5],
+    [10 ** 400, 1],
+    [True, 2, 3],
+    [1.0, float('nan')],
+    [float('inf'), 1.0],
+    [0.1] * 999,
+    [0.1] * 1000,
+    [0.1] * 1001 + [1e16, -1e16],
+    list(range(-1500, 1501)),
+]
+
+
+def random_group(rng: random.Random) -> list:
+    """A group of values of one random flavour and size."""
+    size = rng.choice([1, 2, 3, 5, 20, 200, 999, 1000, 1001, 3000])
+    mode = rng.random()
+    values = []
+    for _ in range(size):
+        if mode < 0.2:
+            value = rng.choice([0.1, 0.2, 0.3, 1e16, -1e16, 1.0, 3, -0.0, 0])
+        elif mode < 0.4:
+            value = rng.randint(-10 ** 6, 10 ** 6)
+        elif mode < 0.6:
+            value = rng.uniform(-1, 1) * 10 ** rng.uniform(-300, 300)
+        elif mode < 0.8:
+            value = rng.gauss(50, 1e-9)
+        else:
+            value = rng.choice([rng.random(), rng.randint(0, 100), 2 ** 60, True,
+                                float('nan'), -0.0, 5e-324, 1e300])
+        values.append(value)
+    return values
+
+
+def outcome(function, *args):
+    """(repr of the result and its type, or the exception type)."""
+    try:
+        value = function(*args)
+    except Exception as e:
+        return ('raises', type(e).__name__)
+    return (repr(value), type(value).__name__)
+
+
+def check_group(values: list) -> list:
+    """Differences between ResultTable and statistics on one group."""
+    table = ResultTable([SimpleNamespace(m=value) for value in values])
+    rows = list(range(len(values)))
+    checks = [('mean', statistics.mean, table.mean), ('median', statistics.median, table.median)]
+    if len(values) > 1:
+        checks.append(('stdev', statistics.stdev, table.stdev))
+    differences = []
+    for name, expected, actual in checks:
+        want, got = outcome(expected, values), outcome(actual, 'm', rows)
+        if want != got:
+            differences.append(f"{name}({values[:6]!r}{'...' if len(values) > 6 else ''}, n={len(values)}): "
+                               f"statistics {want}, ResultTable {got}")
+    return differences
+
+
+def check_helpers(rng: random.Random, count: int) -> list:
+    """Differences of _exact_sum() from Fraction sums and of _sqrt_of_ratio() from Decimal roots."""
+    differences = []
+    for _ in range(count):
+        size = rng.choice([1, 3, 50, result_table._BUCKET_SUM_MIN - 1, result_table._BUCKET_SUM_MIN, 2500])
+        # _exact_sum() is only given magnitudes in _SQUARE_RANGE (and zeros)
+        scale = rng.choice([1e-120, 1e-20, 1.0, 1e20, 1e120])
+        x = np.array([rng.choice([rng.uniform(-1, 1) * scale * 2.0 ** rng.randint(-40, 40), 0.0, -0.0])
+                      for _ in range(size)])
+        numerator, denominator = result_table._exact_sum(x.copy())
+        if Fraction(numerator, denominator) != sum(map(Fraction, x.tolist()), Fraction(0)):
+            differences.append(f"_exact_sum of {size} values around {scale:g} is not exact")
+
+    context = decimal.Context(prec=120)
+    for _ in range(count):
+        n = rng.getrandbits(rng.randint(1, 400))
+        m = rng.getrandbits(rng.randint(1, 400)) or 1
+        expected = float(context.sqrt(context.divide(decimal.Decimal(n), decimal.Decimal(m))))
+        actual = result_table._sqrt_of_ratio(n, m)
+        if actual != expected:
+            differences.append(f"_sqrt_of_ratio({n}, {m}) = {actual!r}, expected {expected!r}")
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check ResultTable statistics against the statistics module")
+    parser.add_argument('--count', type=int, default=500, help='Random groups (and helper cases) to check')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the random cases')
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        sys.exit("NumPy is not installed; there is no ResultTable to check")
+
+    rng = random.Random(args.seed)
+    differences = []
+    for values in EDGE_CASES:
+        differences.extend(check_group(values))
+    for _ in range(args.count):
+        differences.extend(check_group(random_group(rng)))
+    differences.extend(check_helpers(rng, args.count))
+
+    for difference in differences[:20]:
+        print(difference)
+    print(f"Checked {len(EDGE_CASES)} edge cases, {args.count} random groups and {2 * args.count} helper cases: "
+          f"{len(differences)} differences")
+    sys.exit(1 if differences else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,19 +3,27 @@ Data loader for dashboard - loads and parses JSON reports.
 
 Reads JSON reports generated by build_report tool and provides
 structured access to the performance data.
+
+The flattened results are built once per load into an immutable, versioned
+ResultStore that every dashboard route reads; a reload only reads report
+files that are new or changed since the last load, builds a new store and
+swaps it in with a single assignment.
 """
 
+import bisect
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 import re
 
 
-@dataclass
+@dataclass(frozen=True)
 class BenchmarkResult:
-    """Single benchmark result from a test iteration."""
+    """Single benchmark result from a test iteration (immutable; shared by all requests)."""
     regulus_data: str
     benchmark: str
     iteration_id: str
@@ -68,12 +76,137 @@ class ReportMetadata:
     total_files: int
 
 
+@dataclass(frozen=True)
+class ResultStore:
+    """Immutable snapshot of the flattened results of a set of loaded reports.
+
+    version increases with every store a loader builds, so callers can tell
+    whether data they derived from an earlier store is out of date. index
+    answers filter queries over results (see ResultIndex).
+    """
+    version: int
+    results: Tuple[BenchmarkResult, ...]
+    metadata: Tuple[ReportMetadata, ...]
+    built_at: str
+    index: 'ResultIndex' = field(compare=False, repr=False, default=None)
+
+
 class ReportLoader:
     """Loads and parses JSON reports from build_report tool."""
 
     def __init__(self):
         self.loaded_reports: List[Dict[str, Any]] = []
         self.metadata: List[ReportMetadata] = []
+        self.reports_dir: Optional[str] = None  # Directory reload() reads
+        self.last_reload: Dict[str, int] = {}  # File counts of the last reload()
+        self._store: Optional[ResultStore] = None
+        self._version = 0
+        self._store_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        # path -> (size, mtime_ns) of each report file when it was read
+        self._signatures: Dict[str, Tuple[int, int]] = {}
+        # path -> (report, its flattened results) as of the last store built
+        self._flattened: Dict[str, Tuple[Dict[str, Any], Tuple[BenchmarkResult, ...]]] = {}
+
+    @property
+    def store(self) -> ResultStore:
+        """The current ResultStore, built on first access after a load."""
+        store = self._store
+        if store is None:
+            with self._store_lock:
+                store = self._store
+                if store is None:
+                    store = self._store = self._build_store(self.loaded_reports, self.metadata)
+        return store
+
+    def _build_store(self, reports: List[Dict[str, Any]], metadata: List[ReportMetadata]) -> ResultStore:
+        """Flatten reports into a new store with the next version number.
+
+        Reports flattened for the previous store are not flattened again, and
+        the index reuses the previous store's parsed timestamps.
+        """
+        results = []
+        flattened = {}
+        for i, report in enumerate(reports):
+            # Get report source from metadata if available
+            report_source = metadata[i].regulus_data if i < len(metadata) else None
+            cached = self._flattened.get(report_source)
+            if cached is not None and cached[0] is report:
+                report_results = cached[1]
+            else:
+                report_results = tuple(self.extract_benchmark_results(report, report_source=report_source))
+            if report_source is not None:
+                flattened[report_source] = (report, report_results)
+            results.extend(report_results)
+        results = tuple(results)
+        self._flattened = flattened
+        previous = self._store
+        self._version += 1
+        return ResultStore(version=self._version, results=results, metadata=tuple(metadata),
+                           built_at=datetime.now().isoformat(),
+                           index=ResultIndex(results, previous.index if previous else None))
+
+    def reload(self, reports_dir: Optional[str] = None, full: bool = False) -> ResultStore:
+        """Load the reports directory again and swap in a new store.
+
+        Files whose (size, modification time) match the last load keep their
+        parsed report; only new and changed files are read, and removed ones
+        are dropped (full=True reads every file again). The reports are loaded
+        and flattened on the side; requests keep reading the previous store
+        until the new one replaces it in one assignment.
+        """
+        with self._reload_lock:
+            if reports_dir:
+                self.reports_dir = reports_dir
+
+            loaded = {}
+            for report, metadata in zip(self.loaded_reports, self.metadata):
+                if metadata.regulus_data in self._signatures:
+                    loaded[metadata.regulus_data] = (report, metadata)
+
+            staging = ReportLoader()
+            paths = staging.find_report_files(self.reports_dir)
+            counts = {'new': 0, 'changed': 0, 'unchanged': 0, 'failed': 0}
+            for path in paths:
+                previous = loaded.pop(path, None)
+                signature = self._file_signature(path)
+                if previous is not None and not full and signature == self._signatures[path]:
+                    staging._adopt(path, signature, *previous)
+                    counts['unchanged'] += 1
+                    continue
+                if staging.load_report(path) is None:
+                    counts['failed'] += 1
+                else:
+                    counts['changed' if previous is not None else 'new'] += 1
+            counts['removed'] = len(loaded)
+            print(f"Reloaded {self.reports_dir}: {counts['new']} new, {counts['changed']} changed, "
+                  f"{counts['removed']} removed, {counts['unchanged']} unchanged, {counts['failed']} unreadable files")
+
+            with self._store_lock:
+                store = self._build_store(staging.loaded_reports, staging.metadata)
+                self.loaded_reports = staging.loaded_reports
+                self.metadata = staging.metadata
+                self._signatures = staging._signatures
+                self._store = store
+            self.last_reload = counts
+        return store
+
+    def _adopt(self, path: str, signature: Tuple[int, int], report: Dict[str, Any],
+               metadata: ReportMetadata) -> None:
+        """Add a report read by another loader, as load_report() would have added it."""
+        self.loaded_reports.append(report)
+        self.metadata.append(metadata)
+        self._signatures[path] = signature
+        self._store = None
+
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+        """(size, mtime_ns) of a file, or None if it cannot be read."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
 
     def load_report(self, report_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -91,6 +224,9 @@ class ReportLoader:
                 print(f"Report file not found: {report_path}")
                 return None
 
+            # Taken before reading, so a write during the read shows up as a change on reload
+            signature = self._file_signature(str(path))
+
             with open(path, 'r', encoding='utf-8') as f:
                 # Allow NaN, Infinity, and -Infinity values in JSON
                 # Convert them to None (null) for compatibility
@@ -142,6 +278,9 @@ class ReportLoader:
 
             self.loaded_reports.append(report_data)
             self.metadata.append(metadata)
+            if signature is not None:
+                self._signatures[str(path)] = signature
+            self._store = None  # Rebuilt on next access
 
             return report_data
 
@@ -182,6 +321,19 @@ class ReportLoader:
         Returns:
             List of successfully loaded reports
         """
+        return self.load_multiple_reports(self.find_report_files(directory, pattern))
+
+    def find_report_files(self, directory: str, pattern: str = "*.json") -> List[str]:
+        """
+        Paths of the JSON reports in a directory (schema files excluded).
+
+        Args:
+            directory: Directory containing JSON reports
+            pattern: Glob pattern for matching files (default: *.json)
+
+        Returns:
+            List of report file paths, empty if the directory does not exist
+        """
         dir_path = Path(directory)
         if not dir_path.exists() or not dir_path.is_dir():
             print(f"Directory not found: {directory}")
@@ -192,7 +344,7 @@ class ReportLoader:
         json_files = [f for f in json_files if not f.name.endswith('_schema.json')]
 
         print(f"Found {len(json_files)} JSON report files in {directory}")
-        return self.load_multiple_reports([str(f) for f in json_files])
+        return [str(f) for f in json_files]
 
     def _extract_nic_mapping_from_lab_info(self, lab_info: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -375,14 +527,9 @@ class ReportLoader:
 
         Returns:
             Combined list of all benchmark results across all reports
+            (a new list over the shared results of the current store)
         """
-        all_results = []
-        for i, report in enumerate(self.loaded_reports):
-            # Get report source from metadata if available
-            report_source = self.metadata[i].regulus_data if i < len(self.metadata) else None
-            results = self.extract_benchmark_results(report, report_source=report_source)
-            all_results.extend(results)
-        return all_results
+        return list(self.store.results)
 
     def get_summary_stats(self) -> Dict[str, Any]:
         """
@@ -391,7 +538,8 @@ class ReportLoader:
         Returns:
             Dictionary with summary statistics
         """
-        if not self.metadata:
+        store = self.store
+        if not store.metadata:
             return {
                 'total_reports': 0,
                 'total_files': 0,
@@ -401,11 +549,11 @@ class ReportLoader:
             }
 
         all_benchmarks = set()
-        for meta in self.metadata:
+        for meta in store.metadata:
             all_benchmarks.update(meta.benchmarks)
 
         # Parse timestamps and find date range from report metadata
-        timestamps = [meta.timestamp for meta in self.metadata if meta.timestamp]
+        timestamps = [meta.timestamp for meta in store.metadata if meta.timestamp]
         date_range = None
         if timestamps:
             # Sort timestamps to get earliest and latest
@@ -416,9 +564,9 @@ class ReportLoader:
             }
 
         return {
-            'total_reports': len(self.loaded_reports),
-            'total_files': sum(meta.total_files for meta in self.metadata),
-            'total_iterations': sum(meta.total_iterations for meta in self.metadata),
+            'total_reports': len(store.metadata),
+            'total_files': sum(meta.total_files for meta in store.metadata),
+            'total_iterations': sum(meta.total_iterations for meta in store.metadata),
             'benchmarks': sorted(list(all_benchmarks)),
             'date_range': date_range
         }
@@ -530,36 +678,36 @@ class ReportFilter:
         """Filter results by NIC vendor."""
         return [r for r in results if r.nic == nic]
 
+    @staticmethod
+    def parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
+        """Parse a result timestamp as filter_by_days_ago() compares it (None if unparsable)."""
+        if not timestamp:
+            return None
+        try:
+            # Remove timezone suffix for parsing
+            ts_str = timestamp.replace('Z', '').replace('+00:00', '')
+
+            # Try parsing with microseconds first
+            try:
+                return datetime.strptime(ts_str, '%Y-%m-%dT%H:%M:%S.%f')
+            except ValueError:
+                # Try without microseconds
+                return datetime.strptime(ts_str, '%Y-%m-%dT%H:%M:%S')
+        except Exception:
+            return None
+
     @staticmethod
     def filter_by_days_ago(results: List[BenchmarkResult], days: int) -> List[BenchmarkResult]:
         """Filter results to only include data from the last N days."""
-        from datetime import datetime, timedelta
-        import re
-
         # Calculate cutoff date
         cutoff = datetime.now() - timedelta(days=days)
 
         filtered = []
         for r in results:
-            if r.timestamp:
-                try:
-                    # Parse timestamp - handle multiple formats
-                    # Remove timezone suffix for parsing
-                    ts_str = r.timestamp.replace('Z', '').replace('+00:00', '')
-
-                    # Try parsing with microseconds first
-                    try:
-                        ts = datetime.strptime(ts_str, '%Y-%m-%dT%H:%M:%S.%f')
-                    except ValueError:
-                        # Try without microseconds
-                        ts = datetime.strptime(ts_str, '%Y-%m-%dT%H:%M:%S')
-
-                    # Include if within the date range
-                    if ts >= cutoff:
-                        filtered.append(r)
-                except Exception as e:
-                    # If timestamp parsing fails, skip this result
-                    continue
+            ts = ReportFilter.parse_timestamp(r.timestamp)
+            # Include if within the date range; skip results whose timestamp does not parse
+            if ts is not None and ts >= cutoff:
+                filtered.append(r)
 
         return filtered
 
@@ -575,7 +723,6 @@ class ReportFilter:
         Returns:
             Filtered list of benchmark results
         """
-        import os
         if not selected_files:
             return results
 
@@ -591,3 +738,123 @@ class ReportFilter:
                     filtered.append(r)
 
         return filtered
+
+
+class ResultIndex:
+    """Inverted index over the results of a ResultStore.
+
+    Answers the same queries as the ReportFilter chain in
+    DataService.apply_filters() without scanning every result: each field
+    has a posting list (the positions of the results holding a value) per
+    value, built on first use, and timestamps are parsed once into a sorted
+    array for "last N days" queries. A query starts from its most selective
+    condition and checks the others by set membership, so its cost follows
+    the number of matches rather than the number of results. Matches are
+    returned in store order, as the filter chain returns them. An index
+    built from a previous store's index reuses its parsed timestamps.
+    """
+
+    # Fields ReportFilter.filter_by_tag() compares as integers
+    INT_FIELDS = frozenset({'threads', 'wsize', 'rsize'})
+
+    def __init__(self, results: Tuple[BenchmarkResult, ...], previous: Optional['ResultIndex'] = None):
+        self.results = results
+        self._postings: Dict[str, Dict[Any, Tuple[List[int], frozenset]]] = {}
+
+        # Parsed timestamps by position, and (timestamp, position) sorted by time
+        known = previous._parsed if previous is not None else {}
+        parsed: Dict[Optional[str], Optional[datetime]] = {}
+        for r in results:
+            if r.timestamp not in parsed:  # results of one run share their timestamp
+                if r.timestamp in known:
+                    parsed[r.timestamp] = known[r.timestamp]
+                else:
+                    parsed[r.timestamp] = ReportFilter.parse_timestamp(r.timestamp)
+        self._parsed = parsed
+        self._timestamps = [parsed[r.timestamp] for r in results]
+        dated = sorted((ts, pos) for pos, ts in enumerate(self._timestamps) if ts is not None)
+        self._sorted_times = [ts for ts, _ in dated]
+        self._sorted_positions = [pos for _, pos in dated]
+
+        by_source: Dict[str, List[int]] = {}
+        for pos, r in enumerate(results):
+            if r.report_source:
+                by_source.setdefault(os.path.basename(r.report_source), []).append(pos)
+        self._sources = {name: (positions, frozenset(positions)) for name, positions in by_source.items()}
+
+    def _field_postings(self, field_name: str) -> Dict[Any, Tuple[List[int], frozenset]]:
+        """value -> (positions, position set) for one field, built on first use."""
+        postings = self._postings.get(field_name)
+        if postings is None:
+            by_value: Dict[Any, List[int]] = {}
+            for pos, r in enumerate(self.results):
+                value = getattr(r, field_name, None)
+                if value is not None:
+                    by_value.setdefault(value, []).append(pos)
+            postings = {value: (positions, frozenset(positions)) for value, positions in by_value.items()}
+            self._postings[field_name] = postings  # a racing build produces the same dict
+        return postings
+
+    def _union(self, postings: Dict[Any, Tuple[List[int], frozenset]], values) -> Tuple[int, Any, Any]:
+        """Condition matching any of values: (size, positions, membership test)."""
+        hits = [postings[v] for v in set(values) if v in postings]
+        if len(hits) == 1:
+            positions, members = hits[0]
+            return len(positions), positions, members.__contains__
+        size = sum(len(positions) for positions, _ in hits)
+        positions = [pos for p, _ in hits for pos in p]
+        return size, positions, lambda pos: any(pos in members for _, members in hits)
+
+    def _field_condition(self, field_name: str, value: str) -> Optional[Tuple[int, Any, Any]]:
+        """Condition for one filter parameter, parsed like ReportFilter (None: nothing matches)."""
+        if ',' in value:
+            values = [v.strip() for v in value.split(',')]
+        else:
+            values = [value]
+        if field_name in self.INT_FIELDS:
+            try:
+                values = [int(v) for v in values]
+            except ValueError:
+                return None
+        try:
+            return self._union(self._field_postings(field_name), values)
+        except TypeError:  # unhashable field values; cannot be matched by a query string
+            return None
+
+    def _since_condition(self, days: int) -> Tuple[int, Any, Any]:
+        """Condition for results from the last days days."""
+        cutoff = datetime.now() - timedelta(days=days)
+        start = bisect.bisect_left(self._sorted_times, cutoff)
+        timestamps = self._timestamps
+
+        def contains(pos: int) -> bool:
+            ts = timestamps[pos]
+            return ts is not None and ts >= cutoff
+
+        positions = self._sorted_positions
+        return len(positions) - start, (positions[i] for i in range(start, len(positions))), contains
+
+    def select(self, filter_params: Dict[str, Any], days: Optional[int] = None,
+               selected_files: Optional[List[str]] = None) -> List[BenchmarkResult]:
+        """Results matching all filters, as DataService.apply_filters() defines them."""
+        conditions = []
+        if selected_files:
+            conditions.append(self._union(self._sources, {os.path.basename(f) for f in selected_files}))
+        if days is not None:
+            conditions.append(self._since_condition(days))
+        for field_name, value in filter_params.items():
+            if value:
+                condition = self._field_condition(field_name, value)
+                if condition is None:
+                    return []
+                conditions.append(condition)
+
+        if not conditions:
+            return list(self.results)
+
+        conditions.sort(key=lambda condition: condition[0])
+        _, candidates, _ = conditions[0]
+        tests = [contains for _, _, contains in conditions[1:]]
+        matches = sorted({pos for pos in candidates if all(test(pos) for test in tests)})
+        results = self.results
+        return [results[pos] for pos in matches]
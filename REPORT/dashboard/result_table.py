@@ -0,0 +1,313 @@
+"""
+Columnar view of benchmark results for the aggregator.
+
+ResultTable turns a list of BenchmarkResults into NumPy columns, one field
+at a time on first use: tag fields become categorical codes (an int array
+indexing a list of distinct values), metric fields a float64 array. Row
+selection is then a boolean mask, group-by a stable argsort of codes and
+top-N an np.partition, instead of a Python scan per condition or per group.
+A table built over all results of the store serves every filtered subset of
+them (rows_of()), so columns are extracted once per load, not per request.
+
+mean(), stdev() and median() return exactly what the statistics module
+returns, without its per-value Fraction arithmetic: statistics.mean()
+rounds the exact mean, and (since Python 3.11) statistics.stdev() the
+exact standard deviation, once. Here the exact sum of a group is taken by
+adding 26-bit mantissa halves per exponent (large groups) or with repeated
+math.fsum() of the remainder (small ones), each square is split exactly
+into two floats (Dekker's product) for the sum of squares, and the final
+division and square root are done on integers, correctly rounded. Groups
+with other values (bools, huge ints, NaN) use the statistics module itself.
+So the JSON the aggregator returns does not change.
+
+Requires NumPy; BenchmarkAggregator only creates a table when it is installed.
+"""
+
+import math
+import statistics
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# statistics.stdev() is the correctly rounded root of the exact variance since 3.11
+EXACT_STDEV = sys.version_info >= (3, 11)
+
+# Magnitudes whose square splits exactly into two floats (no overflow or underflow)
+_SQUARE_RANGE = (2.0 ** -450, 2.0 ** 450)
+_SPLITTER = 2.0 ** 27 + 1
+
+# Value kinds of _moments(): 0 = not summed exactly, 1 = float, 2 = int
+_KINDS = {float: 1, int: 2}
+
+# Larger ints do not all convert to float exactly (or at all)
+_MAX_EXACT_INT = 2 ** 53
+
+# From this many values on, exact sums bucket mantissas by exponent instead of repeating math.fsum()
+_BUCKET_SUM_MIN = 1000
+
+
+class ResultTable:
+    """Benchmark results as lazily built NumPy columns."""
+
+    def __init__(self, results: Sequence[Any]):
+        self.results = results
+        self._values: Dict[str, List[Any]] = {}
+        self._present: Dict[str, np.ndarray] = {}
+        self._codes: Dict[Tuple[str, Any], Tuple[np.ndarray, List[Any]]] = {}
+        self._numeric: Dict[str, Optional[np.ndarray]] = {}
+        self._moments_cache: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._ids: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def rows_of(self, results: Sequence[Any]) -> Optional[np.ndarray]:
+        """Rows of results in this table, or None unless they are a subset of its results in table order."""
+        if self._ids is None:
+            ids = np.fromiter(map(id, self.results), dtype=np.uint64, count=len(self.results))
+            order = np.argsort(ids)
+            self._ids = (ids[order], order)
+        table_ids, order = self._ids
+        ids = np.fromiter(map(id, results), dtype=np.uint64, count=len(results))
+        found = np.minimum(np.searchsorted(table_ids, ids), max(len(table_ids) - 1, 0))
+        if len(ids) and (not len(table_ids) or np.any(table_ids[found] != ids)):
+            return None
+        rows = order[found]
+        if np.any(rows[1:] <= rows[:-1]):
+            return None
+        return rows
+
+    def values(self, field: str) -> List[Any]:
+        """The field's value in every row (None where unset or unknown)."""
+        values = self._values.get(field)
+        if values is None:
+            values = self._values[field] = [getattr(r, field, None) for r in self.results]
+        return values
+
+    def codes(self, field: str) -> Tuple[np.ndarray, List[Any]]:
+        """Categorical codes of the field's raw values, and the distinct values they index."""
+        cached = self._codes.get((field, None))
+        if cached is None:
+            cached = self._codes[(field, None)] = _categorical(self.values(field))
+        return cached
+
+    def labels(self, field: str, none_label: str) -> Tuple[np.ndarray, List[str]]:
+        """Categorical codes of str(value) per row, and the distinct labels.
+
+        A row without the field is labelled 'unknown', a None value none_label
+        (the aggregator groups None as 'unknown' but matrix axes show 'None').
+        """
+        cached = self._codes.get((field, none_label))
+        if cached is None:
+            if none_label == 'unknown':
+                keys = ['unknown' if v is None else str(v) for v in self.values(field)]
+            else:
+                missing = object()
+                keys = [str(none_label if v is None else 'unknown' if v is missing else v)
+                        for v in (getattr(r, field, missing) for r in self.results)]
+            cached = self._codes[(field, none_label)] = _categorical(keys)
+        return cached
+
+    def where(self, field: str, predicate: Callable[[Any], bool]) -> np.ndarray:
+        """Row mask of predicate(value), evaluated once per distinct value."""
+        codes, distinct = self.codes(field)
+        lookup = np.array([bool(predicate(value)) for value in distinct], dtype=bool)
+        return lookup[codes] if len(distinct) else np.zeros(len(self), dtype=bool)
+
+    def present(self, field: str) -> np.ndarray:
+        """Row mask of values that are not None."""
+        mask = self._present.get(field)
+        if mask is None:
+            values = self.values(field)
+            mask = self._present[field] = np.fromiter((v is not None for v in values), dtype=bool, count=len(values))
+        return mask
+
+    def numeric(self, field: str) -> Optional[np.ndarray]:
+        """The field as float64 (NaN for None), or None when a value is not a finite int or float."""
+        if field not in self._numeric:
+            values = self.values(field)
+            column = None
+            if all(v is None or (isinstance(v, (int, float)) and abs(v) <= 2 ** 53) for v in values):
+                column = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            self._numeric[field] = column
+        return self._numeric[field]
+
+    def select(self, rows: Optional[np.ndarray] = None, benchmark: Optional[str] = None,
+               unit_filter: Optional[str] = None, required: Sequence[str] = ()) -> np.ndarray:
+        """Rows (of rows, or of the table) of the benchmark whose unit contains unit_filter
+        and whose required fields are set, ascending."""
+        mask = np.ones(len(self), dtype=bool)
+        if benchmark:
+            mask &= self.where('benchmark', lambda value: value == benchmark)
+        if unit_filter:
+            mask &= self.where('unit', lambda value: bool(value) and unit_filter in value)
+        for field in required:
+            mask &= self.present(field)
+        return np.flatnonzero(mask) if rows is None else rows[mask[rows]]
+
+    @staticmethod
+    def group(rows: Sequence[int], codes: np.ndarray) -> List[Tuple[int, List[int]]]:
+        """(code, rows) per code among rows (ascending), in order of first appearance; rows keep their order."""
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return []
+        row_codes = codes[rows]
+        order = np.argsort(row_codes, kind='stable')
+        ordered = row_codes[order]
+        starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+        members = np.split(rows[order], starts[1:])
+        groups = [(int(ordered[start]), part.tolist()) for start, part in zip(starts, members)]
+        groups.sort(key=lambda group: group[1][0])
+        return groups
+
+    def top(self, rows: np.ndarray, field: str, top_n: int, ascending: bool) -> Optional[List[int]]:
+        """The first top_n of rows ordered by field, ties in row order (None if field is not numeric)."""
+        column = self.numeric(field)
+        if column is None:
+            return None
+        keys = column[rows] if ascending else -column[rows]
+        if 0 < top_n < len(rows):
+            # Everything up to the top_n-th smallest key, ties at the boundary included
+            kth = np.partition(keys, top_n - 1)[top_n - 1]
+            within = keys <= kth
+            rows, keys = rows[within], keys[within]
+        order = np.lexsort((rows, keys))
+        return rows[order].tolist()[:top_n]
+
+    def _moments(self, field: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(exact, is_int, x, x*x rounded, its rounding error) of the field.
+
+        exact marks the values that x holds exactly and whose squares split
+        exactly: 0 and floats or ints with a magnitude in _SQUARE_RANGE.
+        """
+        moments = self._moments_cache.get(field)
+        if moments is None:
+            values = self.values(field)
+            kinds = np.fromiter((_kind(v) for v in values), dtype=np.int8, count=len(values))
+            x = np.array([v if kind else 0.0 for v, kind in zip(values, kinds.tolist())], dtype=np.float64)
+            magnitude = np.abs(x)
+            low, high = _SQUARE_RANGE
+            exact = (kinds > 0) & ((magnitude == 0) | ((magnitude >= low) & (magnitude <= high)))
+            x[~exact] = 0.0
+            square = x * x
+            scaled = _SPLITTER * x
+            upper = scaled - (scaled - x)
+            lower = x - upper
+            error = ((upper * upper - square) + 2 * upper * lower) + lower * lower
+            moments = self._moments_cache[field] = (exact, kinds == 2, x, square, error)
+        return moments
+
+    def mean(self, field: str, rows: List[int]) -> Any:
+        """statistics.mean() of the field's values in rows."""
+        if len(rows) == 1:
+            value = self.values(field)[rows[0]]
+            if type(value) in _KINDS:
+                return value + 0  # as exact arithmetic does, -0.0 becomes 0.0
+        exact, is_int, x = self._moments(field)[:3]
+        if not exact[rows].all():
+            values = self.values(field)
+            return statistics.mean([values[i] for i in rows])
+        numerator, denominator = _exact_sum(x[rows])
+        denominator *= len(rows)
+        if is_int[rows].all() and numerator % denominator == 0:
+            return numerator // denominator  # the mean of ints stays an int when it is one
+        return numerator / denominator
+
+    def stdev(self, field: str, rows: List[int]) -> float:
+        """statistics.stdev() of the field's values in rows (at least two)."""
+        exact, _, x, square, error = self._moments(field)
+        if not (EXACT_STDEV and exact[rows].all()):
+            values = self.values(field)
+            return statistics.stdev([values[i] for i in rows])
+        n = len(rows)
+        total, total_denominator = _exact_sum(x[rows])
+        squares, squares_denominator = _exact_sum(np.concatenate((square[rows], error[rows])))
+        # ((n * squares - total**2) / n) / (n - 1), over a common denominator
+        numerator = n * squares * total_denominator ** 2 - total * total * squares_denominator
+        denominator = squares_denominator * total_denominator ** 2 * n * (n - 1)
+        return _sqrt_of_ratio(numerator, denominator)
+
+    def median(self, field: str, rows: List[int]) -> Any:
+        """statistics.median() of the field's values in rows."""
+        exact, is_int, x = self._moments(field)[:3]
+        if not exact[rows].all() or is_int[rows].any():
+            values = self.values(field)
+            return statistics.median([values[i] for i in rows])
+        # A stable sort keeps equal values (0.0, -0.0) in the order sorted() leaves them
+        ordered = np.sort(x[rows], kind='stable')
+        n = len(ordered)
+        if n % 2 == 1:
+            return float(ordered[n // 2])
+        return (float(ordered[n // 2 - 1]) + float(ordered[n // 2])) / 2
+
+
+def _kind(value: Any) -> int:
+    """_KINDS entry of a value; 0 for ints a float cannot hold exactly."""
+    kind = _KINDS.get(type(value), 0)
+    if kind == 2 and not -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT:
+        return 0
+    return kind
+
+
+def _categorical(keys: List[Any]) -> Tuple[np.ndarray, List[Any]]:
+    index: Dict[Any, int] = {}
+    codes = np.fromiter((index.setdefault(k, len(index)) for k in keys), dtype=np.int64, count=len(keys))
+    return codes, list(index)
+
+
+def _exact_sum(x: np.ndarray) -> Tuple[int, int]:
+    """Exact sum of finite floats as numerator / denominator (a power of two)."""
+    if len(x) < _BUCKET_SUM_MIN:
+        return _fsum_exact(x.tolist())
+
+    # x = m * 2**(e - 53) with integer m; the 26-bit halves of m add up exactly
+    # in float64 per exponent (up to 2**26 values)
+    mantissa, exponent = np.frexp(x)
+    m = (mantissa * 2.0 ** 53).astype(np.int64)
+    high = m >> 26
+    low = m - (high << 26)
+    e_min = int(exponent.min())
+    buckets = exponent.astype(np.int64) - e_min
+    high_sums = np.bincount(buckets, weights=high)
+    low_sums = np.bincount(buckets, weights=low)
+    numerator = 0
+    for bucket in np.flatnonzero((high_sums != 0) | (low_sums != 0)).tolist():
+        numerator += ((int(high_sums[bucket]) << 26) + int(low_sums[bucket])) << bucket
+    shift = e_min - 53
+    if shift >= 0:
+        return numerator << shift, 1
+    return numerator, 1 << -shift
+
+
+def _fsum_exact(values: List[float]) -> Tuple[int, int]:
+    """_exact_sum() of a short list: math.fsum() of what is left, until nothing is (values is extended)."""
+    numerator, denominator = 0, 1
+    while True:
+        total = math.fsum(values)
+        if total == 0:
+            return numerator, denominator
+        values.append(-total)
+        n, d = total.as_integer_ratio()
+        if d > denominator:
+            numerator *= d // denominator
+            denominator = d
+        numerator += n * (denominator // d)
+
+
+def _sqrt_of_ratio(n: int, m: int) -> float:
+    """Correctly rounded square root of n / m (n >= 0, m > 0).
+
+    Rounds the integer root to odd at two more bits than a float holds, then
+    lets the int division round it (as statistics.stdev() does since 3.11).
+    """
+    q = (n.bit_length() - m.bit_length() - 2 * sys.float_info.mant_dig - 3) // 2
+    if q >= 0:
+        return (_root_round_to_odd(n, m << 2 * q) << q) / 1
+    return _root_round_to_odd(n << -2 * q, m) / (1 << -q)
+
+
+def _root_round_to_odd(n: int, m: int) -> int:
+    root = math.isqrt(n // m)
+    return root | (root * root * m != n)
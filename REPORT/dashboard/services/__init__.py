@@ -9,10 +9,12 @@ from .data_service import DataService
 from .aggregation_service import AggregationService
 from .comparison_service import ComparisonService
 from .trend_service import TrendService
+from .query_cache import QueryCache
 
 __all__ = [
     'DataService',
     'AggregationService',
     'ComparisonService',
-    'TrendService'
+    'TrendService',
+    'QueryCache'
 ]
@@ -14,6 +14,15 @@ class AggregationService:
         """Initialize with a BenchmarkAggregator instance."""
         self.aggregator = aggregator
 
+    def aggregator_for(self, results: List):
+        """
+        Aggregator over a subset of all results (e.g. the filtered results of a request).
+
+        It shares the columnar table of the aggregator over all results, so
+        per-request aggregations do not extract columns again.
+        """
+        return self.aggregator.subset(results)
+
     def get_summary(self, filtered_results: List) -> Dict[str, Any]:
         """
         Calculate summary statistics from filtered results.
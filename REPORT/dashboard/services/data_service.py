@@ -4,10 +4,19 @@ Data service for filtering and retrieving benchmark results.
 Pure business logic with no Flask dependencies.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from flask import Request
 from ..data_loader import BenchmarkResult, ReportFilter
 
+# Query parameters read by get_filter_params_from_request()
+FILTER_PARAMS = (
+    'benchmark', 'model', 'nic', 'arch', 'protocol', 'test_type', 'cpu', 'kernel', 'rcos',
+    'topo', 'perf', 'offload', 'ipv', 'threads', 'pods_per_worker', 'scale_out_factor', 'wsize'
+)
+
+# Query parameters of a request filtered through apply_filters(): the filters, date range and report files
+RESULT_FILTER_PARAMS = FILTER_PARAMS + ('date_range_days', 'selected_files')
+
 
 class DataService:
     """Service for data filtering and retrieval operations."""
@@ -16,6 +25,14 @@ class DataService:
         """Initialize with a ReportLoader instance."""
         self.loader = loader
 
+    def get_all_results(self) -> Tuple[BenchmarkResult, ...]:
+        """All results of the loader's current store (shared; do not modify)."""
+        return self.loader.store.results
+
+    def get_version(self) -> int:
+        """Version of the loader's current store; changes with every reload."""
+        return self.loader.store.version
+
     def apply_filters(
         self,
         results: List[BenchmarkResult],
@@ -35,6 +52,17 @@ class DataService:
         Returns:
             Filtered list of benchmark results
         """
+        # The loader's results are answered from the store's index
+        store = self.loader.store
+        if results is store.results:
+            days = None
+            if date_range_days:
+                try:
+                    days = int(date_range_days)
+                except ValueError:
+                    pass  # Ignore invalid date range values
+            return store.index.select(filter_params, days, selected_files)
+
         filtered = results
 
         # Apply report file filter first if specified
@@ -69,22 +97,4 @@ class DataService:
         Returns:
             Dictionary of filter parameters
         """
-        return {
-            'benchmark': request.args.get('benchmark'),
-            'model': request.args.get('model'),
-            'nic': request.args.get('nic'),
-            'arch': request.args.get('arch'),
-            'protocol': request.args.get('protocol'),
-            'test_type': request.args.get('test_type'),
-            'cpu': request.args.get('cpu'),
-            'kernel': request.args.get('kernel'),
-            'rcos': request.args.get('rcos'),
-            'topo': request.args.get('topo'),
-            'perf': request.args.get('perf'),
-            'offload': request.args.get('offload'),
-            'ipv': request.args.get('ipv'),
-            'threads': request.args.get('threads'),
-            'pods_per_worker': request.args.get('pods_per_worker'),
-            'scale_out_factor': request.args.get('scale_out_factor'),
-            'wsize': request.args.get('wsize')
-        }
+        return {name: request.args.get(name) for name in FILTER_PARAMS}
@@ -0,0 +1,126 @@
+"""
+Query cache for serialized API responses.
+
+Pure business logic with no Flask dependencies.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+# Query parameters whose comma-separated values are a set: order and repeats do not change the response
+SET_PARAMS = frozenset({'selected_files'})
+
+
+class QueryCache:
+    """
+    Bounded LRU cache of response bodies, keyed by query signature.
+
+    Keys are built by the caller from the endpoint, the result store version
+    and signature() of the query parameters, so a reload that bumps the
+    version never serves old responses. Entries are evicted least recently
+    used first once either max_entries or max_bytes is exceeded; max_entries=0
+    disables the cache. clear() starts a new generation: a response computed
+    before it is not stored after it.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        """Initialize an empty cache with the given bounds."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._total_bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached at all."""
+        return self.max_entries > 0
+
+    @property
+    def generation(self) -> int:
+        """Number of clear() calls; pass it to put() as read before computing the response."""
+        return self._generation
+
+    @staticmethod
+    def signature(params: Iterable[Tuple[str, Iterable[str]]]) -> Tuple:
+        """
+        Canonical form of query parameters.
+
+        Args:
+            params: (name, values) pairs, e.g. from request.args.lists()
+
+        Returns:
+            Hashable tuple, the same for queries that differ only in parameter
+            order or in the order of set-valued parameters (selected_files)
+        """
+        canonical = []
+        for name, values in params:
+            values = tuple(values)
+            if name in SET_PARAMS:
+                values = tuple(tuple(sorted(set(value.split(',')))) for value in values)
+            canonical.append((name, values))
+        return tuple(sorted(canonical))
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Cached body for key, or None."""
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+            else:
+                self.stats['misses'] += 1
+        return body
+
+    def put(self, key: Hashable, body: bytes, generation: int) -> None:
+        """Store body for key unless the cache was cleared since generation was read."""
+        size = len(body)
+        with self._lock:
+            if generation != self._generation or not self.enabled:
+                return
+            if size > self.max_bytes:
+                self.stats['oversized'] += 1
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous)
+            self._entries[key] = body
+            self._total_bytes += size
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+                self.stats['evictions'] += 1
+
+    def clear(self) -> None:
+        """Drop all entries (e.g. after a reload) and start a new generation."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._generation += 1
+            self.stats['invalidations'] += 1
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            stats = self.stats.copy()
+            stats.update({
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hit_rate': self.stats['hits'] / lookups if lookups else 0.0
+            })
+        return stats
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss/eviction counters."""
+        with self._lock:
+            self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {'hits': 0, 'misses': 0, 'evictions': 0, 'oversized': 0, 'invalidations': 0}
@@ -11,6 +11,10 @@ from ..aggregator import BenchmarkAggregator
 class TrendService:
     """Service for analyzing trends over time."""
 
+    def __init__(self, aggregation_service=None):
+        """Initialize with the AggregationService whose aggregator covers all results (optional)."""
+        self.aggregation_service = aggregation_service
+
     def get_trends(
         self,
         filtered_results: List,
@@ -32,7 +36,10 @@ class TrendService:
             Each data point contains: timestamp, mean, stddev, count, label
         """
         # Create aggregator with filtered results
-        temp_aggregator = BenchmarkAggregator(filtered_results)
+        if self.aggregation_service:
+            temp_aggregator = self.aggregation_service.aggregator_for(filtered_results)
+        else:
+            temp_aggregator = BenchmarkAggregator(filtered_results)
         trends = temp_aggregator.get_trend_over_time(
             metric=metric,
             group_by=group_by,